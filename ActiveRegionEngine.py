@@ -0,0 +1,114 @@
+class ActiveRegionEngine:
+    """Game of Life engine that only re-evaluates cells near the last changes.
+
+    A cell can only change state if it or one of its neighbors changed in the previous
+    generation, so the engine keeps the set of changed cells and only evaluates them and
+    their neighbors. The cost of a generation scales with activity instead of board area.
+
+    Attributes:
+        game_logic (GameLogic): The game logic that owns this engine.
+        changed (set): The (row, col) cells that changed in the last generation.
+        full_scan (bool): Whether every cell has to be evaluated in the next generation.
+    """
+    available = True
+
+    def __init__(self, game_logic):
+        """Initialize the engine.
+
+        Args:
+            game_logic (GameLogic): The game logic that owns this engine.
+        """
+        self.game_logic = game_logic
+        self.changed = set()
+        self.full_scan = True
+        self._version = None  # the version of the grid produced by the last generation
+        self._wrap = None  # the wrap setting used by the last generation
+
+    def invalidate(self):
+        """Forget the tracked changes so the next generation evaluates every cell."""
+        self.full_scan = True
+        self.changed.clear()
+
+    def mark_changed(self, row, col):
+        """Record a cell that was edited outside of the engine.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        self.changed.add((row, col))
+
+    def candidates(self) -> set:
+        """Returns the cells that may change in the next generation.
+
+        Returns:
+            set: The changed cells and their neighbors.
+        """
+        grid_manager = self.game_logic.grid_manager
+        rows, cols = grid_manager.rows, grid_manager.cols
+        wrap = self.game_logic.wrap
+        cells = set()
+        for row, col in self.changed:
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    neighbor_row = row + dr
+                    neighbor_col = col + dc
+                    if wrap:
+                        neighbor_row %= rows
+                        neighbor_col %= cols
+                    elif not (0 <= neighbor_row < rows and 0 <= neighbor_col < cols):
+                        continue
+                    cells.add((neighbor_row, neighbor_col))
+        return cells
+
+    def step(self) -> list:
+        """Computes the next generation, evaluating only the candidate cells.
+
+        Returns:
+            list: The (row, col) cells that changed state.
+        """
+        grid_manager = self.game_logic.grid_manager
+        cells = grid_manager.cells
+        cols = grid_manager.cols
+
+        # the grid was replaced or the edges changed behind our back, so evaluate everything
+        if self.full_scan or grid_manager.version != self._version or self._wrap != self.game_logic.wrap:
+            candidates = [(row, col) for row in range(grid_manager.rows) for col in range(cols)]
+        else:
+            candidates = self.candidates()
+
+        table = self.game_logic.rule.table
+        flips = []
+        births = 0
+        for row, col in candidates:
+            state = cells[row * cols + col]
+            if table[state * 9 + self.game_logic.count_live_neighbors(row, col)] != state:
+                flips.append((row, col))
+                births += 1 - state
+
+        # apply the flips to a copy so every neighbor count above saw the old generation
+        new_cells = bytearray(cells)
+        for row, col in flips:
+            new_cells[row * cols + col] ^= 1
+
+        grid_manager.set_cells(new_cells, grid_manager.live_count + 2 * births - len(flips))
+        self._version = grid_manager.version
+        self._wrap = self.game_logic.wrap
+        self.full_scan = False
+        self.changed = set(flips)
+        return flips
+
+    def advance(self, generations=1) -> list:
+        """Advances the grid of the game logic by a number of generations.
+
+        Args:
+            generations (int): Number of generations to advance.
+
+        Returns:
+            list: The (row, col) cells whose state differs from before the call.
+        """
+        changed = set()
+        for _ in range(generations):
+            # a cell that flips twice ends up unchanged
+            changed.symmetric_difference_update(self.step())
+        return list(changed)
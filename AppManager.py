@@ -3,6 +3,9 @@ from HomeScreen import HomeScreen
 from GameScreen import GameScreen
 from SettingsScreen import SettingsScreen
 from GridManager import GridManager
+from GridStore import GridStore, STORE_FILE
+from GridFile import JSON_SLOTS_FILE
+from PatternLibrary import PatternLibrary, PATTERNS_DIRECTORY
 from Screen import Screen
 import os
 import sys
@@ -24,6 +27,8 @@ class AppManager:
         root (tk.Tk): The main window of the application.
         grid_manager (GridManager): Manages the grid state and logic.
         grid_renderer (GridRenderer): Renders the grid state.
+        grid_store (GridStore): The store of saved grids.
+        pattern_library (PatternLibrary): The pattern files listed in the settings screen.
         game_screen (GameScreen): The game screen instance.
         screens (dict): A dictionary to store all screens.
         current_screen (Screen): The current screen being displayed.
@@ -47,13 +52,20 @@ class AppManager:
         # initialize grid renderer
         self.grid_renderer = None  # updated in GameScreen
 
+        # open the saved grid store, the grids of the older save files are imported once
+        self.grid_store = GridStore(get_path(STORE_FILE))
+        self.grid_store.migrate(get_path(JSON_SLOTS_FILE))
+
+        # open the pattern library, only the files changed since it was last indexed are read
+        self.pattern_library = PatternLibrary(get_path(PATTERNS_DIRECTORY))
+
         # initialize game screen
         self.game_screen = GameScreen(self)
 
         # dictionary to store all screens
         self.screens = {
             "home": HomeScreen(self),
-            "game": GameScreen(self),
+            "game": self.game_screen,
             "settings": SettingsScreen(self),
         }
 
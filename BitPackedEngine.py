@@ -0,0 +1,231 @@
+from array import array
+
+WORD_BITS = 64  # number of cells stored in each machine word
+WORD_MASK = (1 << WORD_BITS) - 1  # mask to keep values within one word
+TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")  # cell bytes to binary digits
+FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")  # binary digits to cell bytes
+
+
+class BitPackedEngine:
+    """Game of Life engine that stores each row as packed 64-bit words.
+
+    Cell ``col`` of a row lives in bit ``col % 64`` of word ``col // 64``. A generation
+    is computed with bitwise adder logic on whole words, so every operation handles
+    64 cells at once (SIMD-within-a-register) and the board takes one bit per cell.
+    The packed board is kept between calls and only packed again when the grid was
+    replaced; cells edited on the grid are copied into their words.
+
+    Attributes:
+        game_logic (GameLogic): The game logic that owns this engine.
+        rows (int): Number of rows of the packed board.
+        cols (int): Number of columns of the packed board.
+        words (list): One ``array('Q')`` of packed words per row.
+    """
+    available = True
+
+    def __init__(self, game_logic):
+        """Initialize the engine.
+
+        Args:
+            game_logic (GameLogic): The game logic that owns this engine.
+        """
+        self.game_logic = game_logic
+        self.rows = 0
+        self.cols = 0
+        self.words = []
+        self._version = None  # the version of the grid produced by the last generation
+
+    def invalidate(self):
+        """Forget the packed board so the next generation packs the grid again."""
+        self._version = None
+
+    def mark_changed(self, row, col):
+        """Copy a cell that was edited on the grid into the packed board.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        grid_manager = self.game_logic.grid_manager
+        if grid_manager.version != self._version:
+            return  # the grid will be packed again anyway
+        bit = 1 << (col % WORD_BITS)
+        if grid_manager.get_cell(row, col) == 1:
+            self.words[row][col // WORD_BITS] |= bit
+        else:
+            self.words[row][col // WORD_BITS] &= ~bit & WORD_MASK
+
+    def sync(self):
+        """Packs the grid if it was replaced since the last generation."""
+        grid_manager = self.game_logic.grid_manager
+        if (grid_manager.version != self._version or grid_manager.rows != self.rows
+                or grid_manager.cols != self.cols):
+            self.pack(grid_manager.cells, grid_manager.rows, grid_manager.cols)
+            self._version = grid_manager.version
+
+    def pack(self, cells, rows, cols):
+        """Packs a buffer of cells into rows of 64-bit words.
+
+        Args:
+            cells (bytearray): The 0/1 cells, row by row.
+            rows (int): Number of rows of the board.
+            cols (int): Number of columns of the board.
+        """
+        self.rows = rows
+        self.cols = cols
+        word_count = (cols + WORD_BITS - 1) // WORD_BITS
+        self.words = []
+        for row in range(rows):
+            # the first column becomes the lowest bit of the row
+            digits = cells[row * cols:(row + 1) * cols].translate(TO_DIGITS)[::-1]
+            value = int(digits or b"0", 2)
+            self.words.append(array("Q", [(value >> (n * WORD_BITS)) & WORD_MASK for n in range(word_count)]))
+
+    def unpack(self) -> bytearray:
+        """Unpacks the words back into a buffer of cells.
+
+        Returns:
+            bytearray: The 0/1 cells, row by row.
+        """
+        cells = bytearray()
+        for row_words in self.words:
+            value = 0
+            for n, word in enumerate(row_words):
+                value |= word << (n * WORD_BITS)
+            digits = format(value, f"0{self.cols}b").encode()[::-1]
+            cells += digits.translate(FROM_DIGITS)
+        return cells
+
+    def shift_west(self, row_words, wrap):
+        """Moves every cell one column to the right, so each bit holds its west neighbor.
+
+        Args:
+            row_words (array): Packed words of the row.
+            wrap (bool): Whether the last column wraps around to the first.
+
+        Returns:
+            list: The shifted words.
+        """
+        last = self.cols - 1
+        carry = (row_words[last // WORD_BITS] >> (last % WORD_BITS)) & 1 if wrap else 0
+        shifted = []
+        for word in row_words:
+            shifted.append(((word << 1) & WORD_MASK) | carry)
+            carry = word >> (WORD_BITS - 1)
+        # clear the bit pushed past the last column
+        shifted[-1] &= self.last_word_mask()
+        return shifted
+
+    def shift_east(self, row_words, wrap):
+        """Moves every cell one column to the left, so each bit holds its east neighbor.
+
+        Args:
+            row_words (array): Packed words of the row.
+            wrap (bool): Whether the first column wraps around to the last.
+
+        Returns:
+            list: The shifted words.
+        """
+        shifted = [0] * len(row_words)
+        # the bit entering the last column comes from the first column when wrapping
+        carry = row_words[0] & 1 if wrap else 0
+        carry_position = (self.cols - 1) % WORD_BITS
+        for n in range(len(row_words) - 1, -1, -1):
+            word = row_words[n]
+            shifted[n] = (word >> 1) | (carry << carry_position)
+            carry = word & 1
+            carry_position = WORD_BITS - 1
+        return shifted
+
+    def last_word_mask(self) -> int:
+        """Returns the mask of the bits of the last word that hold real columns.
+
+        Returns:
+            int: The mask of the used bits.
+        """
+        used = self.cols % WORD_BITS
+        return WORD_MASK if used == 0 else (1 << used) - 1
+
+    @staticmethod
+    def count_masks(s0, s1, s2, s3, counts) -> int:
+        """Returns the bits of the cells whose neighbor count is one of the given counts.
+
+        Args:
+            s0 (int): Bit 0 of the neighbor count of each cell.
+            s1 (int): Bit 1 of the neighbor count of each cell.
+            s2 (int): Bit 2 of the neighbor count of each cell.
+            s3 (int): Bit 3 of the neighbor count of each cell.
+            counts (iterable): The neighbor counts to match.
+
+        Returns:
+            int: The matching bits.
+        """
+        matches = 0
+        for count in counts:
+            match = WORD_MASK
+            for bit, value in ((s0, count & 1), (s1, count & 2), (s2, count & 4), (s3, count & 8)):
+                match &= bit if value else ~bit
+            matches |= match
+        return matches & WORD_MASK
+
+    def step(self, wrap, rule):
+        """Computes the next generation of the packed board.
+
+        Args:
+            wrap (bool): Whether to wrap around the edges of the grid.
+            rule (Rule): The rule used to compute the next generation.
+        """
+        rows = self.rows
+        births = sorted(rule.births)
+        survivals = sorted(rule.survivals)
+        # every row seen from its west, center and east, shared by the rows above and below
+        shifted = [(self.shift_west(row_words, wrap), row_words, self.shift_east(row_words, wrap))
+                   for row_words in self.words]
+        empty = [0] * len(self.words[0])
+        dead_row = (empty, empty, empty)
+        last_mask = self.last_word_mask()
+
+        new_words = []
+        for row in range(rows):
+            if wrap:
+                above = shifted[(row - 1) % rows]
+                below = shifted[(row + 1) % rows]
+            else:
+                above = shifted[row - 1] if row > 0 else dead_row
+                below = shifted[row + 1] if row < rows - 1 else dead_row
+            west, center, east = shifted[row]
+
+            row_words = array("Q", bytes(8 * len(center)))
+            for n in range(len(center)):
+                # 4-bit counter per cell (bits s0..s3), incremented by each neighbor word
+                s0 = s1 = s2 = s3 = 0
+                for neighbor in (above[0][n], above[1][n], above[2][n], west[n], east[n],
+                                 below[0][n], below[1][n], below[2][n]):
+                    carry = s0 & neighbor
+                    s0 ^= neighbor
+                    next_carry = s1 & carry
+                    s1 ^= carry
+                    carry = s2 & next_carry
+                    s2 ^= next_carry
+                    s3 |= carry
+                # dead cells with a birth count come alive, live cells with a survival count stay alive
+                row_words[n] = ((self.count_masks(s0, s1, s2, s3, births) & ~center[n])
+                                | (self.count_masks(s0, s1, s2, s3, survivals) & center[n]))
+            row_words[-1] &= last_mask
+            new_words.append(row_words)
+        self.words = new_words
+
+    def advance(self, generations=1):
+        """Advances the grid of the game logic by a number of generations.
+
+        Args:
+            generations (int): Number of generations to advance.
+        """
+        grid_manager = self.game_logic.grid_manager
+        if grid_manager.rows == 0 or grid_manager.cols == 0:
+            return
+        self.sync()
+        for _ in range(generations):
+            self.step(self.game_logic.wrap, self.game_logic.rule)
+        grid_manager.set_cells(self.unpack())
+        self._version = grid_manager.version
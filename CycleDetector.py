@@ -0,0 +1,243 @@
+from collections import deque
+from NumpyEngine import np
+from GenerationHistory import diff_cells
+
+MASK = (1 << 64) - 1  # keeps the keys within 64 bits
+CHUNK = 1 << 16  # cells whose keys are computed at once with NumPy, small enough to stay in the cache
+
+
+def mix(value) -> int:
+    """Scrambles a 64-bit value with the SplitMix64 finalizer, the same way as ``mix_array``.
+
+    Args:
+        value (int): The value, its low 64 bits are used.
+
+    Returns:
+        int: The pseudo-random 64-bit key of the value.
+    """
+    z = ((value & MASK) + 0x9E3779B97F4A7C15) & MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+    return z ^ (z >> 31)
+
+
+def mix_array(values) -> int:
+    """Returns the XOR of the keys of an array of values, see ``mix``.
+
+    Args:
+        values (numpy.ndarray): The values, as unsigned 64-bit integers; the array is overwritten.
+
+    Returns:
+        int: The XOR of the 64-bit keys of the values.
+    """
+    # unsigned arithmetic wraps around at 2^64 like the masks of ``mix``
+    values += np.uint64(0x9E3779B97F4A7C15)
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    return int(np.bitwise_xor.reduce(values))
+
+
+class CycleDetector:
+    """Detects still lifes and oscillators with a rolling Zobrist hash of the board.
+
+    Every cell has a pseudo-random 64-bit key and the hash of a board is the XOR of the keys
+    of its live cells, so a generation only needs to XOR the keys of the cells that changed.
+    The key of a cell is its index in the grid buffer scrambled by ``mix``, so no table of
+    keys is kept and NumPy computes the keys of many cells at once. When the engine does not
+    report the cells that changed they are found by comparing the new buffer with the
+    previous one.
+    The hashes of the recent generations are kept in a bounded table; seeing a hash again
+    means the board repeats with the period between the two generations.
+
+    Attributes:
+        hash (int): The hash of the current board, or the signature of the plane of an unbounded engine.
+        generation (int): Number of generations observed since the last reset.
+        size (int): Maximum number of recent hashes kept.
+    """
+    def __init__(self, size=1024):
+        """Initialize the cycle detector.
+
+        Args:
+            size (int): Maximum number of recent hashes kept, the longest period that can be detected.
+        """
+        self.hash = 0
+        self.generation = 0
+        self.size = size
+        self._seen = {}  # generation of each recent hash
+        self._order = deque()  # recent hashes, oldest first
+        self._version = None  # the version of the grid the hash was computed for
+
+    @staticmethod
+    def hash_indices(indices) -> int:
+        """Computes the XOR of the keys of cells given by their index in a grid buffer.
+
+        Args:
+            indices (iterable): The indices of the cells, a NumPy array if NumPy is installed.
+
+        Returns:
+            int: The XOR of the keys of the cells.
+        """
+        cells_hash = 0
+        if np is None:
+            for index in indices:
+                cells_hash ^= mix(index)
+            return cells_hash
+        for start in range(0, len(indices), CHUNK):
+            cells_hash ^= mix_array(indices[start:start + CHUNK].astype(np.uint64))
+        return cells_hash
+
+    def hash_grid(self, grid_manager) -> int:
+        """Computes the hash of a whole grid.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells.
+
+        Returns:
+            int: The hash of the grid.
+        """
+        if np is None:
+            cols = grid_manager.cols
+            return self.hash_indices(row * cols + col for row, col in grid_manager.live_cells())
+        board = np.frombuffer(grid_manager.cells, dtype=np.uint8)
+        board_hash = 0
+        # a band of the board at a time, so the indices of a dense board are never all in memory
+        band = CHUNK * 16
+        for start in range(0, len(board), band):
+            board_hash ^= self.hash_indices(np.flatnonzero(board[start:start + band]) + start)
+        return board_hash
+
+    @staticmethod
+    def hash_cells(cells) -> int:
+        """Computes the hash of a set of live cells of an unbounded plane, such as the plane of the sparse engine.
+
+        Args:
+            cells (iterable): The (row, col) coordinates of the live cells.
+
+        Returns:
+            int: The hash of the cells.
+        """
+        plane_hash = 0
+        for row, col in cells:
+            plane_hash ^= mix(((row & 0xFFFFFFFF) << 32) | (col & 0xFFFFFFFF))
+        return plane_hash
+
+    def is_synced(self, grid_manager) -> bool:
+        """Checks if the hash belongs to the current grid.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells.
+
+        Returns:
+            bool: True if the grid was not replaced since it was last observed.
+        """
+        return grid_manager.version == self._version
+
+    def reset(self, grid_manager, signature=None):
+        """Hashes a grid from scratch and forgets the previous generations.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells.
+            signature (hashable): Identifies the whole plane of an unbounded engine, used
+                instead of the hash of the grid, which only shows a window of the plane.
+        """
+        self.hash = self.hash_grid(grid_manager) if signature is None else signature
+        self.generation = 0
+        self._seen.clear()
+        self._order.clear()
+        self._version = grid_manager.version
+        self.remember()
+
+    def invalidate(self):
+        """Forget the board, it is hashed again before the next generation."""
+        self._version = None
+
+    def toggle(self, grid_manager, row, col):
+        """Updates the hash for a cell edited outside of a generation.
+
+        The edit breaks the sequence of generations, so the recent hashes are forgotten.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells.
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        self.hash ^= mix(row * grid_manager.cols + col)
+        self.generation = 0
+        self._seen.clear()
+        self._order.clear()
+        self.remember()
+
+    def remember(self):
+        """Stores the current hash in the table of recent hashes."""
+        self._seen[self.hash] = self.generation
+        self._order.append(self.hash)
+        if len(self._order) > self.size:
+            oldest = self._order.popleft()
+            # the same hash may have been seen again since then
+            if self._seen.get(oldest, self.generation) <= self.generation - self.size:
+                del self._seen[oldest]
+
+    def observe(self, grid_manager, changes=None, previous=None):
+        """Hashes the next generation and checks if it repeats an earlier one.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells of the new generation.
+            changes (list): The (row, col) cells that changed, if None they are found from ``previous``.
+            previous (bytes): The cells of the previous generation, a buffer the engine replaced.
+                If None, or edited in place, and no changes are given the whole grid is hashed.
+
+        Returns:
+            int: The period of the board (1 for a still life), or None if it does not repeat.
+        """
+        cols = grid_manager.cols
+        if changes is not None:
+            for row, col in changes:
+                self.hash ^= mix(row * cols + col)
+        elif previous is not None and previous is not grid_manager.cells and len(previous) == len(grid_manager.cells):
+            if np is None:
+                flipped = diff_cells(previous, grid_manager.cells)
+            else:
+                flipped = np.flatnonzero(np.frombuffer(previous, dtype=np.uint8)
+                                         != np.frombuffer(grid_manager.cells, dtype=np.uint8))
+            self.hash ^= self.hash_indices(flipped)
+        else:
+            self.hash = self.hash_grid(grid_manager)
+        return self.repeats(grid_manager)
+
+    def observe_plane(self, grid_manager, signature):
+        """Checks if the next generation of the plane of an unbounded engine repeats an earlier one.
+
+        The window shown on the grid may repeat while the plane does not, for example
+        after a glider left it, so the whole plane is compared.
+
+        Args:
+            grid_manager (GridManager): The grid manager showing the new generation.
+            signature (hashable): Identifies the whole plane: the hash of the live cells of
+                the sparse engine, or the trimmed root node of the Hashlife engine.
+
+        Returns:
+            int: The period of the plane (1 for a still life), or None if it does not repeat.
+        """
+        self.hash = signature
+        return self.repeats(grid_manager)
+
+    def repeats(self, grid_manager) -> int:
+        """Records the hash of a new generation and checks if it was seen recently.
+
+        Args:
+            grid_manager (GridManager): The grid manager showing the new generation.
+
+        Returns:
+            int: The period of the board (1 for a still life), or None if it does not repeat.
+        """
+        self.generation += 1
+        self._version = grid_manager.version
+
+        seen = self._seen.get(self.hash)
+        self.remember()
+        if seen is None:
+            return None
+        return self.generation - seen
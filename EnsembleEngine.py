@@ -0,0 +1,155 @@
+from NumpyEngine import NumpyEngine, np
+from Rule import parse_rule
+
+
+class EnsembleEngine:
+    """Simulates many independent random boards of the same size at once.
+
+    The boards are stacked into one 3D NumPy array and advanced together by a single
+    vectorized step. Each board is hashed every generation and compared with its recent
+    hashes, so it stops being simulated as soon as it becomes static or periodic.
+
+    Attributes:
+        cells (numpy.ndarray): The boards, with shape (boards, rows, cols).
+        wrap (bool): Whether to wrap around the edges of the boards.
+        rule (Rule): The Life-like rule used to compute the next generation.
+        max_period (int): The longest period that is detected.
+        generation (int): Number of generations simulated.
+        active (numpy.ndarray): Which boards are still being simulated.
+        lifespan (numpy.ndarray): Generation at which each board first reached its final cycle, -1 if not yet.
+        period (numpy.ndarray): Period of each stopped board (1 for still lifes), 0 if not yet stopped.
+    """
+    def __init__(self, boards, rows, cols, wrap=False, rulestring="B3/S23", max_period=8, seed=None):
+        """Initialize the ensemble with empty boards.
+
+        Args:
+            boards (int): Number of boards.
+            rows (int): Number of rows of each board.
+            cols (int): Number of columns of each board.
+            wrap (bool): Whether to wrap around the edges of the boards.
+            rulestring (str): The rule in B/S notation.
+            max_period (int): The longest period that is detected.
+            seed (int): Seed of the random number generator, for reproducible studies.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if not NumpyEngine.available:
+            raise RuntimeError("The ensemble engine needs NumPy.")
+        self.cells = np.zeros((boards, rows, cols), dtype=np.uint8)
+        self.wrap = wrap
+        self.rule = parse_rule(rulestring)
+        self.max_period = max_period
+        self.generation = 0
+        self.active = np.ones(boards, dtype=bool)
+        self.lifespan = np.full(boards, -1, dtype=np.int64)
+        self.period = np.zeros(boards, dtype=np.int64)
+        self._random = np.random.default_rng(seed)
+        # random key of every cell, the hash of a board is the sum of the keys of its live cells
+        self._keys = self._random.integers(0, 2 ** 63, size=rows * cols, dtype=np.uint64)
+        self._initial_population = np.zeros(boards, dtype=np.int64)
+        self._densities = np.zeros(boards)
+        self._reset_history()
+
+    def _reset_history(self):
+        """Forgets the hashes of the previous generations."""
+        boards = len(self.cells)
+        self._hashes = np.zeros((boards, self.max_period), dtype=np.uint64)
+        self._hash_generations = np.full((boards, self.max_period), -1, dtype=np.int64)
+
+    def hash_boards(self, cells):
+        """Hashes boards by adding the keys of their live cells (wrapping around at 2^64).
+
+        Args:
+            cells (numpy.ndarray): Boards with shape (boards, rows, cols).
+
+        Returns:
+            numpy.ndarray: One 64-bit hash per board.
+        """
+        flat = cells.reshape(len(cells), -1)
+        return np.where(flat == 1, self._keys, np.uint64(0)).sum(axis=1, dtype=np.uint64)
+
+    def randomize(self, densities):
+        """Fills the boards with random soups and restarts the simulation.
+
+        Args:
+            densities (float or list): Probability of a cell being alive, for all boards or one per board.
+        """
+        boards, rows, cols = self.cells.shape
+        self._densities = np.broadcast_to(np.asarray(densities, dtype=float), (boards,)).copy()
+        self.cells = (self._random.random((boards, rows, cols)) < self._densities[:, None, None]).astype(np.uint8)
+        self._initial_population = self.cells.sum(axis=(1, 2), dtype=np.int64)
+        self.generation = 0
+        self.active[:] = True
+        self.lifespan[:] = -1
+        self.period[:] = 0
+        self._reset_history()
+        self._remember(np.arange(boards), self.hash_boards(self.cells))
+
+    def _remember(self, indices, hashes):
+        """Stores the hashes of the current generation of some boards.
+
+        Args:
+            indices (numpy.ndarray): The boards the hashes belong to.
+            hashes (numpy.ndarray): The hash of each board.
+        """
+        slot = self.generation % self.max_period
+        self._hashes[indices, slot] = hashes
+        self._hash_generations[indices, slot] = self.generation
+
+    def step(self):
+        """Advances every active board by one generation and stops those that repeat."""
+        indices = np.flatnonzero(self.active)
+        if len(indices) == 0:
+            return
+        table = np.array(self.rule.table, dtype=np.uint8)
+        cells = NumpyEngine.step(self.cells[indices], self.wrap, table)
+        self.cells[indices] = cells
+        self.generation += 1
+
+        hashes = self.hash_boards(cells)
+        known = self._hash_generations[indices] >= 0
+        matches = known & (self._hashes[indices] == hashes[:, None])
+        repeated = matches.any(axis=1)
+        if repeated.any():
+            # the most recent matching generation gives the shortest period
+            first_seen = np.where(matches, self._hash_generations[indices], -1).max(axis=1)
+            stopped = indices[repeated]
+            self.active[stopped] = False
+            self.lifespan[stopped] = first_seen[repeated]
+            self.period[stopped] = self.generation - first_seen[repeated]
+        self._remember(indices, hashes)
+
+    def run(self, max_generations) -> list:
+        """Advances the boards until all of them are static or periodic, or a generation limit.
+
+        Args:
+            max_generations (int): The largest number of generations to simulate.
+
+        Returns:
+            list: One summary dict per board, see ``summaries``.
+        """
+        while self.generation < max_generations and self.active.any():
+            self.step()
+        return self.summaries()
+
+    def summaries(self) -> list:
+        """Returns a summary of every board.
+
+        Returns:
+            list: One dict per board with the initial density and population, the final population,
+                the lifespan (generation the final cycle was reached, None if still running) and the
+                period (1 for still lifes, None if still running).
+        """
+        final_population = self.cells.sum(axis=(1, 2), dtype=np.int64)
+        summaries = []
+        for board in range(len(self.cells)):
+            stopped = not self.active[board]
+            summaries.append({
+                "initial_density": float(self._densities[board]),
+                "initial_population": int(self._initial_population[board]),
+                "final_population": int(final_population[board]),
+                "lifespan": int(self.lifespan[board]) if stopped else None,
+                "period": int(self.period[board]) if stopped else None,
+            })
+        return summaries
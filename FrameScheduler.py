@@ -0,0 +1,102 @@
+import time
+
+
+class FrameScheduler:
+    """Paces the simulation at a target rate of generations independently from the display.
+
+    The generations owed are computed from the time elapsed since the scheduler started,
+    not by counting fixed delays, so the rate does not drift by the cost of stepping and
+    rendering. Each display frame runs as many generations as are owed within a time
+    budget; a debt larger than ``max_lag`` seconds is dropped instead of being caught up.
+
+    Attributes:
+        rate (float): Target number of generations per second.
+        fps (int): Target number of displayed frames per second.
+        budget (float): Fraction of each frame that may be spent stepping.
+        max_lag (float): Largest delay, in seconds, that is caught up by running faster.
+    """
+    def __init__(self, rate=5, fps=60, budget=0.8, max_lag=0.25, clock=time.perf_counter):
+        """Initialize the scheduler.
+
+        Args:
+            rate (float): Target number of generations per second.
+            fps (int): Target number of displayed frames per second.
+            budget (float): Fraction of each frame that may be spent stepping.
+            max_lag (float): Largest delay, in seconds, that is caught up by running faster.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.rate = rate
+        self.fps = fps
+        self.budget = budget
+        self.max_lag = max_lag
+        self._clock = clock
+        self._start = clock()  # when the current schedule started
+        self._done = 0  # generations run since the schedule started
+
+    def start(self):
+        """Start a new schedule from now, nothing is owed yet."""
+        self._start = self._clock()
+        self._done = 0
+
+    def set_rate(self, rate):
+        """Change the target rate without catching up or slowing down for the old one.
+
+        Args:
+            rate (float): Target number of generations per second.
+        """
+        self.rate = rate
+        self._start = self._clock()
+        self._done = 0
+
+    def owed(self) -> int:
+        """Returns the number of generations that should have run by now but did not.
+
+        A debt larger than ``max_lag`` seconds worth of generations is forgiven.
+
+        Returns:
+            int: The number of generations to run.
+        """
+        now = self._clock()
+        owed = int((now - self._start) * self.rate) - self._done
+        if owed > max(1, self.rate * self.max_lag):
+            # too far behind to catch up, continue the schedule from now
+            self._start = now - 1 / self.rate
+            self._done = 0
+            owed = 1
+        return owed
+
+    def deadline(self) -> float:
+        """Returns the time by which the generations of this frame must stop running.
+
+        Returns:
+            float: The deadline on the clock of the scheduler.
+        """
+        return self._clock() + self.budget / self.fps
+
+    def now(self) -> float:
+        """Returns the current time on the clock of the scheduler.
+
+        Returns:
+            float: The current time in seconds.
+        """
+        return self._clock()
+
+    def advanced(self, generations):
+        """Records generations that ran.
+
+        Args:
+            generations (int): Number of generations that ran.
+        """
+        self._done += generations
+
+    def delay(self) -> int:
+        """Returns how long to wait before the next frame.
+
+        Returns:
+            int: The delay in milliseconds, at least 1.
+        """
+        frame = 1 / self.fps
+        # wait for the next generation when it is due later than the next frame
+        next_due = self._start + (self._done + 1) / self.rate
+        wait = max(frame, next_due - self._clock())
+        return max(1, round(wait * 1000))
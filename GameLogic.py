@@ -1,5 +1,13 @@
 import tkinter as tk
 from GridManager import GridManager
+from NumpyEngine import NumpyEngine
+from BitPackedEngine import BitPackedEngine
+from ActiveRegionEngine import ActiveRegionEngine
+from HashLifeEngine import HashLifeEngine
+from TiledEngine import TiledEngine
+from SparseEngine import SparseEngine
+from Rule import parse_rule
+from CycleDetector import CycleDetector
 
 
 class GameLogic:
@@ -8,6 +16,11 @@ class GameLogic:
     Attributes:
         grid_manager (GridManager): Managers the grid state and logic.
         wrap (bool): Whether to wrap around the edges of the grid.
+        rule (Rule): The Life-like rule used to compute the next generation.
+        engines (dict): The available engines, keyed by name.
+        engine (str): Name of the engine used to update the grid ("python" uses the rules below directly).
+        cycle_detector (CycleDetector): Keeps a rolling hash of the board to detect repeating generations.
+        period (int): The period the board repeats with after the last update (1 for a still life), or None.
     """
     def __init__(self, grid_manager):
         """Initialize the game logic with a grid manager.
@@ -17,6 +30,22 @@ class GameLogic:
         """
         self.grid_manager = grid_manager  # Stores the grid of cells
         self.wrap = False  # Whether to wrap around the edges of the grid
+        self.rule = parse_rule("B3/S23")  # Conway's rules by default
+
+        # Engines that can compute whole generations faster than the per-cell loop
+        self.engines = {}
+        if NumpyEngine.available:
+            self.engines["numpy"] = NumpyEngine(self)
+        self.engines["bitpacked"] = BitPackedEngine(self)
+        self.engines["active"] = ActiveRegionEngine(self)
+        self.engines["hashlife"] = HashLifeEngine(self)
+        self.engines["tiled"] = TiledEngine(self)
+        self.engines["sparse"] = SparseEngine(self)
+        # Use the fastest available engine by default
+        self.engine = "numpy" if "numpy" in self.engines else "python"
+
+        self.cycle_detector = CycleDetector()
+        self.period = None
 
     def count_live_neighbors(self, row, col) -> int:
         """Counts the number of live (1) neighbors around a given cell.
@@ -55,35 +84,215 @@ class GameLogic:
                     continue
 
             # If the neighbor is alive, count it
-            if self.grid_manager.grid[neighbor_row][neighbor_col] == 1:
+            if self.grid_manager.cells[neighbor_row * self.grid_manager.cols + neighbor_col] == 1:
                 live_count += 1
 
         return live_count
 
+    def engine_names(self) -> list:
+        """Returns the names of the engines that can be selected.
+
+        Returns:
+            list: The engine names, starting with the pure Python engine.
+        """
+        return ["python"] + list(self.engines)
+
+    def mark_changed(self, row, col):
+        """Tell the engines that keep state between generations that a cell was edited.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        self.engines["active"].mark_changed(row, col)
+        self.engines["bitpacked"].mark_changed(row, col)
+        self.engines["hashlife"].invalidate()
+        self.engines["sparse"].mark_changed(row, col)
+        if self.engine in ("hashlife", "sparse"):
+            self.cycle_detector.invalidate()  # the plane is hashed again, not the grid
+        elif self.cycle_detector.is_synced(self.grid_manager):
+            self.cycle_detector.toggle(self.grid_manager, row, col)
+
+    def invalidate(self):
+        """Tell the engines that keep state between generations that the grid was edited in an unknown way."""
+        self.engines["active"].invalidate()
+        self.engines["bitpacked"].invalidate()
+        self.engines["hashlife"].invalidate()
+        self.engines["sparse"].invalidate()
+        self.cycle_detector.invalidate()
+
+    def load_plane(self, cells=None, node=None):
+        """Replaces the board with a pattern on the unbounded plane, for patterns larger than the grid.
+
+        The pattern goes to the sparse engine if it is selected, otherwise to the Hashlife
+        engine, which becomes the selected engine. The window of the engine is moved so the
+        center of the grid shows plane cell (0, 0); the rest of the pattern is kept on the
+        plane and keeps evolving.
+
+        Args:
+            cells (iterable): The (row, col) plane coordinates of the live cells.
+            node (Node): A quadtree built by the Hashlife engine, centered on the plane, instead of cells.
+        """
+        self.invalidate()  # every engine forgets the replaced board
+        top = -(self.grid_manager.rows // 2)
+        left = -(self.grid_manager.cols // 2)
+        hashlife = self.engines["hashlife"]
+        if node is not None:
+            hashlife.load_node(node)
+            cells = None if self.engine != "sparse" else hashlife.plane_cells()
+        if self.engine == "sparse":
+            sparse = self.engines["sparse"]
+            sparse.top, sparse.left = top, left
+            sparse.load_cells(cells)
+            sparse.show()
+            return
+        self.engine = "hashlife"
+        hashlife.top, hashlife.left = top, left
+        if cells is not None:
+            hashlife.load_cells(cells)
+        hashlife.show()
+
+    def move_window(self, rows, cols):
+        """Moves the window of the sparse or Hashlife engine over the plane and shows it on the grid.
+
+        Edits made on the grid are kept in the plane first. Both engines move their window so
+        switching between them keeps the same view.
+
+        Args:
+            rows (int): Number of rows to move the window down, negative to move it up.
+            cols (int): Number of columns to move the window right, negative to move it left.
+        """
+        engine = self.engines[self.engine]
+        engine.sync()  # the grid may have been edited since the last generation
+        for plane_engine in (self.engines["sparse"], self.engines["hashlife"]):
+            plane_engine.top += rows
+            plane_engine.left += cols
+        engine.show()
+
     def update_grid(self):
-        """Applies Conway’s Game of Life rules to update the grid."""
+        """Applies Conway’s Game of Life rules to update the grid using the selected engine.
+
+        Also checks if the new generation repeats a recent one and stores the result in ``period``.
+
+        Returns:
+            list: The (row, col) cells that changed state, or None if the engine does not track changes.
+        """
+        if not self.cycle_detector.is_synced(self.grid_manager):
+            # the grid was replaced since the last generation, so hash it from scratch
+            self.cycle_detector.reset(self.grid_manager, self.plane_signature())
+        previous = self.grid_manager.cells  # the engines replace the buffer, so it keeps this generation
+        changes = self.advance(1)
+        signature = self.plane_signature()
+        if signature is None:
+            self.period = self.cycle_detector.observe(self.grid_manager, changes, previous)
+        else:
+            self.period = self.cycle_detector.observe_plane(self.grid_manager, signature)
+        return changes
+
+    def plane_signature(self):
+        """Returns what identifies the whole plane of the selected engine, if it simulates an unbounded plane.
+
+        The grid only shows a window of the plane, so the cycle detector compares the plane instead.
+
+        Returns:
+            hashable: The hash of the live cells of the sparse engine, the trimmed canonical root
+                node of the Hashlife engine, or None for the engines bounded by the grid.
+        """
+        if self.engine == "sparse":
+            sparse = self.engines["sparse"]
+            sparse.sync()
+            return self.cycle_detector.hash_cells(sparse.live)
+        if self.engine == "hashlife":
+            hashlife = self.engines["hashlife"]
+            hashlife.sync()
+            return hashlife.trimmed_root()  # equal planes are the same node once the padding is trimmed
+        return None
+
+    def advance(self, generations, engine=None):
+        """Advances the grid by a number of generations in a tight loop, without any UI callbacks.
+
+        Args:
+            generations (int): Number of generations to advance.
+            engine (str): Name of the engine to use, defaults to the selected engine.
+
+        Returns:
+            list: The (row, col) cells whose state differs from before the call,
+                or None if the engine does not track changes.
+        """
+        engine = engine or self.engine
+        if engine in self.engines:
+            return self.engines[engine].advance(generations)
+        for _ in range(generations):
+            self.update_grid_python()
+        return None
+
+    def fastest_engine(self) -> str:
+        """Returns the fastest engine that gives the same results as the selected engine.
+
+        The Hashlife and sparse engines simulate an unbounded plane, so they are kept; the
+        bounded engines all agree, so NumPy is used when it is installed.
+
+        Returns:
+            str: Name of the engine.
+        """
+        if self.engine in ("hashlife", "sparse"):
+            return self.engine
+        return "numpy" if "numpy" in self.engines else "bitpacked"
+
+    def jump(self, exponent):
+        """Advances the grid by 2^exponent generations in one call using the Hashlife engine.
+
+        Hashlife simulates an unbounded plane, so the jump ignores the wrap setting and
+        cells outside of the grid keep evolving off screen. With the sparse engine the
+        jump starts from and ends in its plane, including the cells off screen.
+
+        Args:
+            exponent (int): log2 of the number of generations to advance.
+        """
+        hashlife = self.engines["hashlife"]
+        if self.engine != "sparse":
+            hashlife.jump(exponent)
+            return
+
+        sparse = self.engines["sparse"]
+        sparse.sync()
+        hashlife.load_cells(sparse.live)
+        hashlife.step(exponent)
+        sparse.live = set(hashlife.plane_cells())
+        sparse.show()
+
+    def set_rule(self, rulestring):
+        """Selects the Life-like rule used by every engine.
+
+        Args:
+            rulestring (str): The rule in B/S notation, e.g. "B36/S23".
+
+        Raises:
+            ValueError: If the rulestring is not a valid Life-like rule.
+        """
+        self.rule = parse_rule(rulestring)
+        # cells that did not change may change under the new rule
+        self.engines["active"].invalidate()
+        # earlier generations ran under the old rule
+        self.cycle_detector.invalidate()
+
+    def update_grid_python(self):
+        """Applies the rules to update the grid one cell at a time."""
 
         # Create a new grid with all dead cells (0)
-        new_grid = [[0 for _ in range(self.grid_manager.cols)] for _ in range(self.grid_manager.rows)]
+        cols = self.grid_manager.cols
+        new_cells = bytearray(self.grid_manager.rows * cols)
+
+        table = self.rule.table
 
         # Loop through each cell in the grid
         for row in range(self.grid_manager.rows):
             for col in range(self.grid_manager.cols):
                 live_neighbors = self.count_live_neighbors(row, col)  # Count live neighbors
-                is_alive = self.grid_manager.grid[row][col] == 1  # Check if the cell is currently alive
-
-                # Apply the rules of the game
-                if is_alive:
-                    # A live cell stays alive if it has 2 or 3 neighbors
-                    if live_neighbors == 2 or live_neighbors == 3:
-                        new_grid[row][col] = 1
-                    # If not, it dies
-                    else:
-                        new_grid[row][col] = 0
-                else:
-                    # A dead cell becomes alive if it has exactly 3 neighbors
-                    if live_neighbors == 3:
-                        new_grid[row][col] = 1
+                state = self.grid_manager.cells[row * cols + col]  # The current state of the cell
+
+                # Look up the next state in the rule table
+                new_cells[row * cols + col] = table[state * 9 + live_neighbors]
 
         # Replace the old grid with the new one
-        self.grid_manager.grid = new_grid
+        self.grid_manager.set_cells(new_cells)
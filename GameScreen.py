@@ -1,11 +1,17 @@
-import json
+import sqlite3
+import time
 import tkinter as tk
 from Screen import Screen
 from GridRenderer import GridRenderer
 from GameLogic import GameLogic
-from tkinter import messagebox
+from GenerationHistory import GenerationHistory, diff_cells
+from HistoryFile import HistoryFile
+from GridFile import SavedGrid
+from FrameScheduler import FrameScheduler
+from SimulationWorker import SimulationWorker, Frame
+from Metrics import Metrics
+from tkinter import messagebox, filedialog
 import tkinter.simpledialog
-import AppManager
 
 
 class GameScreen(Screen):
@@ -18,27 +24,44 @@ class GameScreen(Screen):
         start_button (tk.Button): The button to start the simulation.
         stop_button (tk.Button): The button to stop the simulation.
         reset_button (tk.Button): The button to reset the grid.
-        speed_slider (tk.Scale): The slider to control the speed of the simulation.
+        speed_slider (tk.Scale): The slider to control the speed of the simulation, on a logarithmic scale.
         generation_label (tk.Label): The label to display the generation number.
         increase_generation_button (tk.Button): The button to increase the generation.
         decrease_generation_button (tk.Button): The button to decrease the generation.
+        jump_button (tk.Button): The button to jump ahead 2^k generations.
+        skip_button (tk.Button): The button to skip ahead N generations without rendering each one.
+        seek_button (tk.Button): The button to go to any past or future generation.
+        cycle_label (tk.Label): The label to report when the board became static or periodic.
         alive_label (tk.Label): The label to display the number of alive cells.
         dead_label (tk.Label): The label to display the number of dead cells.
         wrapping_button (tk.Button): The button to toggle wrapping.
         grid_lines_button (tk.Button): The button to toggle grid lines.
         save_button (tk.Button): The button to save the grid.
+        stats_button (tk.Button): The button to show or hide the stats overlay.
+        export_stats_button (tk.Button): The button to export the collected stats to JSON or CSV.
+        stats_label (tk.Label): The stats overlay drawn over the top left corner of the canvas.
         settings_button (tk.Button): The button to go to the settings screen.
         zoom_in_button (tk.Button): The button to zoom in on the grid.
         zoom_out_button (tk.Button): The button to zoom out on the grid.
+        pan_start (tuple): The (x, y) of the mouse when the grid was last moved with the right button.
+        PAN_STEP (int): The number of pixels the arrow keys move the grid.
         grid (list): The 2D list representing the grid.
         wrapping (bool): A flag to indicate if the grid is wrapping.
-        grid_history (list): A list to store the history of the grid.
+        grid_history (GenerationHistory): The memory-bounded history of the previous generations.
+        history_file (HistoryFile): The file every computed generation is recorded to, or None.
+        recording_error (str): Why recording stopped, until it is shown on the Tk main loop, or None.
+        generation (int): The number of the generation shown on the grid.
         grid_manager (GridManager): The grid manager to manage the grid.
         grid_renderer (GridRenderer): The grid renderer to render the grid.
         game_logic (GameLogic): The game logic to update the grid.
+        metrics (Metrics): Times the step, render and count phases while the stats are shown.
+        stats_time (float): When the stats overlay was last updated.
         running (bool): A flag to indicate if the simulation is running.
-        update_interval (int): The interval between updates in milliseconds.
-        initial_grid (list): The initial state of the grid.
+        scheduler (FrameScheduler): Paces the generations per second and the frames per second.
+        worker (SimulationWorker): Computes the generations on a background thread while running.
+        tick_job (str): The id of the pending frame of the simulation, or None.
+        SPEED_STEPS (int): The number of slider steps for every tenfold increase of the speed.
+        initial_grid (SavedGrid): The initial state of the grid, as it is saved.
     """
     def __init__(self, GoL):
         """Initialize the GameScreen.
@@ -67,6 +90,18 @@ class GameScreen(Screen):
         self.canvas.bind("<Button-1>", self.start_drag)  # start dragging
         self.canvas.bind("<B1-Motion>", self.drag_toggle_cell)  # click and drag
         self.canvas.bind("<ButtonRelease-1>", self.stop_drag)  # stop dragging
+        self.canvas.bind("<Button-3>", self.start_pan)  # start panning with the right button
+        self.canvas.bind("<B3-Motion>", self.drag_pan)  # pan while dragging
+        self.canvas.bind("<MouseWheel>", self.wheel_zoom)  # zoom with the mouse wheel
+        self.canvas.bind("<Button-4>", self.wheel_zoom)  # wheel up on Linux
+        self.canvas.bind("<Button-5>", self.wheel_zoom)  # wheel down on Linux
+        # pan with the arrow keys once the canvas has the focus
+        self.canvas.bind("<Left>", lambda event: self.pan(self.PAN_STEP, 0))
+        self.canvas.bind("<Right>", lambda event: self.pan(-self.PAN_STEP, 0))
+        self.canvas.bind("<Up>", lambda event: self.pan(0, self.PAN_STEP))
+        self.canvas.bind("<Down>", lambda event: self.pan(0, -self.PAN_STEP))
+        self.pan_start = None
+        self.PAN_STEP = 20  # pixels moved by each arrow key press
 
         # create a frame for the controls at the bottom of the screen
         bottom_controls_frame = tk.Frame(self.frame, bg="pink")
@@ -88,11 +123,16 @@ class GameScreen(Screen):
         self.reset_button = tk.Button(bottom_controls_frame, text="Reset", command=self.reset_grid, bg="pink")
         self.reset_button.grid(row=3, column=0, padx=10)
 
-        # create the speed slider
-        self.speed_slider = tk.Scale(bottom_controls_frame, from_=1, to=10, orient="horizontal", label="Speed: ",
-                                     command=self.update_speed, bg="pink", highlightthickness=1, highlightcolor="black",
-                                     troughcolor="light pink", highlightbackground="black")
-        self.speed_slider.set(5)
+        # create the speed slider, from 1 to 10000 generations per second on a logarithmic scale
+        self.SPEED_STEPS = 10  # slider steps for every tenfold increase of the speed
+        self.scheduler = FrameScheduler()
+        self.worker = SimulationWorker(self.advance_generation, self.capture_frame, self.scheduler)
+        self.tick_job = None
+        self.speed_slider = tk.Scale(bottom_controls_frame, from_=0, to=4 * self.SPEED_STEPS, orient="horizontal",
+                                     label="Speed: 5 gen/s", showvalue=False, command=self.update_speed, bg="pink",
+                                     highlightthickness=1, highlightcolor="black", troughcolor="light pink",
+                                     highlightbackground="black")
+        self.speed_slider.set(7)  # 5 generations per second
         self.speed_slider.grid(row=0, column=1, padx=10)
 
         # create a generation label
@@ -109,6 +149,24 @@ class GameScreen(Screen):
                                            command=self.previous_generation, bg="pink")
         self.decrease_generation_button.grid(row=3, column=2, padx=10)
 
+        # create a button to jump ahead 2^k generations
+        self.jump_button = tk.Button(bottom_controls_frame, text="Jump 2^k", command=self.jump_generations, bg="pink")
+        self.jump_button.grid(row=2, column=2, padx=10)
+
+        # create a button to skip ahead N generations
+        self.skip_button = tk.Button(bottom_controls_frame, text="Skip Ahead N", command=self.skip_generations,
+                                     bg="pink")
+        self.skip_button.grid(row=2, column=0, padx=10)
+
+        # create a button to go straight to a generation
+        self.seek_button = tk.Button(bottom_controls_frame, text="Go To Generation", command=self.seek_generation,
+                                     bg="pink")
+        self.seek_button.grid(row=2, column=3, padx=10)
+
+        # create a label to report still lifes and oscillators
+        self.cycle_label = tk.Label(bottom_controls_frame, text="", bg="pink")
+        self.cycle_label.grid(row=1, column=4, padx=10)
+
         # create a label for number of alive cells
         self.alive_label = tk.Label(bottom_controls_frame, text="Alive Cells: 0", bg="pink")
         self.alive_label.grid(row=2, column=1, padx=10)
@@ -131,9 +189,18 @@ class GameScreen(Screen):
         self.save_button = tk.Button(bottom_controls_frame, text="Save", command=self.save_grid, bg="pink")
         self.save_button.grid(row=0, column=4, padx=10)
 
+        # create the stats toggle button
+        self.stats_button = tk.Button(bottom_controls_frame, text="Stats: Off", command=self.toggle_stats, bg="pink")
+        self.stats_button.grid(row=3, column=3, padx=10)
+
+        # create the export stats button
+        self.export_stats_button = tk.Button(bottom_controls_frame, text="Export Stats", command=self.export_stats,
+                                             bg="pink")
+        self.export_stats_button.grid(row=2, column=4, padx=10)
+
         # create the settings button
         self.settings_button = tk.Button(top_controls_frame, text="Settings",
-                                         command=lambda: GoL.show_screen("settings"), bg="pink")
+                                         command=self.open_settings, bg="pink")
         self.settings_button.pack(side="right", padx=10)
 
         # create the zoom out button
@@ -147,7 +214,10 @@ class GameScreen(Screen):
         # Grid info
         self.grid = [[]]
         self.wrapping = False
-        self.grid_history = []
+        self.grid_history = GenerationHistory()
+        self.history_file = None
+        self.recording_error = None
+        self.generation = 0
 
         # use the grid manager from the AppManager
         self.grid_manager = GoL.grid_manager
@@ -156,6 +226,12 @@ class GameScreen(Screen):
         self.grid_renderer = GridRenderer(self.canvas, self.grid_manager)
         self.grid_renderer.render_grid()
 
+        # time the hot paths, only collected while the stats are shown
+        self.metrics = Metrics()
+        self.grid_renderer.metrics = self.metrics
+        self.stats_label = tk.Label(self.canvas, bg="pink", justify="left", font="TkFixedFont")
+        self.stats_time = 0.0
+
         # set the grid renderer in AppManager
         GoL.grid_renderer = self.grid_renderer
 
@@ -164,13 +240,12 @@ class GameScreen(Screen):
 
         # flag to check if the game is running
         self.running = False
-        self.update_interval = 1000 // self.speed_slider.get()
 
         # update the cell counts
         self.update_cell_counts()
 
         # Save the initial grid state
-        self.initial_grid = [row[:] for row in self.grid_manager.grid]
+        self.initial_grid = self.capture_grid()
 
     def start_drag(self, event):
         """Start drag operation and toggle the first cell.
@@ -178,6 +253,7 @@ class GameScreen(Screen):
         Args:
             event (tk.Event): The event object containing information about the mouse click.
         """
+        self.canvas.focus_set()  # Let the arrow keys pan the grid
         self.toggled_cells.clear()  # Clear the set of toggled cells
         self.toggle_cell(event)  # Toggle the first cell
 
@@ -188,10 +264,9 @@ class GameScreen(Screen):
             event (tk.Event): The event object containing information about the mouse movement.
         """
         # get the row and column of the cell
-        col = (event.x - self.grid_renderer.x_offset) // self.grid_manager.cell_size
-        row = (event.y - self.grid_renderer.y_offset) // self.grid_manager.cell_size
-        if (row, col) not in self.toggled_cells:  # check if the cell has already been toggled
-            self.toggled_cells.add((row, col))  # add the cell to the set of toggled cells
+        cell = self.grid_renderer.cell_at(event.x, event.y)
+        if cell is not None and cell not in self.toggled_cells:  # check if the cell has already been toggled
+            self.toggled_cells.add(cell)  # add the cell to the set of toggled cells
             self.toggle_cell(event)
 
     def stop_drag(self, event):
@@ -209,73 +284,116 @@ class GameScreen(Screen):
         Args:
             event (tk.Event): The event object containing information about the mouse click.
         """
-        # get the row and column of the cell
-        col = (event.x - self.grid_renderer.x_offset) // self.grid_manager.cell_size
-        row = (event.y - self.grid_renderer.y_offset) // self.grid_manager.cell_size
+        # get the row and column of the cell, None outside of the grid
+        cell = self.grid_renderer.cell_at(event.x, event.y)
+        if cell is None:
+            return
+        row, col = cell
 
-        # check if the row and column are within the grid bounds
-        if 0 <= row < self.grid_manager.rows and 0 <= col < self.grid_manager.cols:
+        def edit():
             # toggle the cell state
-            if self.grid_manager.grid[row][col] == 1:
-                self.grid_manager.grid[row][col] = 0
-            else:
-                self.grid_manager.grid[row][col] = 1
-
-        # update the initial grid to reflect changes
-        self.initial_grid = [row[:] for row in self.grid_manager.grid]
-
-        self.grid_renderer.render_grid()  # render the grid
-        self.update_cell_counts()  # update the cell counts
+            self.grid_manager.set_cell(row, col, 1 - self.grid_manager.get_cell(row, col))
+            self.game_logic.mark_changed(row, col)  # let the engine know the cell changed
+            # update the initial grid to reflect changes
+            self.initial_grid = self.capture_grid()
+
+        # while running the worker makes the edit between two generations and draws it in its next frame
+        self.worker.submit(edit)
+        if not self.running:
+            self.grid_renderer.render_grid()  # render the grid
+            self.update_cell_counts()  # update the cell counts
 
     def start_simulation(self):
         """Start the simulation"""
         if not self.running:  # check if the simulation is already running
             self.running = True  # set the running flag to true
+            self.worker.start()  # compute the generations on the background thread
             self.run_simulation()  # call the run_simulation function
 
     def run_simulation(self):
-        """Run the simulation"""
-        if self.running:  # check if the simulation is still running
-            self.update_grid()  # update the grid
-            # call the run_simulation function again after the update interval
-            self.GoL.root.after(self.update_interval, self.run_simulation)
+        """Draw the newest generation computed by the worker.
+
+        Called once per display frame. Frames the worker published since the last call are
+        stale and skipped, and nothing is drawn if the worker has not finished a new one.
+        """
+        self.tick_job = None
+        if not self.running:  # check if the simulation is still running
+            return
+        frame = self.worker.latest()
+        if frame is None and not self.worker.running:
+            # the worker stopped itself, wait for it to publish its last frame
+            self.worker.stop()
+            frame = self.worker.latest()
+            if frame is None:
+                self.stop_simulation()
+                return
+        if frame is not None:
+            self.refresh_view(frame)
+            self.report_recording_error()
+            if frame.error is not None:
+                # the generation failed, for example the selected rule cannot run on the selected engine
+                self.stop_simulation()
+                messagebox.showerror("Next Generation", frame.error)
+                return
+            if frame.period is not None:
+                self.stop_simulation()  # nothing new will happen
+                return
+        # call the run_simulation function again for the next frame
+        self.tick_job = self.GoL.root.after(1000 // self.scheduler.fps, self.run_simulation)
 
     def stop_simulation(self):
-        """Stop the simulation"""
-        self.running = False
+        """Stop the simulation, waits for the worker to finish the generation in progress"""
+        if self.tick_job is not None:
+            self.GoL.root.after_cancel(self.tick_job)
+            self.tick_job = None
+        if self.running:
+            self.running = False
+            self.worker.stop()
+            self.worker.discard(keep_final=False)  # the simulation is over, whatever ended it
+            self.refresh_view()  # the worker may have gone on after the last frame drawn
+
+    def open_settings(self):
+        """Stop the simulation and show the settings screen, which edits the grid and the game logic"""
+        self.stop_simulation()
+        self.GoL.show_screen("settings")
 
     def reset_grid(self):
         """Reset the grid to all dead cells"""
-        self.grid_manager.grid = [[0 for _ in range(self.grid_manager.cols)] for _ in range(self.grid_manager.rows)]
-        self.grid_renderer.render_grid()
-        self.update_cell_counts()  # update the cell counts
+        self.worker.submit(self.grid_manager.clear)
+        if not self.running:
+            self.grid_renderer.render_grid()
+            self.update_cell_counts()  # update the cell counts
 
     def update_speed(self, value):
         """Update the speed of the simulation
 
         Args:
-            value (str): The value of the speed slider.
+            value (str): The value of the speed slider, the speed is 10 ** (value / SPEED_STEPS) generations per second.
         """
-        self.update_interval = 1000 // int(value)  # update the update interval based on the speed slider value
-        if self.running:  # check if the simulation is running
-            self.stop_simulation()  # stop the simulation
-            self.start_simulation()  # start the simulation again with the new speed
+        rate = round(10 ** (int(value) / self.SPEED_STEPS))
+        # the running simulation picks up the new speed between two generations
+        self.worker.submit(lambda: self.scheduler.set_rate(rate))
+        self.speed_slider.config(label=f"Speed: {rate} gen/s")
 
     def toggle_wrapping(self):
         """Toggle the wrapping of the grid"""
         self.wrapping = not self.wrapping  # toggle the wrapping flag
-        self.game_logic.wrap = self.wrapping  # update the game logic wrapping flag
+        wrapping = self.wrapping
+
+        def edit():
+            self.game_logic.wrap = wrapping  # update the game logic wrapping flag
+            self.game_logic.cycle_detector.invalidate()  # earlier generations ran with the other edges
+
+        self.worker.submit(edit)
         if self.wrapping:
             self.wrapping_button.config(text="Wrapping: On")
         else:
             self.wrapping_button.config(text="Wrapping: Off")
-        self.grid_renderer.render_grid()  # render the grid
-        self.update_cell_counts()  # update the cell counts
 
     def toggle_grid_lines(self):
         """Toggle the visibility of grid lines."""
         self.grid_renderer.grid_lines = not self.grid_renderer.grid_lines  # Toggle the flag
-        self.grid_renderer.render_grid()  # Re-render the grid
+        self.grid_renderer.update_grid_lines()  # Show or hide the grid lines layer
 
         # Update button text
         if self.grid_renderer.grid_lines:
@@ -283,92 +401,421 @@ class GameScreen(Screen):
         else:
             self.grid_lines_button.config(text="Grid Lines: Off")
 
-    def zoom_in(self):
-        """Zoom in on the grid"""
-        self.grid_manager.cell_size += 1  # increase the cell size
-        self.adjust_offsets()  # adjust the offsets to keep the zoom centered
-        self.grid_renderer.render_grid()  # re-render the grid
+    def toggle_stats(self):
+        """Show or hide the stats overlay, the metrics are only collected while it is shown"""
+        self.metrics.enabled = not self.metrics.enabled
+        if self.metrics.enabled:
+            self.metrics.clear()
+            self.stats_button.config(text="Stats: On")
+            self.stats_label.place(x=5, y=5)
+            self.update_stats()
+        else:
+            self.stats_button.config(text="Stats: Off")
+            self.stats_label.place_forget()
+
+    def update_stats(self):
+        """Show the metrics of the last second in the stats overlay, at most a few times per second"""
+        now = time.perf_counter()
+        if now - self.stats_time < 0.25:
+            return
+        self.stats_time = now
+        summary = self.metrics.summary(window=1.0)
+        lines = []
+        for phase in Metrics.PHASES:
+            mean = summary[phase]["mean"] * 1000 if phase in summary else 0.0
+            lines.append(f"{phase.capitalize() + ':':<15}{mean:8.2f} ms")
+        for counter in Metrics.COUNTERS:
+            total = summary[counter]["total"] if counter in summary else 0
+            lines.append(f"{counter.replace('_', ' ').capitalize() + ':':<15}{total:8d}")
+        lines.append(f"{'Gen/s:':<15}{summary['gen_per_s']:8.1f}")
+        lines.append(f"{'FPS:':<15}{summary['fps']:8.1f}")
+        self.stats_label.config(text="\n".join(lines))
+
+    def export_stats(self):
+        """Export the collected metrics to a JSON or CSV file"""
+        path = filedialog.asksaveasfilename(title="Export Stats", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")])
+        if not path:
+            return  # User cancelled the dialog
+        try:
+            if path.lower().endswith(".csv"):
+                self.metrics.export_csv(path)
+            else:
+                self.metrics.export_json(path)
+        except OSError as error:
+            messagebox.showerror("Export Stats", f"Failed to export the stats: {error}")
+            return
+        messagebox.showinfo("Export Stats", f"{len(self.metrics.samples())} samples exported.")
+
+    def start_pan(self, event):
+        """Start moving the grid with the mouse.
+
+        Args:
+            event (tk.Event): The event object containing information about the mouse click.
+        """
+        self.canvas.focus_set()  # Let the arrow keys pan the grid
+        self.pan_start = (event.x, event.y)
+
+    def drag_pan(self, event):
+        """Move the grid with the mouse.
+
+        Args:
+            event (tk.Event): The event object containing information about the mouse movement.
+        """
+        if self.pan_start is None:
+            return
+        self.pan(event.x - self.pan_start[0], event.y - self.pan_start[1])
+        self.pan_start = (event.x, event.y)
 
-    def zoom_out(self):
-        """Zoom out on the grid"""
+    def pan(self, dx, dy):
+        """Move the grid on the canvas.
+
+        With the sparse and Hashlife engines the grid is a window on an unbounded plane, so
+        panning past the edge of the grid moves the window over the plane instead.
+
+        Args:
+            dx (int): Pixels to move the grid to the right, negative to the left.
+            dy (int): Pixels to move the grid down, negative up.
+        """
+        self.grid_renderer.pan(dx, dy)
+        if self.game_logic.engine not in ("hashlife", "sparse"):
+            return
+        rows, cols = self.grid_renderer.take_overflow()
+        if rows or cols:
+            with self.worker.hold():  # the simulation may be running
+                # the grid moved down and right, so the window shows the plane above and left of it
+                self.game_logic.move_window(-rows, -cols)
+                self.refresh_view()
+
+    def zoom_in(self, x=None, y=None):
+        """Zoom in on the grid
+
+        Args:
+            x (int): The x coordinate of the canvas point to zoom around, defaults to the center.
+            y (int): The y coordinate of the canvas point to zoom around, defaults to the center.
+        """
+        if self.grid_renderer.block > 1:  # check if the density view is shown
+            # fewer cells per pixel
+            self.grid_renderer.zoom(1, self.grid_renderer.block - 1, x, y)
+        else:
+            # increase the cell size
+            self.grid_renderer.zoom(self.grid_manager.cell_size + 1, 1, x, y)
+
+    def zoom_out(self, x=None, y=None):
+        """Zoom out on the grid, below one pixel per cell the density view is shown
+
+        Args:
+            x (int): The x coordinate of the canvas point to zoom around, defaults to the center.
+            y (int): The y coordinate of the canvas point to zoom around, defaults to the center.
+        """
         if self.grid_manager.cell_size > 1:  # check if the cell size is greater than 1
-            self.grid_manager.cell_size -= 1  # decrease the cell size
-            self.adjust_offsets()  # adjust the offsets to keep the zoom centered
-            self.grid_renderer.render_grid()  # re-render the grid
+            # decrease the cell size
+            self.grid_renderer.zoom(self.grid_manager.cell_size - 1, 1, x, y)
+        else:
+            # more cells per pixel
+            self.grid_renderer.zoom(1, self.grid_renderer.block + 1, x, y)
+
+    def wheel_zoom(self, event):
+        """Zoom around the mouse pointer with the mouse wheel.
+
+        Args:
+            event (tk.Event): The event object containing information about the wheel movement.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.zoom_in(event.x, event.y)
+        else:
+            self.zoom_out(event.x, event.y)
 
     def adjust_offsets(self):
         """Adjusts the offsets to keep the zoom centered"""
-        canvas_width = self.canvas.winfo_width()  # get the width of the canvas
-        canvas_height = self.canvas.winfo_height()  # get the height of the canvas
-        grid_width = self.grid_manager.cols * self.grid_manager.cell_size  # calculate the width of the grid
-        grid_height = self.grid_manager.rows * self.grid_manager.cell_size  # calculate the height of the grid
-
-        # calculate the x offset
-        self.grid_renderer.x_offset = (canvas_width - grid_width) // 2
-        # calculate the y offset
-        self.grid_renderer.y_offset = (canvas_height - grid_height) // 2
+        self.grid_renderer.center()
 
     def update_grid(self):
         """Update the grid"""
-        self.grid_history.append(self.grid_manager.grid)  # append the current grid to the history
-        self.game_logic.update_grid()  # update the grid based on the game logic
+        with self.worker.hold():
+            try:
+                self.advance_generation()
+            except ValueError as error:
+                failure = str(error)
+            else:
+                failure = None
+                self.refresh_view()
+        if failure is not None:
+            # the selected rule cannot run on the selected engine
+            self.stop_simulation()
+            messagebox.showerror("Next Generation", failure)
+        elif self.game_logic.period is not None:
+            self.stop_simulation()  # nothing new will happen
+        self.report_recording_error()
+
+    def advance_generation(self) -> bool:
+        """Compute the next generation without drawing it, on the worker thread while running.
+
+        Returns:
+            bool: False once the board is static or periodic, True otherwise.
+
+        Raises:
+            ValueError: If the selected rule cannot run on the selected engine.
+        """
+        previous_grid = self.grid_manager.snapshot()
+        start = self.metrics.start()
+        changes = self.game_logic.update_grid()  # update the grid based on the game logic
+        self.metrics.stop("step", start)
+        if self.metrics.enabled:
+            if changes is None:
+                changes = diff_cells(previous_grid, self.grid_manager.cells)  # the engine does not track them
+            self.metrics.add("cells_changed", len(changes))
+        # append the previous grid to the history
+        self.grid_history.push(self.generation, previous_grid, self.grid_manager.rows, self.grid_manager.cols)
+        self.generation += 1
+        self.record_generation()
+        return self.game_logic.period is None
+
+    def capture_frame(self) -> Frame:
+        """Copy the current generation so it can be drawn while the worker goes on.
+
+        Returns:
+            Frame: The current generation.
+        """
+        return Frame(self.generation, self.grid_manager.snapshot(), self.grid_manager.live_count,
+                     self.game_logic.period)
+
+    def refresh_view(self, frame=None):
+        """Draw a generation and update the labels
+
+        Args:
+            frame (Frame): A generation computed by the worker, by default the current state, which must
+                not be changing: the simulation is stopped or held.
+        """
+        if frame is None:
+            frame = self.capture_frame()
+        # while running draw the copy, the worker changes the grid again once it is not held
+        self.grid_renderer.frame_cells = frame.cells if self.running else None
         self.grid_renderer.render_grid()  # render the grid
-        self.update_cell_counts()  # update the cell counts
-        self.generation_label.config(text=f"Generation: {len(self.grid_history)}")
+        self.update_cell_counts(frame.live_count)  # update the cell counts
+        self.generation_label.config(text=f"Generation: {frame.generation}")
+        self.update_cycle_label(frame)
+        if self.metrics.enabled:
+            self.update_stats()
+
+    def update_cycle_label(self, frame):
+        """Report a still life or oscillator once it is reached
+
+        Args:
+            frame (Frame): The generation shown on the grid.
+        """
+        period = frame.period
+        if period is None:
+            self.cycle_label.config(text="")
+        elif period == 1:
+            self.cycle_label.config(text=f"Still life reached at generation {frame.generation - period}")
+        else:
+            self.cycle_label.config(text=f"Period {period} reached at generation {frame.generation - period}")
+
+    def skip_generations(self):
+        """Skip ahead N generations and only render the final state"""
+        generations = tkinter.simpledialog.askinteger("Skip Ahead", "Number of generations to skip ahead:",
+                                                      minvalue=1)
+        if generations is None:
+            return  # User cancelled the dialog
 
-    def update_cell_counts(self):
-        """Update the cell counts"""
-        self.alive_label.config(text=f"Alive Cells: {self.grid_manager.count_live_cells()}")
-        self.dead_label.config(text=f"Dead Cells: {self.grid_manager.count_dead_cells()}")
+        failure = None
+        with self.worker.hold():  # the simulation may be running
+            previous_grid = self.grid_manager.snapshot()
+            try:
+                self.game_logic.advance(generations)  # advance without rendering each generation
+            except ValueError as error:
+                failure = str(error)
+            else:
+                # append the previous grid to the history so the skip can be undone
+                self.grid_history.push(self.generation, previous_grid, self.grid_manager.rows,
+                                       self.grid_manager.cols)
+                self.generation += generations
+                self.refresh_view()  # draw the final state only
+                self.record_generation()
+        # the dialogs are shown once the worker is released
+        if failure is not None:
+            messagebox.showerror("Skip Ahead", failure)
+        self.report_recording_error()
+
+    def seek_generation(self):
+        """Go straight to any past or future generation and only render that state"""
+        target = tkinter.simpledialog.askinteger("Go To Generation", "Generation to go to:", minvalue=0)
+        if target is None:
+            return  # User cancelled the dialog
+
+        failure = None
+        with self.worker.hold():  # the simulation may be running
+            if target < self.generation:
+                # restore the newest recorded generation at or before the target
+                try:
+                    self.generation, rows, cols, cells = self.grid_history.rewind(target)
+                except ValueError as error:
+                    # the generation was evicted from memory, but it may be in the history file
+                    index = self.history_file.find(target) if self.history_file else None
+                    if index is None:
+                        failure = str(error)
+                        target = self.generation  # stay on the current generation
+                    else:
+                        self.grid_history.clear()
+                        self.generation = self.history_file.generation_at(index)
+                        rows, cols = self.history_file.rows, self.history_file.cols
+                        cells = self.history_file.cells_at(index)
+                if failure is None:
+                    self.grid_manager.restore(cells, rows, cols)
+
+            generations = target - self.generation
+            if generations > 0:
+                # compute the rest of the way with the fastest engine
+                previous_grid = self.grid_manager.snapshot()
+                try:
+                    self.game_logic.advance(generations, self.game_logic.fastest_engine())
+                except ValueError as error:
+                    failure = str(error)
+                else:
+                    # append the previous grid to the history so the seek can be undone
+                    self.grid_history.push(self.generation, previous_grid, self.grid_manager.rows,
+                                           self.grid_manager.cols)
+                    self.generation = target
+                    self.record_generation()
+            self.refresh_view()  # draw the final state only
+        # the dialogs are shown once the worker is released
+        if failure is not None:
+            messagebox.showerror("Go To Generation", failure)
+        self.report_recording_error()
+
+    def jump_generations(self):
+        """Jump ahead 2^k generations in one step"""
+        exponent = tkinter.simpledialog.askinteger("Jump", "Jump ahead 2^k generations, enter k (0-60):",
+                                                   minvalue=0, maxvalue=60)
+        if exponent is None:
+            return  # User cancelled the dialog
+
+        failure = None
+        with self.worker.hold():  # the simulation may be running
+            previous_grid = self.grid_manager.snapshot()
+            try:
+                self.game_logic.jump(exponent)  # jump ahead with the Hashlife engine
+            except ValueError as error:
+                failure = str(error)
+            else:
+                # append the previous grid to the history so the jump can be undone
+                self.grid_history.push(self.generation, previous_grid, self.grid_manager.rows,
+                                       self.grid_manager.cols)
+                self.generation += 2 ** exponent
+                self.refresh_view()  # draw the final state only
+                self.record_generation()
+        # the dialogs are shown once the worker is released
+        if failure is not None:
+            messagebox.showerror("Jump", failure)
+        self.report_recording_error()
+
+    def start_recording(self, path):
+        """Record the current and every computed generation to a history file.
+
+        Args:
+            path (str): Path of the history file, an existing file is overwritten.
+        """
+        self.stop_recording()
+        self.history_file = HistoryFile(path, self.grid_manager.rows, self.grid_manager.cols)
+        self.record_generation()
+        self.report_recording_error()
+
+    def stop_recording(self):
+        """Stop recording generations and close the history file"""
+        if self.history_file is not None:
+            self.history_file.close()
+            self.history_file = None
+
+    def record_generation(self):
+        """Append the current generation to the history file if recording.
+
+        Runs on the worker thread while the simulation is running, so a failure is not shown
+        here but kept in ``recording_error`` for ``report_recording_error``.
+        """
+        if self.history_file is None:
+            return
+        try:
+            self.history_file.append(self.generation, self.grid_manager.cells)
+        except (ValueError, OSError) as error:
+            # the grid was resized, the file can only hold one size, or the disk is full
+            self.stop_recording()
+            self.recording_error = f"{error} Recording has stopped."
+
+    def report_recording_error(self):
+        """Show why recording stopped, on the Tk main loop and while the worker is not held"""
+        error, self.recording_error = self.recording_error, None
+        if error is not None:
+            messagebox.showerror("Record History", error)
+
+    def update_cell_counts(self, live_count=None):
+        """Update the cell counts, the grid manager keeps them up to date so this is cheap
+
+        Args:
+            live_count (int): The number of alive cells of the generation shown, by default the grid manager's.
+        """
+        start = self.metrics.start()
+        if live_count is None:
+            live_count = self.grid_manager.count_live_cells()
+        self.alive_label.config(text=f"Alive Cells: {live_count}")
+        self.dead_label.config(text=f"Dead Cells: {self.grid_manager.rows * self.grid_manager.cols - live_count}")
+        self.metrics.stop("count", start)
 
     def previous_generation(self):
         """Go back to the previous generation"""
-        if len(self.grid_history) > 0:  # check if there are previous generations
-            self.grid_manager.grid = self.grid_history.pop()  # set the grid to the previous generation
-            self.grid_renderer.render_grid()  # render the grid
-            self.update_cell_counts()  # update the cell counts
-            self.generation_label.config(text=f"Generation: {len(self.grid_history)}")
+        with self.worker.hold():  # the simulation may be running
+            if len(self.grid_history) > 0:  # check if there are previous generations
+                # set the grid to the previous generation
+                self.generation, rows, cols, previous_grid = self.grid_history.pop()
+                self.grid_manager.restore(previous_grid, rows, cols)
+                self.refresh_view()
+
+    def capture_grid(self) -> SavedGrid:
+        """Copy the current grid with its generation and rule, as it would be saved.
+
+        Returns:
+            SavedGrid: The current grid.
+        """
+        return SavedGrid(self.grid_manager.rows, self.grid_manager.cols, self.grid_manager.snapshot(),
+                         self.generation, self.game_logic.rule.rulestring)
 
-    def save_grid(self, filename="saved_grids.json"):
-        """Save the initial state of the grid to a JSON file.
+    def restore_grid(self, saved_grid):
+        """Replace the grid with a saved grid, its generation and its rule.
 
         Args:
-            filename (str): The name of the file to save the grid to. Default is "saved_grids.json".
+            saved_grid (SavedGrid): The grid to restore.
+
+        Raises:
+            ValueError: If the rule of the saved grid is not a valid rule.
         """
-        # Load existing saved grids if the file exists
-        try:
-            with open(AppManager.get_path(filename)) as file:
-                saved_grids = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            saved_grids = []
-
-        # Prompt the user to select a save slot
-        slot = tkinter.simpledialog.askinteger("Save Grid", "Enter a slot number (1-5):", minvalue=1, maxvalue=5)
-        if slot is None:
+        self.game_logic.set_rule(saved_grid.rule)
+        self.grid_manager.restore(saved_grid.cells, saved_grid.rows, saved_grid.cols)
+        self.grid_history.clear()  # the history belongs to the replaced grid
+        self.generation = saved_grid.generation
+        self.generation_label.config(text=f"Generation: {self.generation}")
+        self.initial_grid = saved_grid
+
+    def save_grid(self):
+        """Save the initial state of the grid under a name in the saved grid store"""
+        # Prompt the user to name the grid
+        name = tkinter.simpledialog.askstring("Save Grid", "Enter a name for the grid:")
+        if name is None or not name.strip():
             return  # User cancelled the dialog
+        name = name.strip()
 
-        # Adjust the slot to be zero-indexed
-        slot -= 1
-
-        # Check if the selected slot is not empty
-        if slot < len(saved_grids) and saved_grids[slot]:
-            overwrite = messagebox.askyesno("Save Grid", f"Slot {slot + 1} "
-                                                         f"already contains a grid. Do you want to overwrite it?")
+        # Check if a grid is already saved under the name
+        if self.GoL.grid_store.find(name) is not None:
+            overwrite = messagebox.askyesno("Save Grid", f"A grid named {name} "
+                                                         f"already exists. Do you want to overwrite it?")
             if not overwrite:
                 return  # User chose not to overwrite
 
-        # Save the grid in the selected slot
-        if slot < len(saved_grids):
-            saved_grids[slot] = self.initial_grid
-        else:
-            # Add empty slots if necessary
-            while len(saved_grids) <= slot:
-                saved_grids.append([])
-            saved_grids[slot] = self.initial_grid
-
-        # Save the grids to the file
-        with open(AppManager.get_path(filename), "w") as file:
-            json.dump(saved_grids, file, indent=4)
+        # Save the grid, only its own entry is written
+        try:
+            self.GoL.grid_store.save(name, self.initial_grid)
+        except sqlite3.Error as error:
+            messagebox.showerror("Save Grid", f"Failed to save the grid: {error}")
+            return
 
         # Show a message to confirm the grid has been saved
-        messagebox.showinfo("Save Grid", f"Grid saved successfully in slot {slot + 1}.")
+        messagebox.showinfo("Save Grid", f"Grid saved successfully as {name}.")
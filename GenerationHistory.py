@@ -0,0 +1,256 @@
+from array import array
+from bisect import bisect_right
+from collections import deque
+
+
+def diff_cells(old, new) -> array:
+    """Finds the cells that differ between two buffers of the same size.
+
+    Args:
+        old (bytes): The 0/1 cells of the first state, row by row.
+        new (bytes): The 0/1 cells of the second state, row by row.
+
+    Returns:
+        array: The indices of the cells that flipped, in increasing order.
+    """
+    # XOR the whole buffers at once, the result has a 1 byte wherever a cell flipped
+    flipped = (int.from_bytes(old, "little") ^ int.from_bytes(new, "little")).to_bytes(len(new), "little")
+    indices = array("I")
+    index = flipped.find(1)
+    while index != -1:
+        indices.append(index)
+        index = flipped.find(1, index + 1)
+    return indices
+
+
+def apply_delta(cells, delta):
+    """Flips the cells of a delta in place, which moves a state forward or backward along it.
+
+    Args:
+        cells (bytearray): The 0/1 cells, row by row.
+        delta (array): The indices of the cells to flip.
+    """
+    for index in delta:
+        cells[index] ^= 1
+
+
+class HistoryEntry:
+    """One recorded generation of the history.
+
+    Attributes:
+        generation (int): The generation number of the state.
+        rows (int): Number of rows of the grid.
+        cols (int): Number of columns of the grid.
+        keyframe (bytes): The full cells of the state, or None if it is only stored as a delta.
+        delta (array): The cells that flipped since the previous entry, or None for the oldest
+            entry and after the grid was resized.
+    """
+    __slots__ = ("generation", "rows", "cols", "keyframe", "delta")
+
+    def __init__(self, generation, rows, cols, keyframe, delta):
+        """Initialize the entry.
+
+        Args:
+            generation (int): The generation number of the state.
+            rows (int): Number of rows of the grid.
+            cols (int): Number of columns of the grid.
+            keyframe (bytes): The full cells of the state, or None.
+            delta (array): The cells that flipped since the previous entry, or None.
+        """
+        self.generation = generation
+        self.rows = rows
+        self.cols = cols
+        self.keyframe = keyframe
+        self.delta = delta
+
+    def size(self) -> int:
+        """Returns the number of bytes used by the cells of the entry.
+
+        Returns:
+            int: The size of the keyframe and the delta.
+        """
+        size = 0
+        if self.keyframe is not None:
+            size += len(self.keyframe)
+        if self.delta is not None:
+            size += len(self.delta) * self.delta.itemsize
+        return size
+
+
+class GenerationHistory:
+    """Memory-bounded history of past generations stored as keyframes and deltas.
+
+    Every ``keyframe_interval`` entries the full grid is stored, in between only the
+    indices of the cells that flipped since the previous entry. A delta is an XOR, so the
+    same delta moves a state one entry forward or one entry back, and stepping back from
+    the newest entry only flips the cells that changed. When the entries use more than
+    ``memory_budget`` bytes the oldest ones are evicted. The keyframes double as checkpoints
+    for seeking: any entry is rebuilt from the nearest keyframe before it.
+
+    Attributes:
+        keyframe_interval (int): Number of entries between two full keyframes.
+        memory_budget (int): Largest number of bytes the entries may use.
+        memory_usage (int): Number of bytes used by the entries.
+    """
+    def __init__(self, keyframe_interval=64, memory_budget=64 * 1024 * 1024):
+        """Initialize an empty history.
+
+        Args:
+            keyframe_interval (int): Number of entries between two full keyframes.
+            memory_budget (int): Largest number of bytes the entries may use.
+        """
+        self.keyframe_interval = keyframe_interval
+        self.memory_budget = memory_budget
+        self.memory_usage = 0
+        self._entries = deque()
+        self._last = None  # the cells of the newest entry
+        self._since_keyframe = 0  # number of entries since the newest keyframe
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Forgets every entry."""
+        self._entries.clear()
+        self._last = None
+        self._since_keyframe = 0
+        self.memory_usage = 0
+
+    def push(self, generation, cells, rows, cols):
+        """Records the state of a generation as the newest entry.
+
+        Args:
+            generation (int): The generation number of the state.
+            cells (bytes): The 0/1 cells, row by row.
+            rows (int): Number of rows of the grid.
+            cols (int): Number of columns of the grid.
+        """
+        cells = bytes(cells)
+        newest = self._entries[-1] if self._entries else None
+        if newest is not None and (newest.rows, newest.cols) == (rows, cols):
+            delta = diff_cells(self._last, cells)
+        else:
+            delta = None  # nothing to diff against, so the entry must be a keyframe
+
+        if delta is None or self._since_keyframe + 1 >= self.keyframe_interval:
+            keyframe = cells
+            self._since_keyframe = 0
+        else:
+            keyframe = None
+            self._since_keyframe += 1
+
+        entry = HistoryEntry(generation, rows, cols, keyframe, delta)
+        self._entries.append(entry)
+        self._last = cells
+        self.memory_usage += entry.size()
+        while self.memory_usage > self.memory_budget and len(self._entries) > 1:
+            self.evict()
+
+    def pop(self) -> tuple:
+        """Removes the newest entry and returns its state.
+
+        Returns:
+            tuple: The (generation, rows, cols, cells) of the entry, cells is a bytes buffer.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        entry = self._entries.pop()
+        self.memory_usage -= entry.size()
+        state = (entry.generation, entry.rows, entry.cols, self._last)
+
+        if not self._entries:
+            self.clear()
+        elif entry.delta is not None:
+            # undo the delta to get the cells of the entry before it
+            cells = bytearray(self._last)
+            apply_delta(cells, entry.delta)
+            self._last = bytes(cells)
+        else:
+            self._last = self.cells_at(len(self._entries) - 1)
+        if self._entries:
+            self._since_keyframe = self._count_since_keyframe()
+        return state
+
+    def find(self, generation) -> int:
+        """Finds the newest entry at or before a generation.
+
+        Args:
+            generation (int): The generation to look for.
+
+        Returns:
+            int: The position of the entry, 0 is the oldest, or None if every entry is newer.
+        """
+        # generations only grow along the history, so they can be bisected
+        index = bisect_right(self._entries, generation, key=lambda entry: entry.generation) - 1
+        return index if index >= 0 else None
+
+    def rewind(self, generation) -> tuple:
+        """Removes every entry after a generation and returns the newest entry at or before it.
+
+        The returned entry is removed as well, like ``pop`` does, because it becomes the
+        current state of the grid.
+
+        Args:
+            generation (int): The generation to go back to.
+
+        Returns:
+            tuple: The (generation, rows, cols, cells) of the entry, cells is a bytes buffer.
+
+        Raises:
+            ValueError: If the generation is older than every entry.
+        """
+        index = self.find(generation)
+        if index is None:
+            raise ValueError(f"Generation {generation} is older than the oldest generation in the history.")
+        cells = self.cells_at(index)
+        while len(self._entries) > index + 1:
+            self.memory_usage -= self._entries.pop().size()
+        self._last = cells
+        return self.pop()
+
+    def evict(self):
+        """Removes the oldest entry, the entry after it becomes a keyframe if it was not one."""
+        oldest = self._entries.popleft()
+        self.memory_usage -= oldest.size()
+        if not self._entries:
+            self.clear()
+            return
+        head = self._entries[0]
+        self.memory_usage -= head.size()
+        if head.keyframe is None:
+            cells = bytearray(oldest.keyframe)
+            apply_delta(cells, head.delta)
+            head.keyframe = bytes(cells)
+        head.delta = None  # there is no earlier entry to diff against anymore
+        self.memory_usage += head.size()
+
+    def cells_at(self, index) -> bytes:
+        """Rebuilds the cells of an entry from the nearest keyframe before it.
+
+        Args:
+            index (int): The position of the entry, 0 is the oldest.
+
+        Returns:
+            bytes: The 0/1 cells, row by row.
+        """
+        start = index
+        while self._entries[start].keyframe is None:
+            start -= 1
+        cells = bytearray(self._entries[start].keyframe)
+        for position in range(start + 1, index + 1):
+            apply_delta(cells, self._entries[position].delta)
+        return bytes(cells)
+
+    def _count_since_keyframe(self) -> int:
+        """Counts the entries after the newest keyframe.
+
+        Returns:
+            int: Number of entries stored as deltas only after the newest keyframe.
+        """
+        count = 0
+        for entry in reversed(self._entries):
+            if entry.keyframe is not None:
+                break
+            count += 1
+        return count
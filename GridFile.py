@@ -0,0 +1,116 @@
+import json
+import struct
+import zlib
+from HistoryFile import pack_cells, unpack_cells
+
+HEADER = struct.Struct("<4sHIIqH")  # magic, format version, rows, cols, generation, length of the rule
+MAGIC = b"GOLB"
+VERSION = 1
+DEFAULT_RULE = "B3/S23"  # the rule of grids saved before the rule was stored
+JSON_SLOTS_FILE = "saved_grids.json"  # the save slots of the old JSON format, migrated once
+
+
+class SavedGrid:
+    """A grid as saved in the grid store.
+
+    Attributes:
+        rows (int): Number of rows of the grid.
+        cols (int): Number of columns of the grid.
+        cells (bytes): The 0/1 cells, row by row.
+        generation (int): The generation number of the grid.
+        rule (str): The rulestring the grid runs with.
+    """
+    __slots__ = ("rows", "cols", "cells", "generation", "rule")
+
+    def __init__(self, rows, cols, cells, generation=0, rule=DEFAULT_RULE):
+        """Initialize the saved grid.
+
+        Args:
+            rows (int): Number of rows of the grid.
+            cols (int): Number of columns of the grid.
+            cells (bytes): The 0/1 cells, row by row.
+            generation (int): The generation number of the grid.
+            rule (str): The rulestring the grid runs with.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.cells = cells
+        self.generation = generation
+        self.rule = rule
+
+
+def encode_grid(saved_grid) -> bytes:
+    """Encodes a grid in the binary save format.
+
+    The format is a header with the size, generation and rule of the grid, followed by the
+    cells packed one bit per cell and compressed with zlib. The grid store keeps it in the
+    data column of every saved grid.
+
+    Args:
+        saved_grid (SavedGrid): The grid to encode.
+
+    Returns:
+        bytes: The encoded grid.
+    """
+    rule = saved_grid.rule.encode("ascii")
+    header = HEADER.pack(MAGIC, VERSION, saved_grid.rows, saved_grid.cols, saved_grid.generation, len(rule))
+    return header + rule + zlib.compress(pack_cells(saved_grid.cells))
+
+
+def decode_grid(data) -> SavedGrid:
+    """Decodes a grid written by ``encode_grid``.
+
+    Args:
+        data (bytes): The encoded grid.
+
+    Returns:
+        SavedGrid: The grid, its cells are ready to be restored into a grid manager.
+
+    Raises:
+        ValueError: If the data is not a valid saved grid.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("The saved grid is truncated.")
+    magic, version, rows, cols, generation, rule_length = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("The data is not a saved grid.")
+    start = HEADER.size + rule_length
+    rule = bytes(data[HEADER.size:start]).decode("ascii")
+    try:
+        packed = zlib.decompress(data[start:])
+    except zlib.error as error:
+        raise ValueError(f"The saved grid is corrupted: {error}") from None
+    if len(packed) != (rows * cols + 7) // 8:
+        raise ValueError("The saved grid does not match its size.")
+    return SavedGrid(rows, cols, unpack_cells(packed, rows * cols), generation, rule)
+
+
+def grid_from_lists(grid) -> SavedGrid:
+    """Converts a grid of the old JSON save format.
+
+    Args:
+        grid (list): The 2D list of 0/1 cells.
+
+    Returns:
+        SavedGrid: The grid, at generation 0 with the default rule.
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+    return SavedGrid(rows, cols, bytes(cell for row in grid for cell in row))
+
+
+def read_json_slots(path) -> list:
+    """Reads the save slots of the old JSON save format.
+
+    Args:
+        path (str): Path of the JSON file.
+
+    Returns:
+        list: The 2D list of every slot, an empty list for an empty slot, or no slots if
+            there is no readable file.
+    """
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
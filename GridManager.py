@@ -1,8 +1,113 @@
+from itertools import chain
+
+
+class RowView:
+    """A row of the grid that reads and writes the cells buffer of a grid manager.
+
+    Attributes:
+        grid_manager (GridManager): The grid manager owning the cells.
+        row (int): The row index.
+    """
+    def __init__(self, grid_manager, row):
+        """Initialize the row view.
+
+        Args:
+            grid_manager (GridManager): The grid manager owning the cells.
+            row (int): The row index.
+        """
+        self.grid_manager = grid_manager
+        self.row = row
+
+    def __len__(self):
+        return self.grid_manager.cols
+
+    def _index(self, col) -> int:
+        """Checks a column index like a list would, negative indices count from the end.
+
+        Args:
+            col (int): The column index.
+
+        Returns:
+            int: The non-negative column index.
+        """
+        cols = self.grid_manager.cols
+        if col < 0:
+            col += cols
+        if not 0 <= col < cols:
+            raise IndexError("column index out of range")
+        return col
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return self.tolist()[col]
+        return self.grid_manager.get_cell(self.row, self._index(col))
+
+    def __setitem__(self, col, value):
+        self.grid_manager.set_cell(self.row, self._index(col), value)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self) -> list:
+        """Returns a copy of the row as a list.
+
+        Returns:
+            list: The 0/1 cells of the row.
+        """
+        start = self.row * self.grid_manager.cols
+        return list(self.grid_manager.cells[start:start + self.grid_manager.cols])
+
+
+class GridView:
+    """Nested-list style access to the cells buffer of a grid manager, ``grid[row][col]``.
+
+    Attributes:
+        grid_manager (GridManager): The grid manager owning the cells.
+    """
+    def __init__(self, grid_manager):
+        """Initialize the grid view.
+
+        Args:
+            grid_manager (GridManager): The grid manager owning the cells.
+        """
+        self.grid_manager = grid_manager
+
+    def __len__(self):
+        return self.grid_manager.rows
+
+    def __getitem__(self, row):
+        rows = self.grid_manager.rows
+        if isinstance(row, slice):
+            return [RowView(self.grid_manager, n) for n in range(rows)[row]]
+        if row < 0:
+            row += rows
+        if not 0 <= row < rows:
+            raise IndexError("row index out of range")
+        return RowView(self.grid_manager, row)
+
+    def __iter__(self):
+        return (RowView(self.grid_manager, row) for row in range(self.grid_manager.rows))
+
+    def tolist(self) -> list:
+        """Returns a copy of the grid as a 2D list.
+
+        Returns:
+            list: 2D list of 0/1 cells.
+        """
+        return [row.tolist() for row in self]
+
+
 class GridManager:
     """Class to manage the grid.
 
+    The cells are stored row by row in one contiguous buffer, one byte per cell, and the
+    number of live cells is kept up to date as cells change, so counts take constant time.
+
     Attributes:
-        grid (list): 2D list to store the grid.
+        cells (bytearray): The 0/1 cells, row by row.
+        live_count (int): Number of live cells in the grid.
+        version (int): Incremented every time the whole grid is replaced.
+        grid (GridView): 2D list style view of the cells, ``grid[row][col]``.
         rows (int): Number of rows in the grid.
         cols (int): Number of columns in the grid.
         cell_size (int): Size of each cell in the grid.
@@ -15,10 +120,13 @@ class GridManager:
             rows (int): Number of rows in the grid.
             cols (int): Number of columns in the grid.
         """
-        # create a 2D list to store the grid
-        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        # create a buffer to store the grid
         self.rows = rows
         self.cols = cols
+        self.cells = bytearray(rows * cols)
+        self.live_count = 0
+        self.version = 0
+        self._view = GridView(self)
         self.cell_size = 10  # default cell size
 
         self.patterns = {
@@ -49,6 +157,111 @@ class GridManager:
             ]
         }
 
+    @property
+    def grid(self) -> GridView:
+        """The cells as a 2D list style view, ``grid[row][col]``."""
+        return self._view
+
+    @grid.setter
+    def grid(self, grid):
+        """Replace the cells with a copy of a 2D list of cells, the grid takes its size."""
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows else 0
+        self.set_cells(bytearray(chain.from_iterable(grid)))
+
+    def set_cells(self, cells, live_count=None):
+        """Replace the cells with a new buffer of the same size.
+
+        Args:
+            cells (bytearray): The 0/1 cells, row by row.
+            live_count (int): Number of live cells in the buffer, counted if not given.
+        """
+        self.cells = cells
+        self.live_count = cells.count(1) if live_count is None else live_count
+        self.version += 1
+
+    def get_cell(self, row, col) -> int:
+        """Returns the state of a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            int: 1 if the cell is alive, 0 otherwise.
+        """
+        return self.cells[row * self.cols + col]
+
+    def set_cell(self, row, col, value):
+        """Sets the state of a cell and keeps the live count up to date.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): 1 for a live cell, 0 for a dead cell.
+        """
+        index = row * self.cols + col
+        self.live_count += value - self.cells[index]
+        self.cells[index] = value
+
+    def row(self, row) -> memoryview:
+        """Returns a read-only view of a row of cells, without copying it.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            memoryview: The 0/1 cells of the row.
+        """
+        return memoryview(self.cells).toreadonly()[row * self.cols:(row + 1) * self.cols]
+
+    def column(self, col) -> bytes:
+        """Returns a copy of a column of cells.
+
+        Args:
+            col (int): The column index.
+
+        Returns:
+            bytes: The 0/1 cells of the column.
+        """
+        return bytes(self.cells[col::self.cols])
+
+    def live_cells(self):
+        """Yields the coordinates of the live cells, row by row.
+
+        Yields:
+            tuple: The (row, col) of a live cell.
+        """
+        index = self.cells.find(1)
+        while index != -1:
+            yield divmod(index, self.cols)
+            index = self.cells.find(1, index + 1)
+
+    def snapshot(self) -> bytes:
+        """Returns a copy of the cells that can be restored later.
+
+        Returns:
+            bytes: The 0/1 cells, row by row.
+        """
+        return bytes(self.cells)
+
+    def restore(self, snapshot, rows=None, cols=None):
+        """Restores cells saved with ``snapshot``.
+
+        Args:
+            snapshot (bytes): The 0/1 cells, row by row.
+            rows (int): Number of rows of the snapshot, if the grid was resized since.
+            cols (int): Number of columns of the snapshot, if the grid was resized since.
+        """
+        if rows is not None and cols is not None:
+            self.rows = rows
+            self.cols = cols
+        self.set_cells(bytearray(snapshot))
+
+    def clear(self):
+        """Kill every cell of the grid."""
+        self.set_cells(bytearray(self.rows * self.cols), 0)
+
     def resize_grid(self, rows, cols):
         """Resize the grid based on user input.
 
@@ -58,7 +271,7 @@ class GridManager:
         """
         self.rows = rows
         self.cols = cols
-        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.clear()
 
     def count_live_cells(self) -> int:
         """Counts the number of live cells in the grid.
@@ -66,12 +279,7 @@ class GridManager:
         Returns:
             int: Number of live cells in the grid.
         """
-        sum_of_alive_cells = 0
-        for row in self.grid:
-            for cell in row:
-                if cell == 1:
-                    sum_of_alive_cells += 1
-        return sum_of_alive_cells
+        return self.live_count
 
     def count_dead_cells(self) -> int:
         """Counts the number of dead cells in the grid.
@@ -79,12 +287,7 @@ class GridManager:
         Returns:
             int: Number of dead cells in the grid.
         """
-        sum_of_dead_cells = 0
-        for row in self.grid:
-            for cell in row:
-                if cell == 0:
-                    sum_of_dead_cells += 1
-        return sum_of_dead_cells
+        return self.rows * self.cols - self.live_count
 
     def load_pattern(self, pattern_name):
         """Load a pattern into the grid.
@@ -107,6 +310,32 @@ class GridManager:
             for n in range(len(pattern)):
                 for m in range(len(pattern[n])):
                     if (start_row + n < self.rows) and (start_col + m < self.cols):
-                        self.grid[start_row + n][start_col + m] = pattern[n][m]
+                        self.set_cell(start_row + n, start_col + m, pattern[n][m])
         else:
             raise ValueError(f"Pattern '{pattern_name}' not found.")
+
+    def place_cells(self, cells, rows, cols):
+        """Draw a pattern given by its live cells in the center of the grid.
+
+        Args:
+            cells (iterable): The (row, col) coordinates of the live cells, from the top-left corner of the pattern.
+            rows (int): Number of rows of the pattern.
+            cols (int): Number of columns of the pattern.
+
+        Raises:
+            ValueError: If the pattern does not fit in the grid.
+        """
+        if rows > self.rows or cols > self.cols:
+            raise ValueError(f"A {cols}x{rows} pattern does not fit in the grid.")
+
+        # calculate the starting position
+        start_row = (self.rows - rows) // 2
+        start_col = (self.cols - cols) // 2
+
+        # the dead cells of the pattern are cleared too
+        for n in range(rows):
+            for m in range(cols):
+                self.set_cell(start_row + n, start_col + m, 0)
+        for n, m in cells:
+            if n < rows and m < cols:
+                self.set_cell(start_row + n, start_col + m, 1)
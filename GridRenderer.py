@@ -1,17 +1,116 @@
 import tkinter as tk
+from NumpyEngine import np
+from GenerationHistory import diff_cells
+from Metrics import Metrics
+
+BACKENDS = ("canvas", "bitmap")  # the ways the cells can be drawn
+# the largest number of rows and columns of a grid each backend draws smoothly: the canvas
+# backend creates an item per visible cell, the bitmap backend paints one image and shows
+# larger grids than the canvas in the density view
+MAX_SIZES = {"canvas": 200, "bitmap": 5000}
+RELAYOUT_DELAY = 150  # milliseconds without zooming or panning before the items are laid out again
+
+
+def ppm_image(values, rows, cols, alive_rgb, dead_rgb, maximum=1) -> bytes:
+    """Builds a binary PPM image with one pixel per value.
+
+    Each value is drawn as a blend between the dead color (0) and the alive color (``maximum``),
+    so 0/1 cells are drawn in the two colors and block populations as shades in between.
+
+    Args:
+        values (bytes): One value per pixel, row by row, between 0 and ``maximum``.
+        rows (int): Number of rows of pixels.
+        cols (int): Number of columns of pixels.
+        alive_rgb (tuple): The (red, green, blue) color of the alive cells, 0-255 each.
+        dead_rgb (tuple): The (red, green, blue) color of the dead cells, 0-255 each.
+        maximum (int): The value drawn in the alive color, at most 255.
+
+    Returns:
+        bytes: The PPM image.
+    """
+    values = bytes(values)
+    pixels = bytearray(3 * len(values))
+    for channel in range(3):
+        dead, alive = dead_rgb[channel], alive_rgb[channel]
+        # map every value to this channel in one pass
+        table = bytes(dead + (alive - dead) * min(value, maximum) // maximum for value in range(256))
+        pixels[channel::3] = values.translate(table)
+    return b"P6 %d %d 255\n" % (cols, rows) + bytes(pixels)
+
+
+def block_populations(cells, rows, cols, block, window=None) -> bytes:
+    """Measures the population of every block of cells of a window of a board.
+
+    Args:
+        cells (bytes): The cells of the board, row by row, 1 for alive and 0 for dead.
+        rows (int): Number of rows of the board.
+        cols (int): Number of columns of the board.
+        block (int): Number of cells per side of a block.
+        window (tuple): The (first row, last row + 1, first col, last col + 1) measured,
+            defaults to the whole board.
+
+    Returns:
+        bytes: One value per block, row by row, 255 for a full block and 0 for an empty one.
+    """
+    first_row, last_row, first_col, last_col = window or (0, rows, 0, cols)
+    width = -(-(last_col - first_col) // block)
+    height = -(-(last_row - first_row) // block)
+    if np is not None:
+        board = np.frombuffer(cells, dtype=np.uint8).reshape(rows, cols)
+        # pad the window with dead cells to whole blocks, then add up each block
+        padded = np.zeros((height * block, width * block), dtype=np.uint32)
+        padded[:last_row - first_row, :last_col - first_col] = board[first_row:last_row, first_col:last_col]
+        populations = padded.reshape(height, block, width, block).sum(axis=(1, 3))
+        return (populations * 255 // (block * block)).astype(np.uint8).tobytes()
+
+    populations = bytearray(width * height)
+    for y in range(height):
+        counts = [0] * width
+        for row in range(first_row + y * block, min(first_row + (y + 1) * block, last_row)):
+            start = row * cols
+            for x in range(width):
+                left = start + first_col + x * block
+                counts[x] += cells.count(1, left, min(left + block, start + last_col))
+        populations[y * width:(y + 1) * width] = bytes(count * 255 // (block * block) for count in counts)
+    return bytes(populations)
 
 
 class GridRenderer:
     """Class to render and resize the grid.
 
+    Only the cells inside the canvas (the viewport) are drawn, so the cost of a frame
+    depends on the size of the window and not on the size of the board. The viewport is
+    moved with ``pan`` and scaled with the cell size; when the board does not fit even
+    with one pixel per cell, each pixel shows the population of a ``block`` x ``block``
+    square of cells (density view).
+
+    With the "canvas" backend the canvas items of the visible cells are created once and
+    kept in a table, each generation only recolors the cells whose state changed since the
+    last render. With the "bitmap" backend the visible cells are painted into one image,
+    one pixel per cell scaled up by the cell size, so a frame costs one buffer and one
+    image update. The items are only created again when the layout changes (size of the
+    grid, cell size, viewport, colors or backend).
+
+    The grid lines are a separate layer of full-length lines above the cells, built only
+    when the geometry changes and hidden or shown when the flag is toggled.
+
+    Zooming and panning adjust the existing items in place with the canvas ``scale`` and
+    ``move`` transforms, and the items are only laid out again (culled to the new viewport,
+    with whole pixel coordinates) once the user has stopped for ``RELAYOUT_DELAY`` ms.
+
     Attributes:
         canvas (tk.Canvas): The canvas to draw on.
         grid_manager (GridManager): Manages the grid state and logic.
-        x_offset (int): The x offset to center the grid.
-        y_offset (int): The y offset to center the grid.
+        x_offset (int): The x coordinate of the left side of the grid on the canvas.
+        y_offset (int): The y coordinate of the top side of the grid on the canvas.
         grid_lines (bool): Flag to show or hide the grid lines.
         alive_cell_color (str): The color of the alive cells.
         dead_cell_color (str): The color of the dead cells.
+        backend (str): How the cells are drawn, "canvas" (one item per cell) or "bitmap" (one image).
+        block (int): Number of cells per pixel side in the density view, 1 when cells are at least a pixel.
+        metrics (Metrics): Times the renders and counts the canvas items created.
+        frame_cells (bytes): The cells to draw instead of the cells of the grid manager, set to the
+            newest frame while the simulation runs on another thread, otherwise None.
     """
     def __init__(self, canvas, grid_manager):
         """Initialize the GridRenderer.
@@ -28,6 +127,18 @@ class GridRenderer:
         self.canvas.bind("<Configure>", self.on_resize)  # bind the resize event to the on_resize function
         self.alive_cell_color = "black"  # the default color of the alive cells
         self.dead_cell_color = "white"  # the default color of the dead cells
+        self.backend = "canvas"  # the default way to draw the cells
+        self.block = 1  # cells per pixel side, more than 1 in the density view
+        self.frame_cells = None  # the newest frame of the background simulation
+        self.metrics = Metrics()  # disabled until replaced by enabled metrics
+        self._window = (0, 0, 0, 0)  # the (first row, last row + 1, first col, last col + 1) drawn
+        self._items = []  # canvas item of every visible cell, row by row
+        self._shown = []  # the visible part of every row as currently drawn
+        self._image_item = None  # canvas item showing the image of the bitmap backend
+        self._image = None  # the image shown, kept so Tk does not free it
+        self._layout = None  # everything the items depend on besides the cells
+        self._lines_geometry = None  # the geometry the grid lines were drawn for
+        self._relayout_job = None  # pending relayout after a zoom or pan
 
     def on_resize(self, event):
         """Called when the canvas is resized.
@@ -44,26 +155,317 @@ class GridRenderer:
         canvas_height = self.canvas.winfo_height()  # get the height of the canvas
         # set the cell size to the minimum of the width and height divided by the number of rows and columns
         self.grid_manager.cell_size = min(canvas_width // self.grid_manager.cols, canvas_height // self.grid_manager.rows)
-        self.x_offset = (canvas_width - self.grid_manager.cell_size * self.grid_manager.cols) // 2
-        self.y_offset = (canvas_height - self.grid_manager.cell_size * self.grid_manager.rows) // 2
+        self.block = 1
+        if self.grid_manager.cell_size < 1:
+            # the board does not fit even with one pixel per cell, so show blocks of cells per pixel
+            self.grid_manager.cell_size = 1
+            self.block = max(-(-self.grid_manager.cols // max(canvas_width, 1)),
+                             -(-self.grid_manager.rows // max(canvas_height, 1)))
+        self.center()
+
+    def pixel_size(self) -> tuple:
+        """Returns the size of the whole grid on the canvas.
+
+        Returns:
+            tuple: The (width, height) of the grid in pixels.
+        """
+        if self.block > 1:
+            return -(-self.grid_manager.cols // self.block), -(-self.grid_manager.rows // self.block)
+        return self.grid_manager.cols * self.grid_manager.cell_size, self.grid_manager.rows * self.grid_manager.cell_size
+
+    def center(self):
+        """Center the grid on the canvas"""
+        grid_width, grid_height = self.pixel_size()
+        self.x_offset = (self.canvas.winfo_width() - grid_width) // 2
+        self.y_offset = (self.canvas.winfo_height() - grid_height) // 2
+
+    def pan(self, dx, dy):
+        """Move the viewport over the grid, the items are moved in place until the panning stops.
+
+        Args:
+            dx (int): Pixels to move the grid to the right, negative to the left.
+            dy (int): Pixels to move the grid down, negative up.
+        """
+        self.x_offset += dx
+        self.y_offset += dy
+        self.canvas.move("grid_line", dx, dy)
+        self.canvas.move("grid_overlay", dx, dy)
+        self.schedule_relayout()
+
+    def take_overflow(self) -> tuple:
+        """Returns how many whole cells the grid was panned past its edges, and pans it back by as much.
+
+        The grid may be panned until it covers the canvas on one side, or until it touches the
+        side of the canvas when it is smaller; anything further is overflow.
+
+        Returns:
+            tuple: The (rows, cols) the grid was moved past its top and left edges, negative past
+                its bottom and right edges.
+        """
+        scale = self.grid_manager.cell_size / self.block  # pixels per cell
+        grid_width, grid_height = self.pixel_size()
+        overflow = []
+        for offset, size, canvas_size in ((self.y_offset, grid_height, self.canvas.winfo_height()),
+                                          (self.x_offset, grid_width, self.canvas.winfo_width())):
+            low, high = sorted((0, canvas_size - size))  # the offsets that keep the grid in place
+            excess = offset - high if offset > high else offset - low if offset < low else 0
+            overflow.append(int(excess / scale))  # whole cells only, the rest stays in the offset
+        rows, cols = overflow
+        if rows or cols:
+            self.pan(-round(cols * scale), -round(rows * scale))
+        return rows, cols
+
+    def zoom(self, cell_size, block=1, x=None, y=None):
+        """Change the scale of the grid, keeping one point of the canvas over the same cell.
+
+        With the canvas backend the items are scaled in place until the zooming stops, the
+        bitmap backend and the density view paint the visible window at the new scale.
+
+        Args:
+            cell_size (int): The new size of each cell in pixels.
+            block (int): The new number of cells per pixel side, more than 1 for the density view.
+            x (int): The x coordinate of the fixed point, defaults to the center of the canvas.
+            y (int): The y coordinate of the fixed point, defaults to the center of the canvas.
+        """
+        if x is None:
+            x = self.canvas.winfo_width() // 2
+        if y is None:
+            y = self.canvas.winfo_height() // 2
+        old_scale = self.grid_manager.cell_size / self.block  # pixels per cell
+        new_scale = cell_size / block
+        factor = new_scale / old_scale
+        self.x_offset = round(x - (x - self.x_offset) * factor)
+        self.y_offset = round(y - (y - self.y_offset) * factor)
+        scaled_items = self.backend == "canvas" and self.block == 1 and block == 1
+        self.grid_manager.cell_size = cell_size
+        self.block = block
+        if scaled_items:
+            self.canvas.scale("grid_line", x, y, factor, factor)
+            self.canvas.scale("grid_overlay", x, y, factor, factor)
+            self.schedule_relayout()
+        else:
+            self.cancel_relayout()
+            self.render_grid()
+
+    def schedule_relayout(self):
+        """Lay the items out again once no zoom or pan happened for a moment"""
+        self.cancel_relayout()
+        self._relayout_job = self.canvas.after(RELAYOUT_DELAY, self.relayout)
+
+    def cancel_relayout(self):
+        """Cancel the pending relayout"""
+        if self._relayout_job is not None:
+            self.canvas.after_cancel(self._relayout_job)
+            self._relayout_job = None
+
+    def relayout(self):
+        """Lay the items out for the current viewport"""
+        self._relayout_job = None
+        self._layout = None  # the transformed coordinates are not whole pixels anymore
+        self.render_grid()
+
+    def cell_at(self, x, y) -> tuple:
+        """Finds the cell under a point of the canvas.
+
+        Args:
+            x (int): The x coordinate on the canvas.
+            y (int): The y coordinate on the canvas.
+
+        Returns:
+            tuple: The (row, col) of the cell, or None outside of the grid and in the density view.
+        """
+        if self.block > 1:
+            return None  # a pixel covers many cells
+        col = (x - self.x_offset) // self.grid_manager.cell_size
+        row = (y - self.y_offset) // self.grid_manager.cell_size
+        if 0 <= row < self.grid_manager.rows and 0 <= col < self.grid_manager.cols:
+            return row, col
+        return None
+
+    def visible_window(self) -> tuple:
+        """Finds the cells inside the canvas.
+
+        Returns:
+            tuple: The (first row, last row + 1, first col, last col + 1) of the visible cells.
+        """
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        rows, cols = self.grid_manager.rows, self.grid_manager.cols
+        if self.block > 1:
+            # whole blocks only, one pixel each
+            first_row = max(0, -self.y_offset) * self.block
+            last_row = min(rows, max(0, height - self.y_offset) * self.block)
+            first_col = max(0, -self.x_offset) * self.block
+            last_col = min(cols, max(0, width - self.x_offset) * self.block)
+        else:
+            cell_size = self.grid_manager.cell_size
+            first_row = max(0, -self.y_offset // cell_size)
+            last_row = min(rows, -(-(height - self.y_offset) // cell_size))
+            first_col = max(0, -self.x_offset // cell_size)
+            last_col = min(cols, -(-(width - self.x_offset) // cell_size))
+        return first_row, max(first_row, last_row), first_col, max(first_col, last_col)
 
     def render_grid(self):
-        """Render the grid"""
+        """Render the visible part of the grid, only the cells that changed since the last render are redrawn"""
+        start = self.metrics.start()
+        self.draw_cells()
+        self.metrics.stop("render", start)
+
+    def draw_cells(self):
+        """Draw the cells of the visible window, the items are laid out again if the layout changed"""
+        window = self.visible_window()
+        layout = (self.grid_manager.rows, self.grid_manager.cols, self.grid_manager.cell_size, self.block,
+                  self.x_offset, self.y_offset, self.alive_cell_color, self.dead_cell_color, self.backend, window)
+        # while zooming or panning the transformed items are kept, only their colors are updated
+        transforming = (self._relayout_job is not None and self._layout is not None
+                        and (layout[:2], layout[6:9]) == (self._layout[:2], self._layout[6:9]))
+        if layout != self._layout and not transforming:
+            self.cancel_relayout()
+            self._window = window
+            self.build_items()
+            self._layout = layout
+            self.update_grid_lines()
+            return
+
+        if self._image_item is not None:
+            self.paint_bitmap()
+            return
+
+        cells = self.cells()
+        cols = self.grid_manager.cols
+        first_row, last_row, first_col, last_col = self._window
+        width = last_col - first_col
+        for n, row in enumerate(range(first_row, last_row)):
+            current = bytes(cells[row * cols + first_col:row * cols + last_col])
+            shown = self._shown[n]
+            if current == shown:
+                continue
+            for col in diff_cells(shown, current):
+                color = self.alive_cell_color if current[col] == 1 else self.dead_cell_color
+                self.canvas.itemconfig(self._items[n * width + col], fill=color)
+            self._shown[n] = current
+
+    def build_items(self):
+        """Create the canvas items of every visible cell"""
         self.canvas.delete("grid_line")  # delete the old grid lines
-        for i in range(self.grid_manager.rows):  # loop through the rows
-            for j in range(self.grid_manager.cols):  # loop through the columns
+        self._items = []
+        self._shown = []
+        self._image_item = None
+        self._image = None
+        first_row, last_row, first_col, last_col = self._window
+        if self.backend == "bitmap" or self.block > 1:
+            # one image for the bitmap backend and for the density view, which has a pixel per block
+            x0 = self.x_offset + first_col * self.grid_manager.cell_size // self.block
+            y0 = self.y_offset + first_row * self.grid_manager.cell_size // self.block
+            self._image_item = self.canvas.create_image(x0, y0, anchor="nw", tags="grid_line")
+            self.metrics.add("items_created", 1)
+            self.paint_bitmap()
+            return
+
+        cells = self.cells()
+        cols = self.grid_manager.cols
+        for i in range(first_row, last_row):  # loop through the visible rows
+            for j in range(first_col, last_col):  # loop through the visible columns
                 x0 = j * self.grid_manager.cell_size + self.x_offset  # calculate the x coordinate of the cell
                 y0 = i * self.grid_manager.cell_size + self.y_offset  # calculate the y coordinate of the cell
                 x1 = x0 + self.grid_manager.cell_size  # calculate the x coordinate of the right side of the cell
                 y1 = y0 + self.grid_manager.cell_size  # calculate the y coordinate of the bottom side of the cell
 
                 # fill the cell with the appropriate color
-                if self.grid_manager.grid[i][j] == 1:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill=self.alive_cell_color, outline="", tags="grid_line")
+                if cells[i * cols + j] == 1:
+                    color = self.alive_cell_color
                 else:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill=self.dead_cell_color, outline="", tags="grid_line")
+                    color = self.dead_cell_color
+                self._items.append(self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="",
+                                                                tags="grid_line"))
+            self._shown.append(bytes(cells[i * cols + first_col:i * cols + last_col]))
+        self.metrics.add("items_created", len(self._items))
+
+    def update_grid_lines(self):
+        """Show or hide the grid lines, they are only drawn again if the geometry changed"""
+        if not self.grid_lines or self.block > 1:
+            self.canvas.itemconfig("grid_overlay", state="hidden")
+            return
+        geometry = (self._window, self.grid_manager.cell_size, self.x_offset, self.y_offset)
+        if geometry != self._lines_geometry:
+            self.build_grid_lines()
+            self._lines_geometry = geometry
+        self.canvas.itemconfig("grid_overlay", state="normal")
+        self.canvas.tag_raise("grid_overlay")  # keep the lines above cells created since
+
+    def build_grid_lines(self):
+        """Draw one full-length line per visible row and column boundary"""
+        self.canvas.delete("grid_overlay")  # delete the old grid lines
+        first_row, last_row, first_col, last_col = self._window
+        cell_size = self.grid_manager.cell_size
+        x0 = self.x_offset + first_col * cell_size  # the left side of the visible cells
+        y0 = self.y_offset + first_row * cell_size  # the top side of the visible cells
+        x1 = self.x_offset + last_col * cell_size  # the right side of the visible cells
+        y1 = self.y_offset + last_row * cell_size  # the bottom side of the visible cells
+        for i in range(first_row, last_row + 1):
+            y = self.y_offset + i * cell_size
+            self.canvas.create_line(x0, y, x1, y, fill="gray", tags="grid_overlay")
+        for j in range(first_col, last_col + 1):
+            x = self.x_offset + j * cell_size
+            self.canvas.create_line(x, y0, x, y1, fill="gray", tags="grid_overlay")
+        self.metrics.add("items_created", last_row - first_row + last_col - first_col + 2)
+
+    def color_rgb(self, color) -> tuple:
+        """Converts a Tk color name to 8-bit RGB.
+
+        Args:
+            color (str): The color name, e.g. "black".
+
+        Returns:
+            tuple: The (red, green, blue) values, 0-255 each.
+        """
+        return tuple(value >> 8 for value in self.canvas.winfo_rgb(color))
+
+    def cells(self) -> bytes:
+        """Returns the cells to draw.
+
+        Returns:
+            bytes: The 0/1 cells of the newest frame, or of the grid manager, row by row.
+        """
+        return self.grid_manager.cells if self.frame_cells is None else self.frame_cells
+
+    def window_cells(self) -> bytes:
+        """Returns the visible cells.
+
+        Returns:
+            bytes: The 0/1 visible cells, row by row.
+        """
+        cells = self.cells()
+        cols = self.grid_manager.cols
+        first_row, last_row, first_col, last_col = self._window
+        return b"".join(cells[row * cols + first_col:row * cols + last_col] for row in range(first_row, last_row))
+
+    def block_populations(self) -> bytes:
+        """Measures the population of every visible block of the density view.
+
+        Returns:
+            bytes: One value per pixel, row by row, 255 for a full block and 0 for an empty one.
+        """
+        return block_populations(self.cells(), self.grid_manager.rows, self.grid_manager.cols, self.block,
+                                 self._window)
 
-                # draw the grid lines if the flag is set
-                if self.grid_lines:
-                    self.canvas.create_line(x0, y0, x1, y0, fill="gray", tags="grid_line")
-                    self.canvas.create_line(x0, y0, x0, y1, fill="gray", tags="grid_line")
+    def paint_bitmap(self):
+        """Paint the visible cells into the image of the bitmap backend or the density view"""
+        first_row, last_row, first_col, last_col = self._window
+        if last_row == first_row or last_col == first_col:
+            return
+        alive_rgb = self.color_rgb(self.alive_cell_color)
+        dead_rgb = self.color_rgb(self.dead_cell_color)
+        if self.block > 1:
+            data = ppm_image(self.block_populations(), -(-(last_row - first_row) // self.block),
+                             -(-(last_col - first_col) // self.block), alive_rgb, dead_rgb, maximum=255)
+        else:
+            cells = self.window_cells()
+            if cells == self._shown:
+                return  # nothing changed since the last frame
+            self._shown = cells
+            data = ppm_image(cells, last_row - first_row, last_col - first_col, alive_rgb, dead_rgb)
+        image = tk.PhotoImage(master=self.canvas, data=data, format="PPM")
+        if self.grid_manager.cell_size > 1 and self.block == 1:
+            image = image.zoom(self.grid_manager.cell_size)  # scale every pixel up to a whole cell
+        self._image = image
+        self.canvas.itemconfig(self._image_item, image=image)
@@ -0,0 +1,211 @@
+import sqlite3
+import time
+from GridFile import SavedGrid, encode_grid, decode_grid, grid_from_lists, read_json_slots
+from GridRenderer import block_populations, ppm_image
+
+STORE_FILE = "saved_grids.db"  # the saved grid store
+THUMBNAIL_SIZE = 64  # largest side of a thumbnail in pixels
+PAGE_SIZE = 20  # number of entries listed at once
+
+
+def draw_thumbnail(saved_grid, size=THUMBNAIL_SIZE) -> bytes:
+    """Draws a small preview of a grid, a pixel per block of cells shaded by its population.
+
+    Args:
+        saved_grid (SavedGrid): The grid to preview.
+        size (int): Largest side of the preview in pixels.
+
+    Returns:
+        bytes: The preview as a binary PPM image, black for a full block and white for an empty one.
+    """
+    rows, cols = saved_grid.rows, saved_grid.cols
+    block = max(1, -(-max(rows, cols) // size))
+    populations = block_populations(saved_grid.cells, rows, cols, block)
+    return ppm_image(populations, -(-rows // block), -(-cols // block), (0, 0, 0), (255, 255, 255), maximum=255)
+
+
+class GridEntry:
+    """The index entry of a saved grid, everything but the cells.
+
+    Attributes:
+        grid_id (int): The id of the saved grid in the store.
+        name (str): The name the grid was saved under.
+        rows (int): Number of rows of the grid.
+        cols (int): Number of columns of the grid.
+        population (int): Number of live cells.
+        saved (float): When the grid was saved, in seconds since the epoch.
+    """
+    __slots__ = ("grid_id", "name", "rows", "cols", "population", "saved")
+
+    def __init__(self, grid_id, name, rows, cols, population, saved):
+        """Initialize the entry.
+
+        Args:
+            grid_id (int): The id of the saved grid in the store.
+            name (str): The name the grid was saved under.
+            rows (int): Number of rows of the grid.
+            cols (int): Number of columns of the grid.
+            population (int): Number of live cells.
+            saved (float): When the grid was saved, in seconds since the epoch.
+        """
+        self.grid_id = grid_id
+        self.name = name
+        self.rows = rows
+        self.cols = cols
+        self.population = population
+        self.saved = saved
+
+
+class GridStore:
+    """SQLite store of saved grids with an index of their names, sizes and populations.
+
+    Every grid is one row: the index columns, a cached thumbnail and the grid encoded by
+    ``encode_grid``. Listing reads a page of index columns through the index on the save
+    time, so it costs the same however many grids are saved, and a grid's cells are only
+    read when it is loaded. Each save or delete is its own transaction, so a grid is never
+    half written.
+
+    Attributes:
+        path (str): Path of the database file.
+    """
+    def __init__(self, path):
+        """Opens the store, creating the database if needed.
+
+        Args:
+            path (str): Path of the database file.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            # the blobs come last, so reading the index columns does not read them
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS grids (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE,
+                    rows INTEGER NOT NULL,
+                    cols INTEGER NOT NULL,
+                    population INTEGER NOT NULL,
+                    saved REAL NOT NULL,
+                    thumbnail BLOB NOT NULL,
+                    data BLOB NOT NULL)""")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS grids_saved ON grids (saved)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM grids").fetchone()[0]
+
+    def close(self):
+        """Closes the database."""
+        self._connection.close()
+
+    def entries(self, offset=0, limit=PAGE_SIZE) -> list:
+        """Lists a page of saved grids, the most recently saved first.
+
+        Args:
+            offset (int): Number of entries to skip.
+            limit (int): Largest number of entries to list.
+
+        Returns:
+            list: The GridEntry of every grid of the page.
+        """
+        rows = self._connection.execute("SELECT id, name, rows, cols, population, saved FROM grids "
+                                        "ORDER BY saved DESC LIMIT ? OFFSET ?", (limit, offset))
+        return [GridEntry(*row) for row in rows]
+
+    def find(self, name) -> int:
+        """Finds a saved grid by name.
+
+        Args:
+            name (str): The name the grid was saved under.
+
+        Returns:
+            int: The id of the grid, or None if no grid has that name.
+        """
+        row = self._connection.execute("SELECT id FROM grids WHERE name = ?", (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def save(self, name, saved_grid, saved=None) -> int:
+        """Saves a grid, replacing the grid saved under the same name.
+
+        Args:
+            name (str): The name to save the grid under.
+            saved_grid (SavedGrid): The grid to save.
+            saved (float): When the grid was saved, by default now.
+
+        Returns:
+            int: The id of the saved grid.
+        """
+        values = (saved_grid.rows, saved_grid.cols, saved_grid.cells.count(1), time.time() if saved is None else saved,
+                  draw_thumbnail(saved_grid), encode_grid(saved_grid), name)
+        # an update then an insert rather than an upsert, which needs SQLite 3.35 or later
+        with self._connection:
+            cursor = self._connection.execute("UPDATE grids SET rows = ?, cols = ?, population = ?, saved = ?, "
+                                              "thumbnail = ?, data = ? WHERE name = ?", values)
+            if cursor.rowcount:
+                return self.find(name)  # the grid keeps its id
+            cursor = self._connection.execute("INSERT INTO grids (rows, cols, population, saved, thumbnail, data, "
+                                              "name) VALUES (?, ?, ?, ?, ?, ?, ?)", values)
+            return cursor.lastrowid
+
+    def load(self, grid_id) -> SavedGrid:
+        """Reads and decodes one saved grid.
+
+        Args:
+            grid_id (int): The id of the grid.
+
+        Returns:
+            SavedGrid: The grid.
+
+        Raises:
+            KeyError: If there is no such grid.
+            ValueError: If the saved data is corrupted.
+        """
+        row = self._connection.execute("SELECT data FROM grids WHERE id = ?", (grid_id,)).fetchone()
+        if row is None:
+            raise KeyError(grid_id)
+        return decode_grid(row[0])
+
+    def thumbnail(self, grid_id) -> bytes:
+        """Reads the cached thumbnail of a saved grid.
+
+        Args:
+            grid_id (int): The id of the grid.
+
+        Returns:
+            bytes: The thumbnail as a binary PPM image.
+
+        Raises:
+            KeyError: If there is no such grid.
+        """
+        row = self._connection.execute("SELECT thumbnail FROM grids WHERE id = ?", (grid_id,)).fetchone()
+        if row is None:
+            raise KeyError(grid_id)
+        return row[0]
+
+    def delete(self, grid_id):
+        """Deletes a saved grid.
+
+        Args:
+            grid_id (int): The id of the grid.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM grids WHERE id = ?", (grid_id,))
+
+    def migrate(self, json_path):
+        """Imports the save slots of the old JSON save file, only the first time the store is opened.
+
+        The slots become grids named "Grid 1" to "Grid N" after their slot, the file is left as it was.
+
+        Args:
+            json_path (str): Path of the JSON slots file.
+        """
+        if self._connection.execute("SELECT 1 FROM meta WHERE key = 'migrated'").fetchone():
+            return
+        slots = [grid_from_lists(grid) if grid else None for grid in read_json_slots(json_path)]
+        saved = time.time()
+        for index, saved_grid in enumerate(slots):
+            if saved_grid is not None and self.find(f"Grid {index + 1}") is None:
+                # the first slot is listed first
+                self.save(f"Grid {index + 1}", saved_grid, saved - index)
+        with self._connection:
+            self._connection.execute("INSERT INTO meta (key, value) VALUES ('migrated', '1')")
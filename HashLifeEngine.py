@@ -0,0 +1,410 @@
+class Node:
+    """A square macrocell of the Hashlife quadtree.
+
+    A node of level ``k`` covers a 2^k x 2^k square made of four level ``k - 1`` children.
+    Nodes are canonical: two equal squares are always the same object, so they can be
+    compared and hashed by identity.
+
+    Attributes:
+        level (int): The level of the node, it covers 2^level cells per side.
+        nw (Node): The north-west (top-left) child.
+        ne (Node): The north-east (top-right) child.
+        sw (Node): The south-west (bottom-left) child.
+        se (Node): The south-east (bottom-right) child.
+        population (int): Number of live cells in the node.
+    """
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population")
+
+    def __init__(self, level, nw, ne, sw, se, population):
+        """Initialize the node.
+
+        Args:
+            level (int): The level of the node.
+            nw (Node): The north-west child.
+            ne (Node): The north-east child.
+            sw (Node): The south-west child.
+            se (Node): The south-east child.
+            population (int): Number of live cells in the node.
+        """
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+OFF = Node(0, None, None, None, None, 0)  # a single dead cell
+ON = Node(0, None, None, None, None, 1)  # a single live cell
+
+
+class HashLifeEngine:
+    """Game of Life engine using Hashlife (a memoized quadtree of macrocells).
+
+    The future of every macrocell is computed once and cached, so patterns with regular
+    structure can be advanced 2^k generations in a single call. The engine simulates an
+    unbounded plane, so the wrap setting does not apply to it.
+
+    The plane is stored in ``root``, which is always centered on the point between cells
+    (-1, -1) and (0, 0). The grid shows a window of the plane: grid cell (row, col) lives
+    at plane coordinates (row + top, col + left).
+
+    Attributes:
+        game_logic (GameLogic): The game logic that owns this engine.
+        root (Node): The quadtree holding the whole plane.
+        max_nodes (int): Number of cached nodes above which the caches are collected.
+        top (int): The plane row shown in the first row of the grid.
+        left (int): The plane column shown in the first column of the grid.
+    """
+    available = True
+
+    def __init__(self, game_logic, max_nodes=500000):
+        """Initialize the engine.
+
+        Args:
+            game_logic (GameLogic): The game logic that owns this engine.
+            max_nodes (int): Number of cached nodes above which the caches are collected.
+        """
+        self.game_logic = game_logic
+        self.max_nodes = max_nodes
+        self._nodes = {}  # canonical nodes keyed by their four children
+        self._results = {}  # memoized futures keyed by (node, log2 of the generations)
+        self._zeros = [OFF]  # empty nodes by level
+        self._version = None  # the version of the grid produced by the last jump
+        self._rule = None  # the rule the memoized futures were computed with
+        self.root = self.zero(3)
+        self.top = 0
+        self.left = 0
+
+    def invalidate(self):
+        """Forget the cells kept off screen so the next jump reloads them from the grid."""
+        self._version = None
+
+    def join(self, nw, ne, sw, se) -> Node:
+        """Returns the canonical node made of four children.
+
+        Args:
+            nw (Node): The north-west child.
+            ne (Node): The north-east child.
+            sw (Node): The south-west child.
+            se (Node): The south-east child.
+
+        Returns:
+            Node: The canonical node.
+        """
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw.level + 1, nw, ne, sw, se, population)
+            self._nodes[key] = node
+        return node
+
+    def zero(self, level) -> Node:
+        """Returns the empty node of a level.
+
+        Args:
+            level (int): The level of the node.
+
+        Returns:
+            Node: The empty node.
+        """
+        while len(self._zeros) <= level:
+            child = self._zeros[-1]
+            self._zeros.append(self.join(child, child, child, child))
+        return self._zeros[level]
+
+    def centre(self, node) -> Node:
+        """Returns a node one level up with the given node in its center.
+
+        Args:
+            node (Node): The node to pad.
+
+        Returns:
+            Node: The padded node.
+        """
+        zero = self.zero(node.level - 1)
+        return self.join(self.join(zero, zero, zero, node.nw), self.join(zero, zero, node.ne, zero),
+                         self.join(zero, node.sw, zero, zero), self.join(node.se, zero, zero, zero))
+
+    @staticmethod
+    def is_padded(node) -> bool:
+        """Checks if all the live cells of a node are in its central quarter.
+
+        Args:
+            node (Node): The node to check.
+
+        Returns:
+            bool: True if the border of the node is empty.
+        """
+        return (node.nw.population == node.nw.se.se.population
+                and node.ne.population == node.ne.sw.sw.population
+                and node.sw.population == node.sw.ne.ne.population
+                and node.se.population == node.se.nw.nw.population)
+
+    def trimmed_root(self) -> Node:
+        """Returns the smallest node centered like the root that holds every live cell of the plane.
+
+        ``step`` pads the root with empty levels, so equal planes can have roots of different
+        levels; their trimmed roots are the same node.
+
+        Returns:
+            Node: The canonical node, empty of level 1 for an empty plane.
+        """
+        node = self.root
+        while node.level > 1:
+            centre = (node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+            if sum(child.population for child in centre) != node.population:
+                break
+            node = self.join(*centre)
+        return node
+
+    def life(self, cells) -> Node:
+        """Applies the rules to the center of a 3x3 block of level 0 nodes.
+
+        Args:
+            cells (tuple): The nine cells of the block, row by row.
+
+        Returns:
+            Node: The next state of the center cell.
+        """
+        state = cells[4].population
+        live_neighbors = sum(cell.population for cell in cells) - state
+        return ON if self._rule.table[state * 9 + live_neighbors] else OFF
+
+    def life_4x4(self, node) -> Node:
+        """Advances the center 2x2 of a level 2 node by one generation.
+
+        Args:
+            node (Node): The level 2 node.
+
+        Returns:
+            Node: The level 1 node one generation later.
+        """
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        return self.join(
+            self.life((nw.nw, nw.ne, ne.nw, nw.sw, nw.se, ne.sw, sw.nw, sw.ne, se.nw)),
+            self.life((nw.ne, ne.nw, ne.ne, nw.se, ne.sw, ne.se, sw.ne, se.nw, se.ne)),
+            self.life((nw.sw, nw.se, ne.sw, sw.nw, sw.ne, se.nw, sw.sw, sw.se, se.sw)),
+            self.life((nw.se, ne.sw, ne.se, sw.ne, se.nw, se.ne, sw.se, se.sw, se.se)))
+
+    def successor(self, node, exponent) -> Node:
+        """Returns the center of a node 2^exponent generations later.
+
+        Args:
+            node (Node): A node of level 2 or more.
+            exponent (int): log2 of the number of generations, at most ``node.level - 2``.
+
+        Returns:
+            Node: The node one level down holding the center of the future.
+        """
+        key = (node, exponent)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.population == 0:
+            result = node.nw
+        elif node.level == 2:
+            result = self.life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # nine overlapping sub-squares, each advanced by the same number of generations
+            c1 = self.successor(nw, exponent)
+            c2 = self.successor(self.join(nw.ne, ne.nw, nw.se, ne.sw), exponent)
+            c3 = self.successor(ne, exponent)
+            c4 = self.successor(self.join(nw.sw, nw.se, sw.nw, sw.ne), exponent)
+            c5 = self.successor(self.join(nw.se, ne.sw, sw.ne, se.nw), exponent)
+            c6 = self.successor(self.join(ne.sw, ne.se, se.nw, se.ne), exponent)
+            c7 = self.successor(sw, exponent)
+            c8 = self.successor(self.join(sw.ne, se.nw, sw.se, se.sw), exponent)
+            c9 = self.successor(se, exponent)
+            if exponent < node.level - 2:
+                # the sub-squares already went far enough, just keep their centers
+                result = self.join(self.join(c1.se, c2.sw, c4.ne, c5.nw), self.join(c2.se, c3.sw, c5.ne, c6.nw),
+                                   self.join(c4.se, c5.sw, c7.ne, c8.nw), self.join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                # advance the four overlapping quarters the second half of the way
+                result = self.join(self.successor(self.join(c1, c2, c4, c5), exponent),
+                                   self.successor(self.join(c2, c3, c5, c6), exponent),
+                                   self.successor(self.join(c4, c5, c7, c8), exponent),
+                                   self.successor(self.join(c5, c6, c8, c9), exponent))
+
+        self._results[key] = result
+        return result
+
+    def step(self, exponent):
+        """Advances the plane by 2^exponent generations.
+
+        Args:
+            exponent (int): log2 of the number of generations.
+
+        Raises:
+            ValueError: If the rule gives birth to cells without neighbors (B0).
+        """
+        rule = self.game_logic.rule
+        if 0 in rule.births:
+            raise ValueError(f"Rule {rule.rulestring} fills the unbounded plane, it needs a bounded board.")
+        if rule is not self._rule:
+            # the memoized futures were computed with another rule
+            self._results = {}
+            self._rule = rule
+        if len(self._nodes) > self.max_nodes:
+            self.collect()
+        node = self.root
+        # make room for the pattern to grow by 2^exponent cells on every side
+        while node.level < exponent + 2 or not self.is_padded(node):
+            node = self.centre(node)
+        self.root = self.successor(self.centre(node), exponent)
+
+    def collect(self):
+        """Drops the cached nodes and futures that the current plane does not use."""
+        old_root = self.root
+        self._nodes = {}
+        self._results = {}
+        self._zeros = [OFF]
+        rebuilt = {}
+
+        def rebuild(node):
+            if node.level == 0:
+                return node
+            copy = rebuilt.get(id(node))
+            if copy is None:
+                copy = self.join(rebuild(node.nw), rebuild(node.ne), rebuild(node.sw), rebuild(node.se))
+                rebuilt[id(node)] = copy
+            return copy
+
+        self.root = rebuild(old_root)
+
+    def load(self, grid_manager):
+        """Loads the live cells of a grid into the plane, placed at the window.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells.
+        """
+        self.load_cells((row + self.top, col + self.left) for row, col in grid_manager.live_cells())
+
+    def load_cells(self, cells):
+        """Loads live cells into an otherwise empty plane.
+
+        Args:
+            cells (iterable): The (row, col) coordinates of the live cells.
+        """
+        cells = list(cells)
+        extent = max((max(abs(row), abs(col)) for row, col in cells), default=0) + 1
+        level = 3
+        while (1 << (level - 1)) < extent:
+            level += 1
+
+        # merge 2x2 blocks of nodes level by level, starting from the cells themselves
+        half = 1 << (level - 1)
+        nodes = {(row + half, col + half): ON for row, col in cells}
+        for n in range(level):
+            zero = self.zero(n)
+            merged = {}
+            while nodes:
+                key, node = nodes.popitem()
+                row = key[0] - (key[0] & 1)
+                col = key[1] - (key[1] & 1)
+                # the popped node is one of the four children, the others are still in the dict
+                nw, ne, sw, se = (node if child == key else nodes.pop(child, zero)
+                                  for child in ((row, col), (row, col + 1), (row + 1, col), (row + 1, col + 1)))
+                merged[(row >> 1, col >> 1)] = self.join(nw, ne, sw, se)
+            nodes = merged
+        self.root = nodes.get((0, 0), self.zero(level))
+
+    def load_node(self, node):
+        """Replaces the plane with a quadtree, its center on the center of the plane.
+
+        Args:
+            node (Node): The quadtree, made of nodes returned by ``join``.
+        """
+        self.root = self.centre(node)
+
+    def sync(self):
+        """Reloads the plane from the grid if the grid was changed since the last jump."""
+        grid_manager = self.game_logic.grid_manager
+        if grid_manager.version != self._version:
+            self.load(grid_manager)
+            self._version = grid_manager.version
+
+    def live_cells(self, top, left, bottom, right) -> list:
+        """Returns the live cells of the plane inside a window.
+
+        Args:
+            top (int): The first row of the window.
+            left (int): The first column of the window.
+            bottom (int): The row after the last row of the window.
+            right (int): The column after the last column of the window.
+
+        Returns:
+            list: The (row, col) coordinates of the live cells.
+        """
+        cells = []
+        half = 1 << (self.root.level - 1)
+        stack = [(self.root, -half, -half)]
+        while stack:
+            node, node_top, node_left = stack.pop()
+            size = 1 << node.level
+            if (node.population == 0 or node_top >= bottom or node_left >= right
+                    or node_top + size <= top or node_left + size <= left):
+                continue
+            if node.level == 0:
+                cells.append((node_top, node_left))
+                continue
+            half = size >> 1
+            stack.append((node.nw, node_top, node_left))
+            stack.append((node.ne, node_top, node_left + half))
+            stack.append((node.sw, node_top + half, node_left))
+            stack.append((node.se, node_top + half, node_left + half))
+        return cells
+
+    def plane_cells(self) -> list:
+        """Returns every live cell of the plane.
+
+        Returns:
+            list: The (row, col) coordinates of the live cells.
+        """
+        half = 1 << (self.root.level - 1)
+        return self.live_cells(-half, -half, half, half)
+
+    def show(self):
+        """Writes the visible window of the plane to the grid of the game logic."""
+        grid_manager = self.game_logic.grid_manager
+        cols = grid_manager.cols
+        cells = bytearray(grid_manager.rows * cols)
+        top, left = self.top, self.left
+        live_cells = self.live_cells(top, left, top + grid_manager.rows, left + cols)
+        for row, col in live_cells:
+            cells[(row - top) * cols + col - left] = 1
+        grid_manager.set_cells(cells, len(live_cells))
+        self._version = grid_manager.version
+
+    def jump(self, exponent):
+        """Advances the grid of the game logic by 2^exponent generations.
+
+        Cells that leave the visible window are kept in the plane for the next jump, as
+        long as the grid was not changed in between.
+
+        Args:
+            exponent (int): log2 of the number of generations.
+        """
+        self.sync()
+        self.step(exponent)
+        self.show()
+
+    def advance(self, generations=1):
+        """Advances the grid of the game logic by a number of generations.
+
+        Args:
+            generations (int): Number of generations to advance.
+        """
+        self.sync()
+        exponent = 0
+        # one jump per set bit of the number of generations
+        while generations:
+            if generations & 1:
+                self.step(exponent)
+            generations >>= 1
+            exponent += 1
+        self.show()
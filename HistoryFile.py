@@ -0,0 +1,207 @@
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from BitPackedEngine import TO_DIGITS, FROM_DIGITS
+
+HEADER = struct.Struct("<4sIIIQ")  # magic, format version, rows, cols, number of frames
+GENERATION = struct.Struct("<q")  # generation number at the start of every frame
+MAGIC = b"GOLH"
+VERSION = 1
+
+
+def pack_cells(cells) -> bytes:
+    """Packs 0/1 cells into bits, the first cell becomes the highest bit of the first byte.
+
+    Args:
+        cells (bytes): The 0/1 cells, one byte per cell.
+
+    Returns:
+        bytes: The packed cells, padded with dead cells to a whole number of bytes.
+    """
+    size = (len(cells) + 7) // 8
+    if size == 0:
+        return b""
+    digits = bytes(cells).translate(TO_DIGITS).ljust(size * 8, b"0")
+    return int(digits, 2).to_bytes(size, "big")
+
+
+def unpack_cells(data, count) -> bytearray:
+    """Unpacks bits written by ``pack_cells`` back into one byte per cell.
+
+    Args:
+        data (bytes): The packed cells.
+        count (int): Number of cells to unpack.
+
+    Returns:
+        bytearray: The 0/1 cells, one byte per cell.
+    """
+    if count == 0:
+        return bytearray()
+    digits = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b").encode()
+    return bytearray(digits[:count].translate(FROM_DIGITS))
+
+
+class HistoryFile:
+    """Append-only file of generations, bit-packed and read through a memory map.
+
+    The file starts with a header followed by fixed-size frames, one per generation: the
+    generation number and the cells packed one bit per cell. Frames are written with plain
+    file writes and read through a memory map of the file, so a frame is a zero-copy slice
+    and the generations never have to be kept in memory. The file can be reopened later to
+    replay or analyze a run without simulating it again.
+
+    Attributes:
+        path (str): Path of the history file.
+        rows (int): Number of rows of the recorded grid.
+        cols (int): Number of columns of the recorded grid.
+        frame_size (int): Number of bytes of each frame.
+    """
+    def __init__(self, path, rows=None, cols=None):
+        """Creates a new history file, or opens an existing one if no size is given.
+
+        Args:
+            path (str): Path of the history file.
+            rows (int): Number of rows of the recorded grid, to create a new file.
+            cols (int): Number of columns of the recorded grid, to create a new file.
+
+        Raises:
+            ValueError: If an existing file is not a history file.
+        """
+        self.path = path
+        if rows is not None and cols is not None:
+            self._file = open(path, "w+b", buffering=0)
+            self.rows = rows
+            self.cols = cols
+            self._count = 0
+            self._file.write(HEADER.pack(MAGIC, VERSION, rows, cols, 0))
+        else:
+            self._file = open(path, "r+b", buffering=0)
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                self._file.close()
+                raise ValueError(f"{path} is not a history file.")
+            magic, version, self.rows, self.cols, self._count = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                self._file.close()
+                raise ValueError(f"{path} is not a history file.")
+        self.frame_size = GENERATION.size + (self.rows * self.cols + 7) // 8
+        self._map = None
+        self._retired = []  # older maps that may still be referenced by returned frames
+        # kept in memory so appending does not map the file again after every write
+        self._last_generation = self.generation_at(self._count - 1) if self._count else None
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Closes the memory maps and the file."""
+        for old_map in self._retired + [self._map]:
+            if old_map is not None:
+                try:
+                    old_map.close()
+                except BufferError:
+                    pass  # a frame is still referenced, the map is released with it
+        self._map = None
+        self._retired = []
+        self._file.close()
+
+    def append(self, generation, cells):
+        """Writes a generation as the newest frame.
+
+        Generations must grow along the file. Appending a generation that is not newer than
+        the last frame means the run went back and branched, so the frames from that
+        generation on are discarded first.
+
+        Args:
+            generation (int): The generation number.
+            cells (bytes): The 0/1 cells, row by row.
+
+        Raises:
+            ValueError: If the cells do not match the size of the recorded grid.
+        """
+        if len(cells) != self.rows * self.cols:
+            raise ValueError(f"The history file records a {self.rows}x{self.cols} grid.")
+        if self._count and generation <= self._last_generation:
+            index = self.find(generation - 1)
+            self._count = 0 if index is None else index + 1
+
+        self._file.seek(HEADER.size + self._count * self.frame_size)
+        self._file.write(GENERATION.pack(generation) + pack_cells(cells))
+        self._count += 1
+        self._last_generation = generation
+        # the frame is written before the count, so a crash never exposes a partial frame
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.rows, self.cols, self._count))
+
+    def _view(self, index) -> memoryview:
+        """Returns the bytes of a frame straight from the memory map.
+
+        Args:
+            index (int): The position of the frame, 0 is the oldest.
+
+        Returns:
+            memoryview: The frame, the generation number followed by the packed cells.
+
+        Raises:
+            IndexError: If there is no such frame.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError("frame index out of range")
+        end = HEADER.size + (index + 1) * self.frame_size
+        if self._map is None or len(self._map) < end:
+            # the file grew since it was mapped, map all of it again
+            if self._map is not None:
+                try:
+                    self._map.close()
+                except BufferError:
+                    self._retired.append(self._map)  # a returned frame still uses it
+            self._map = mmap.mmap(self._file.fileno(), os.fstat(self._file.fileno()).st_size,
+                                  access=mmap.ACCESS_READ)
+        return memoryview(self._map)[end - self.frame_size:end]
+
+    def generation_at(self, index) -> int:
+        """Returns the generation number of a frame.
+
+        Args:
+            index (int): The position of the frame, 0 is the oldest.
+
+        Returns:
+            int: The generation number.
+        """
+        with self._view(index) as view:
+            return GENERATION.unpack(view[:GENERATION.size])[0]
+
+    def frame(self, index) -> memoryview:
+        """Returns the packed cells of a frame without copying them.
+
+        Args:
+            index (int): The position of the frame, 0 is the oldest.
+
+        Returns:
+            memoryview: The cells packed by ``pack_cells``.
+        """
+        return self._view(index)[GENERATION.size:]
+
+    def cells_at(self, index) -> bytearray:
+        """Unpacks the cells of a frame.
+
+        Args:
+            index (int): The position of the frame, 0 is the oldest.
+
+        Returns:
+            bytearray: The 0/1 cells, row by row.
+        """
+        return unpack_cells(self.frame(index), self.rows * self.cols)
+
+    def find(self, generation) -> int:
+        """Finds the newest frame at or before a generation.
+
+        Args:
+            generation (int): The generation to look for.
+
+        Returns:
+            int: The position of the frame, or None if every frame is newer.
+        """
+        index = bisect_right(range(self._count), generation, key=self.generation_at) - 1
+        return index if index >= 0 else None
@@ -0,0 +1,127 @@
+import csv
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+
+
+class Metrics:
+    """Timers and counters around the hot paths of the simulation.
+
+    Every sample is a (time, name, value) record in a bounded log: a duration in seconds
+    for the timed phases ("step", "render", "count") and a number for the counters
+    ("items_created", "cells_changed"). Rates such as generations per second are the number
+    of samples of a phase per second. Collection is off by default; while it is off
+    ``start`` and ``stop`` return right away without reading the clock, and callers check
+    ``enabled`` before computing a counter that costs anything.
+
+    Attributes:
+        enabled (bool): Flag to collect samples.
+        size (int): Largest number of samples kept, the oldest ones are dropped.
+    """
+    PHASES = ("step", "render", "count")  # the timed phases
+    COUNTERS = ("items_created", "cells_changed")  # the counted quantities
+
+    def __init__(self, size=100000, clock=time.perf_counter):
+        """Initialize the metrics, disabled.
+
+        Args:
+            size (int): Largest number of samples kept, the oldest ones are dropped.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.enabled = False
+        self.size = size
+        self._clock = clock
+        self._samples = deque(maxlen=size)  # (time, name, value), oldest first
+        self._origin = clock()  # sample times are relative to it
+
+    def clear(self):
+        """Forget every sample."""
+        self._samples.clear()
+        self._origin = self._clock()
+
+    def start(self) -> float:
+        """Starts timing a phase.
+
+        Returns:
+            float: The start time to pass to ``stop``, 0 when disabled.
+        """
+        return self._clock() if self.enabled else 0.0
+
+    def stop(self, phase, start):
+        """Records the time spent in a phase since ``start``.
+
+        Args:
+            phase (str): The name of the phase.
+            start (float): The time returned by ``start``.
+        """
+        if self.enabled:
+            now = self._clock()
+            self._samples.append((now - self._origin, phase, now - start))
+
+    def add(self, counter, value):
+        """Records a counted quantity.
+
+        Args:
+            counter (str): The name of the counter.
+            value (int): The amount counted.
+        """
+        if self.enabled:
+            self._samples.append((self._clock() - self._origin, counter, value))
+
+    def samples(self) -> list:
+        """Returns the samples kept, oldest first.
+
+        Returns:
+            list: The (time, name, value) records, time in seconds since the metrics were cleared.
+        """
+        return list(self._samples)  # copied at once, the worker thread may be adding samples
+
+    def summary(self, window=None) -> dict:
+        """Summarizes the samples.
+
+        Args:
+            window (float): Only summarize the samples of the last seconds, by default all of them.
+
+        Returns:
+            dict: For every phase and counter the number of samples, total, mean and max, plus
+                the achieved "gen_per_s" (step samples) and "fps" (render samples).
+        """
+        samples = self.samples()
+        if window is not None:
+            # samples are appended in time order, so the recent ones are at the end
+            samples = samples[bisect_left(samples, (self._clock() - self._origin - window,)):]
+            span = window
+        else:
+            span = samples[-1][0] - samples[0][0] if samples else 0
+        totals = {}
+        for _, name, value in samples:
+            count, total, largest = totals.get(name, (0, 0, 0))
+            totals[name] = (count + 1, total + value, max(largest, value))
+        summary = {name: {"count": count, "total": total, "mean": total / count, "max": largest}
+                   for name, (count, total, largest) in totals.items()}
+        summary["gen_per_s"] = totals.get("step", (0,))[0] / span if span else 0.0
+        summary["fps"] = totals.get("render", (0,))[0] / span if span else 0.0
+        return summary
+
+    def export_json(self, path):
+        """Writes the summary and every sample to a JSON file.
+
+        Args:
+            path (str): Path of the file, an existing file is overwritten.
+        """
+        samples = [{"time": sample_time, "name": name, "value": value}
+                   for sample_time, name, value in self.samples()]
+        with open(path, "w") as file:
+            json.dump({"summary": self.summary(), "samples": samples}, file, indent=4)
+
+    def export_csv(self, path):
+        """Writes every sample to a CSV file, one row per sample.
+
+        Args:
+            path (str): Path of the file, an existing file is overwritten.
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("time", "name", "value"))
+            writer.writerows(self.samples())
@@ -0,0 +1,90 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, GameLogic falls back to the pure Python engine
+    np = None
+
+
+class NumpyEngine:
+    """Vectorized Game of Life engine backed by NumPy.
+
+    Instead of counting the neighbors of every cell one at a time, the whole
+    neighbor-sum array is built at once by adding eight shifted copies of the grid.
+
+    Attributes:
+        game_logic (GameLogic): The game logic that owns this engine.
+        available (bool): Whether NumPy could be imported.
+    """
+    available = np is not None
+
+    def __init__(self, game_logic):
+        """Initialize the engine.
+
+        Args:
+            game_logic (GameLogic): The game logic that owns this engine.
+        """
+        self.game_logic = game_logic
+
+    @staticmethod
+    def count_neighbors(cells, wrap):
+        """Counts the live neighbors of every cell at once.
+
+        Args:
+            cells (numpy.ndarray): Array of 0/1 cells whose last two axes are the rows and columns,
+                extra leading axes hold independent boards.
+            wrap (bool): Whether to wrap around the edges of the grid.
+
+        Returns:
+            numpy.ndarray: Array of the same shape holding the neighbor counts.
+        """
+        if wrap:
+            # shift the grid in all eight directions, the edges wrap around (toroidal)
+            counts = np.zeros(cells.shape, dtype=np.uint8)
+            for dr in (-1, 0, 1):
+                shifted = np.roll(cells, dr, axis=-2)
+                for dc in (-1, 0, 1):
+                    if dr or dc:
+                        counts += np.roll(shifted, dc, axis=-1)
+            return counts
+
+        # pad the grid with a border of dead cells so every slice has the same shape
+        rows, cols = cells.shape[-2:]
+        padded = np.zeros(cells.shape[:-2] + (rows + 2, cols + 2), dtype=np.uint8)
+        padded[..., 1:-1, 1:-1] = cells
+        counts = np.zeros(cells.shape, dtype=np.uint8)
+        for dr in range(3):
+            for dc in range(3):
+                if dr != 1 or dc != 1:
+                    counts += padded[..., dr:dr + rows, dc:dc + cols]
+        return counts
+
+    @classmethod
+    def step(cls, cells, wrap, table):
+        """Computes the next generation of a grid.
+
+        Args:
+            cells (numpy.ndarray): Array of 0/1 cells whose last two axes are the rows and columns.
+            wrap (bool): Whether to wrap around the edges of the grid.
+            table (numpy.ndarray): The rule table, indexed by ``state * 9 + live_neighbors``.
+
+        Returns:
+            numpy.ndarray: The next generation.
+        """
+        counts = cls.count_neighbors(cells, wrap)
+        # one table lookup for the whole board
+        return table[cells * 9 + counts]
+
+    def advance(self, generations=1):
+        """Advances the grid of the game logic by a number of generations.
+
+        Args:
+            generations (int): Number of generations to advance.
+        """
+        grid_manager = self.game_logic.grid_manager
+        if grid_manager.rows == 0 or grid_manager.cols == 0:
+            return
+        # a view of the cells buffer, the first step makes a new array so the buffer is not modified
+        cells = np.frombuffer(grid_manager.cells, dtype=np.uint8).reshape(grid_manager.rows, grid_manager.cols)
+        table = np.array(self.game_logic.rule.table, dtype=np.uint8)
+        for _ in range(generations):
+            cells = self.step(cells, self.game_logic.wrap, table)
+        grid_manager.set_cells(bytearray(cells.tobytes()), int(np.count_nonzero(cells)))
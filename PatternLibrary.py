@@ -0,0 +1,316 @@
+import json
+import os
+import re
+from HashLifeEngine import ON, OFF
+
+PATTERNS_DIRECTORY = "patterns"  # the pattern library shipped with the application
+INDEX_FILE = "index.json"  # the index of the pattern library, inside its directory
+INDEX_VERSION = 1
+FORMATS = {".rle": "rle", ".cells": "cells", ".mc": "mc"}  # pattern formats by file extension
+
+RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*([^\s,]+))?", re.IGNORECASE)
+RLE_RUN = re.compile(r"(\d*)([^\d\s])")  # a run count and the tag it repeats
+RLE_TRAILING_COUNT = re.compile(r"\d+$")  # a run count continued on the next line
+
+
+class Pattern:
+    """The index entry of a pattern file, everything but the cells.
+
+    Attributes:
+        name (str): The name of the pattern.
+        path (str): Path of the pattern file.
+        format (str): The format of the file, "rle", "cells" or "mc".
+        rows (int): Number of rows of the bounding box, the side of the root node for a macrocell file.
+        cols (int): Number of columns of the bounding box, the side of the root node for a macrocell file.
+        rule (str): The rulestring given by the file, or None.
+        offset (int): Byte offset of the cells in the file, after the header.
+    """
+    __slots__ = ("name", "path", "format", "rows", "cols", "rule", "offset")
+
+    def __init__(self, name, path, format, rows, cols, rule, offset):
+        """Initialize the entry.
+
+        Args:
+            name (str): The name of the pattern.
+            path (str): Path of the pattern file.
+            format (str): The format of the file, "rle", "cells" or "mc".
+            rows (int): Number of rows of the bounding box.
+            cols (int): Number of columns of the bounding box.
+            rule (str): The rulestring given by the file, or None.
+            offset (int): Byte offset of the cells in the file, after the header.
+        """
+        self.name = name
+        self.path = path
+        self.format = format
+        self.rows = rows
+        self.cols = cols
+        self.rule = rule
+        self.offset = offset
+
+
+def read_header(path) -> Pattern:
+    """Reads the name, size and rule of a pattern file without parsing its cells.
+
+    RLE files give their size in the header. The size of a plaintext file is measured from
+    the length of its lines, and the size of a macrocell file from the level of its root
+    node, the last line of the file.
+
+    Args:
+        path (str): Path of a ``.rle``, ``.cells`` or ``.mc`` file.
+
+    Returns:
+        Pattern: The index entry of the file.
+
+    Raises:
+        ValueError: If the file is not a pattern file.
+    """
+    file_format = FORMATS.get(os.path.splitext(path)[1].lower())
+    if file_format is None:
+        raise ValueError(f"{os.path.basename(path)} is not a .rle, .cells or .mc file.")
+    name = os.path.splitext(os.path.basename(path))[0]
+    rule = None
+    with open(path, "rb") as file:
+        if file_format == "rle":
+            while True:
+                line = file.readline()
+                if not line:
+                    raise ValueError(f"{os.path.basename(path)} has no RLE header.")
+                line = line.decode("latin-1").strip()
+                if line.startswith("#N"):
+                    name = line[2:].strip() or name
+                elif line and not line.startswith("#"):
+                    match = RLE_HEADER.match(line)
+                    if match is None:
+                        raise ValueError(f"{os.path.basename(path)} has no RLE header.")
+                    return Pattern(name, path, file_format, int(match[2]), int(match[1]), match[3], file.tell())
+
+        if file_format == "cells":
+            offset = None
+            rows = cols = 0
+            while True:
+                position = file.tell()
+                line = file.readline()
+                if not line:
+                    break
+                line = line.decode("latin-1").rstrip()
+                if line.startswith("!"):
+                    if line.startswith("!Name:") and offset is None:
+                        name = line[6:].strip() or name
+                    continue
+                if offset is None:
+                    offset = position
+                rows += 1
+                cols = max(cols, len(line))
+            return Pattern(name, path, file_format, rows, cols, rule, position if offset is None else offset)
+
+        offset = 0
+        while True:
+            position = file.tell()
+            line = file.readline()
+            if not line:
+                raise ValueError(f"{os.path.basename(path)} has no cells.")
+            line = line.decode("latin-1").strip()
+            if line.startswith("[M2]"):
+                continue
+            if line.startswith("#R"):
+                rule = line[2:].strip() or None
+            elif line.startswith("#N"):
+                name = line[2:].strip() or name
+            elif line and not line.startswith("#"):
+                offset = position
+                break
+    # only the end of the file is read, the root node is the last line
+    fields = _last_line(path, offset).split()
+    level = int(fields[0]) if fields and fields[0].isdigit() else 3  # a file with a single leaf
+    return Pattern(name, path, file_format, 1 << level, 1 << level, rule, offset)
+
+
+def _last_line(path, offset) -> str:
+    """Returns the last non-empty line of a file, reading only its end.
+
+    Args:
+        path (str): Path of the file.
+        offset (int): Byte offset the last line cannot start before.
+
+    Returns:
+        str: The line, or an empty string if there is none.
+    """
+    with open(path, "rb") as file:
+        end = file.seek(0, os.SEEK_END)
+        size = 256
+        while True:
+            start = max(offset, end - size)
+            file.seek(start)
+            lines = file.read(end - start).decode("latin-1").splitlines()
+            lines = [line for line in lines if line.strip()]
+            # the first line read may be cut, unless it starts at the offset
+            if len(lines) > 1 or start == offset:
+                return lines[-1] if lines else ""
+            size *= 4
+
+
+def read_cells(pattern):
+    """Parses the cells of an RLE or plaintext pattern file, one line at a time.
+
+    Args:
+        pattern (Pattern): The index entry of the file.
+
+    Yields:
+        tuple: The (row, col) coordinates of every live cell, from the top-left corner of the bounding box.
+
+    Raises:
+        ValueError: If the pattern is a macrocell file, see ``read_macrocell``.
+    """
+    if pattern.format == "mc":
+        raise ValueError(f"{pattern.name} is a macrocell file.")
+    with open(pattern.path, "rb") as file:
+        file.seek(pattern.offset)
+        if pattern.format == "cells":
+            for row, line in enumerate(line for line in file if not line.startswith(b"!")):
+                for col, cell in enumerate(line.rstrip()):
+                    if cell in b"O*":
+                        yield row, col
+            return
+
+        row = col = 0
+        pending = ""  # a run count cut by the end of a line
+        for line in file:
+            line = line.decode("latin-1").strip()
+            if line.startswith("#"):
+                continue
+            line = pending + line
+            match = RLE_TRAILING_COUNT.search(line)
+            pending = match[0] if match else ""
+            for count, tag in RLE_RUN.findall(line[:match.start()] if match else line):
+                count = int(count) if count else 1
+                if tag == "!":
+                    return
+                if tag == "$":
+                    row += count
+                    col = 0
+                elif tag in "b.":
+                    col += count
+                else:
+                    # "o", or any state of a multi-state rule, is a live cell
+                    for n in range(count):
+                        yield row, col + n
+                    col += count
+
+
+def read_macrocell(pattern, engine):
+    """Parses a Golly macrocell file straight into the quadtree of a Hashlife engine.
+
+    The nodes are read one line at a time and made canonical with ``engine.join``, so a
+    pattern of millions of cells costs one node per distinct square, never a cell per cell.
+
+    Args:
+        pattern (Pattern): The index entry of a ``.mc`` file.
+        engine (HashLifeEngine): The engine that owns the nodes.
+
+    Returns:
+        Node: The root node of the file, its center is cell (0, 0) of the pattern.
+
+    Raises:
+        ValueError: If the file is not a two-state macrocell file.
+    """
+    nodes = [None]  # nodes by line number, 0 is the empty node
+    with open(pattern.path, "rb") as file:
+        file.seek(pattern.offset)
+        for line in file:
+            line = line.decode("latin-1").strip()
+            if not line or line.startswith("#"):
+                continue
+            if line[0] in ".*$":
+                # a leaf: 8x8 cells, "$" ends a row and trailing dead cells are left out
+                cells = [[OFF] * 8 for _ in range(8)]
+                for row, text in enumerate(line.split("$")[:8]):
+                    for col, cell in enumerate(text[:8]):
+                        if cell == "*":
+                            cells[row][col] = ON
+                while len(cells) > 1:
+                    # merge 2x2 blocks of nodes until one node is left
+                    cells = [[engine.join(cells[row][col], cells[row][col + 1],
+                                          cells[row + 1][col], cells[row + 1][col + 1])
+                              for col in range(0, len(cells), 2)] for row in range(0, len(cells), 2)]
+                nodes.append(cells[0][0])
+                continue
+            try:
+                level, *children = (int(field) for field in line.split())
+            except ValueError:
+                raise ValueError(f"{pattern.name} has an invalid line: {line[:40]}") from None
+            if level < 4 or len(children) != 4 or max(children) >= len(nodes):
+                raise ValueError(f"{pattern.name} is not a two-state macrocell file.")
+            zero = engine.zero(level - 1)
+            nw, ne, sw, se = (nodes[child] if child else zero for child in children)
+            if nw.level != level - 1 or ne.level != level - 1 or sw.level != level - 1 or se.level != level - 1:
+                raise ValueError(f"{pattern.name} has a node of the wrong level: {line[:40]}")
+            nodes.append(engine.join(nw, ne, sw, se))
+    if len(nodes) == 1:
+        raise ValueError(f"{pattern.name} has no cells.")
+    return nodes[-1]
+
+
+class PatternLibrary:
+    """A directory of pattern files, indexed once.
+
+    The name, bounding box, rule and offset of the cells of every file are cached in an
+    index file in the directory. When the library is opened again only the files added or
+    changed since, by size or modification time, have their header read; the cells of a
+    pattern are only parsed when it is loaded.
+
+    Attributes:
+        directory (str): Path of the directory of pattern files.
+        index_path (str): Path of the index file.
+        patterns (list): The Pattern of every file, sorted by name.
+    """
+    def __init__(self, directory, index_file=INDEX_FILE):
+        """Open the library and bring its index up to date.
+
+        Args:
+            directory (str): Path of the directory of pattern files.
+            index_file (str): Name of the index file inside the directory.
+        """
+        self.directory = directory
+        self.index_path = os.path.join(directory, index_file)
+        self.patterns = []
+        self.refresh()
+
+    def refresh(self):
+        """Index the files added or changed since the index was written, and write it if anything changed."""
+        try:
+            with open(self.index_path) as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            index = {}
+        cached = index.get("patterns", {}) if index.get("version") == INDEX_VERSION else {}
+
+        try:
+            files = [entry for entry in os.scandir(self.directory)
+                     if entry.is_file() and os.path.splitext(entry.name)[1].lower() in FORMATS]
+        except FileNotFoundError:
+            files = []
+
+        entries = {}
+        patterns = []
+        for entry in files:
+            stat = entry.stat()
+            record = cached.get(entry.name)
+            if record is None or record["size"] != stat.st_size or record["mtime"] != stat.st_mtime_ns:
+                try:
+                    pattern = read_header(entry.path)
+                except (OSError, ValueError):
+                    continue  # not a pattern file, it is left out of the library
+                record = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "name": pattern.name,
+                          "format": pattern.format, "rows": pattern.rows, "cols": pattern.cols,
+                          "rule": pattern.rule, "offset": pattern.offset}
+            entries[entry.name] = record
+            patterns.append(Pattern(record["name"], entry.path, record["format"], record["rows"],
+                                    record["cols"], record["rule"], record["offset"]))
+        self.patterns = sorted(patterns, key=lambda pattern: pattern.name.lower())
+
+        if entries != cached:
+            try:
+                with open(self.index_path, "w") as file:
+                    json.dump({"version": INDEX_VERSION, "patterns": entries}, file, indent=4)
+            except OSError:
+                pass  # a read-only library is indexed again the next time it is opened
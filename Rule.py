@@ -0,0 +1,116 @@
+from functools import lru_cache
+
+# Well known Life-like rules offered in the settings screen
+PRESET_RULES = {
+    "Conway's Life": "B3/S23",
+    "HighLife": "B36/S23",
+    "Seeds": "B2/S",
+    "Day & Night": "B3678/S34678",
+    "Life without Death": "B3/S012345678",
+    "Maze": "B3/S12345",
+    "Replicator": "B1357/S1357",
+}
+
+
+class Rule:
+    """A Life-like rule compiled into a lookup table.
+
+    Attributes:
+        rulestring (str): The rule in normalized B/S notation, e.g. "B3/S23".
+        births (frozenset): Neighbor counts that bring a dead cell to life.
+        survivals (frozenset): Neighbor counts that keep a live cell alive.
+        table (tuple): Next state of a cell, indexed by ``state * 9 + live_neighbors``.
+    """
+    def __init__(self, births, survivals):
+        """Initialize the rule.
+
+        Args:
+            births (iterable): Neighbor counts that bring a dead cell to life.
+            survivals (iterable): Neighbor counts that keep a live cell alive.
+        """
+        self.births = frozenset(births)
+        self.survivals = frozenset(survivals)
+        self.rulestring = ("B" + "".join(str(n) for n in sorted(self.births))
+                           + "/S" + "".join(str(n) for n in sorted(self.survivals)))
+        self.table = tuple(1 if n in self.births else 0 for n in range(9)) + \
+            tuple(1 if n in self.survivals else 0 for n in range(9))
+
+    def __repr__(self):
+        return f"Rule('{self.rulestring}')"
+
+
+@lru_cache(maxsize=None)
+def parse_rule(rulestring) -> Rule:
+    """Compiles a rulestring into a rule, compiled rules are cached by rulestring.
+
+    Both the B/S notation ("B36/S23") and the older S/B notation ("23/36") are accepted.
+
+    Args:
+        rulestring (str): The rule to compile.
+
+    Returns:
+        Rule: The compiled rule.
+
+    Raises:
+        ValueError: If the rulestring is not a valid Life-like rule.
+    """
+    parts = rulestring.strip().upper().split("/")
+    if len(parts) != 2:
+        raise ValueError(f"Rule '{rulestring}' is not in B/S notation.")
+
+    if parts[0].startswith("B") and parts[1].startswith("S"):
+        births, survivals = parts[0][1:], parts[1][1:]
+    elif parts[0].startswith("S") and parts[1].startswith("B"):
+        survivals, births = parts[0][1:], parts[1][1:]
+    else:
+        # S/B notation without letters, e.g. "23/3"
+        survivals, births = parts
+
+    for counts in (births, survivals):
+        if not all(count in "012345678" for count in counts):
+            raise ValueError(f"Rule '{rulestring}' has neighbor counts outside of 0-8.")
+    return Rule((int(count) for count in births), (int(count) for count in survivals))
+
+
+def describe_counts(counts) -> str:
+    """Writes neighbor counts out for a sentence, e.g. "2 or 3".
+
+    Args:
+        counts (iterable): The neighbor counts.
+
+    Returns:
+        str: The sorted counts joined with commas and a final "or".
+    """
+    counts = [str(count) for count in sorted(counts)]
+    if len(counts) == 1:
+        return counts[0]
+    return ", ".join(counts[:-1]) + " or " + counts[-1]
+
+
+def describe_rule(rule) -> str:
+    """Explains a rule in plain sentences, for the settings screen.
+
+    Args:
+        rule (Rule): The rule to explain.
+
+    Returns:
+        str: One numbered line per part of the rule.
+    """
+    parts = []
+    if rule.births:
+        parts.append(f"Reproduction: Any dead cell with {describe_counts(rule.births)} live neighbors "
+                     f"becomes a live cell.")
+    else:
+        parts.append("Reproduction: Dead cells never become live cells.")
+    if rule.survivals:
+        parts.append(f"Survival: Any live cell with {describe_counts(rule.survivals)} live neighbors "
+                     f"survives to the next generation.")
+    dying = set(range(9)) - rule.survivals
+    if not dying:
+        parts.append("Death: Live cells never die.")
+    elif rule.survivals:
+        parts.append(f"Death: Any live cell with {describe_counts(dying)} live neighbors dies.")
+    else:
+        parts.append("Death: Every live cell dies.")
+    lines = [f"Rules ({rule.rulestring}):"] + [f"{number}. {part}" for number, part in enumerate(parts, 1)]
+    return "\n".join(lines)
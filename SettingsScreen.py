@@ -1,8 +1,13 @@
+import sqlite3
+import time
 import tkinter as tk
 from Screen import Screen
-import json
 from tkinter import messagebox
-import AppManager
+from tkinter import filedialog
+from Rule import PRESET_RULES, describe_rule
+from GridRenderer import BACKENDS, MAX_SIZES
+from GridStore import PAGE_SIZE, THUMBNAIL_SIZE
+from PatternLibrary import FORMATS, read_header, read_cells, read_macrocell
 
 
 class SettingsScreen(Screen):
@@ -15,14 +20,25 @@ class SettingsScreen(Screen):
         alive_color_dropdown (OptionMenu): The dropdown to select the alive cell color.
         dead_color_var (StringVar): The variable to store the selected dead cell color.
         dead_color_dropdown (OptionMenu): The dropdown to select the dead cell color.
-        saved_grid_buttons (list): A list of buttons to load saved grids.
-        delete_grid_buttons (list): A list of buttons to delete saved grids.
-        predefined_patterns (Listbox): The listbox to show predefined patterns.
+        engine_var (StringVar): The variable to store the selected simulation engine.
+        engine_dropdown (OptionMenu): The dropdown to select the simulation engine.
+        renderer_var (StringVar): The variable to store the selected rendering backend.
+        renderer_dropdown (OptionMenu): The dropdown to select the rendering backend.
+        rule_var (StringVar): The variable to store the selected preset rule.
+        rule_dropdown (OptionMenu): The dropdown to select a preset rule.
+        rule_entry (Entry): The entry widget to type a custom rulestring.
+        rules_label (Label): The label explaining the selected rule.
+        record_button (Button): The button to start or stop recording the history to a file.
+        saved_grids_list (Listbox): The listbox to show a page of the saved grids.
+        thumbnail_label (Label): The label to show the thumbnail of the selected saved grid.
+        saved_grid_ids (list): The ids of the saved grids listed, in the order of the listbox.
+        saved_grids_page (int): The page of saved grids listed, 0 is the most recently saved.
+        thumbnails (dict): The thumbnail image of every saved grid already previewed, by id and save time.
+        predefined_patterns (Listbox): The listbox to show the predefined patterns and the pattern library.
+        pattern_choices (list): The predefined pattern names and library Patterns, in the order of the listbox.
         grid_size_adjuster_rows (Entry): The entry widget to adjust the number of rows.
         grid_size_adjuster_cols (Entry): The entry widget to adjust the number of columns.
         apply_button (Button): The button to apply the grid size.
-        MAX_ROWS (int): The maximum number of rows allowed.
-        MAX_COLS (int): The maximum number of columns allowed.
     """
     def __init__(self, GoL):
         """Initialize the settings screen.
@@ -57,19 +73,10 @@ class SettingsScreen(Screen):
         rules_frame = tk.Frame(self.frame, bg="pink", bd=2, relief="groove", padx=10, pady=10)
         rules_frame.pack(side="top", fill="x", pady=10, anchor="center")
 
-        # Create a label to explain the rules of the game
-        rules_label = tk.Label(rules_frame, text="Rules:\n"
-                                                 "1. Underpopulation: "
-                                                 "Any live cell with fewer than two live neighbors dies.\n"
-                                                 "2. Survival: "
-                                                 "Any live cell with two or three live neighbors "
-                                                 "survives to the next generation.\n"
-                                                 "3. Overpopulation: "
-                                                 "Any live cell with more than three live neighbors dies.\n"
-                                                 "4. Reproduction: "
-                                                 "Any dead cell with exactly three live neighbors becomes a live cell.",
-                               bg="pink")
-        rules_label.pack(side="top", pady=10)
+        # Create a label to explain the rules of the game, written out from the selected rule
+        self.rules_label = tk.Label(rules_frame, text=describe_rule(self.GoL.game_screen.game_logic.rule),
+                                    bg="pink", justify="left")
+        self.rules_label.pack(side="top", pady=10)
 
         # Create a frame for the color scheme section
         color_scheme_frame = tk.Frame(self.frame, bg="pink")
@@ -93,49 +100,97 @@ class SettingsScreen(Screen):
                                                  command=self.apply_color_scheme)
         self.dead_color_dropdown.grid(row=2, column=1, padx=10, pady=5, sticky="w")
 
+        # Create a dropdown for the simulation engine
+        game_logic = self.GoL.game_screen.game_logic
+        engine_label = tk.Label(color_scheme_frame, text="Engine:", bg="pink")
+        engine_label.grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        self.engine_var = tk.StringVar(value=game_logic.engine)  # Default to the fastest available engine
+        self.engine_dropdown = tk.OptionMenu(color_scheme_frame, self.engine_var, *game_logic.engine_names(),
+                                             command=self.apply_engine)
+        self.engine_dropdown.grid(row=3, column=1, padx=10, pady=5, sticky="w")
+
+        # Create a dropdown for the rendering backend
+        renderer_label = tk.Label(color_scheme_frame, text="Renderer:", bg="pink")
+        renderer_label.grid(row=3, column=2, padx=10, pady=5, sticky="w")
+        self.renderer_var = tk.StringVar(value=self.GoL.grid_renderer.backend)  # Default to canvas items
+        self.renderer_dropdown = tk.OptionMenu(color_scheme_frame, self.renderer_var, *BACKENDS,
+                                               command=self.apply_renderer)
+        self.renderer_dropdown.grid(row=3, column=3, padx=10, pady=5, sticky="w")
+
+        # Create a dropdown for preset rules and an entry for custom rulestrings
+        rule_label = tk.Label(color_scheme_frame, text="Rule:", bg="pink")
+        rule_label.grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        self.rule_var = tk.StringVar(value="Conway's Life")  # Default rule
+        self.rule_dropdown = tk.OptionMenu(color_scheme_frame, self.rule_var, *PRESET_RULES,
+                                           command=self.apply_preset_rule)
+        self.rule_dropdown.grid(row=4, column=1, padx=10, pady=5, sticky="w")
+        self.rule_entry = tk.Entry(color_scheme_frame, width=16)
+        self.rule_entry.insert(0, game_logic.rule.rulestring)
+        self.rule_entry.grid(row=4, column=2, padx=10, pady=5, sticky="w")
+        rule_apply_button = tk.Button(color_scheme_frame, text="Apply Rule", command=self.apply_rule, bg="pink")
+        rule_apply_button.grid(row=4, column=3, padx=10, pady=5, sticky="w")
+
+        # Create a button to record every generation to a history file
+        history_label = tk.Label(color_scheme_frame, text="History File:", bg="pink")
+        history_label.grid(row=5, column=0, padx=10, pady=5, sticky="w")
+        self.record_button = tk.Button(color_scheme_frame, text="Record To File", command=self.toggle_recording,
+                                       bg="pink")
+        self.record_button.grid(row=5, column=1, padx=10, pady=5, sticky="w")
+
         # Create a frame for the load previous grid section
         load_frame = tk.Frame(self.frame, bg="pink")
         load_frame.pack(side="top", fill="x", pady=10, anchor="center")
 
-        # Create a load previous grid section
-        load_label = tk.Label(load_frame, text="Load Previous Grid:", bg="pink")
-        load_label.grid(row=0, column=0, columnspan=5, padx=10, pady=5)
-        # Create buttons for saved grids
-        self.saved_grid_buttons = []
-        for n in range(5):
-            button = tk.Button(load_frame, text=f"Grid {n + 1}",
-                               command=lambda n=n: self.load_grid(n), bg="pink")
-            button.grid(row=1, column=n, padx=10, pady=5)
-            self.saved_grid_buttons.append(button)
-
-        # Create a delete button for each saved grid
-        self.delete_grid_buttons = []
-        for n in range(5):
-            button = tk.Button(load_frame, text=f"Delete {n + 1}",
-                               command=lambda n=n: self.delete_grid(n), bg="pink")
-            button.grid(row=2, column=n, padx=10, pady=5)
-            self.delete_grid_buttons.append(button)
+        # Create a saved grids section
+        load_label = tk.Label(load_frame, text="Saved Grids:", bg="pink")
+        load_label.grid(row=0, column=0, columnspan=4, padx=10, pady=5)
+        self.saved_grids_list = tk.Listbox(load_frame, height=5, width=50)
+        self.saved_grids_list.grid(row=1, column=0, columnspan=4, padx=10, pady=5)
+        self.saved_grids_list.bind("<<ListboxSelect>>", self.show_thumbnail)
+        self.thumbnail_label = tk.Label(load_frame, bg="pink")
+        self.thumbnail_label.grid(row=1, column=4, padx=10, pady=5)
+        self.saved_grid_ids = []
+        self.saved_grids_page = 0
+        self.thumbnails = {}
+
+        # Create buttons to load and delete the selected grid and to turn the pages
+        load_button = tk.Button(load_frame, text="Load", command=self.load_grid, bg="pink")
+        load_button.grid(row=2, column=0, padx=10, pady=5)
+        delete_button = tk.Button(load_frame, text="Delete", command=self.delete_grid, bg="pink")
+        delete_button.grid(row=2, column=1, padx=10, pady=5)
+        newer_button = tk.Button(load_frame, text="Newer", command=lambda: self.turn_page(-1), bg="pink")
+        newer_button.grid(row=2, column=2, padx=10, pady=5)
+        older_button = tk.Button(load_frame, text="Older", command=lambda: self.turn_page(1), bg="pink")
+        older_button.grid(row=2, column=3, padx=10, pady=5)
 
         # Create a frame for the predefined patterns section
         patterns_frame = tk.Frame(self.frame, bg="pink")
         patterns_frame.pack(side="top", fill="x", pady=10, anchor="center")
 
         # Create a predefined patterns section
-        patterns_label = tk.Label(patterns_frame, text="Predefined Patterns:", bg="pink")
+        patterns_label = tk.Label(patterns_frame, text="Patterns:", bg="pink")
         patterns_label.pack(side="left", padx=10)
-        self.predefined_patterns = tk.Listbox(patterns_frame, height=5, width=20)
+        self.predefined_patterns = tk.Listbox(patterns_frame, height=5, width=30)
         self.predefined_patterns.pack(side="left", padx=10)
 
-        # Add predefined patterns to the listbox
-        predefined_patterns = ["Glider", "Blinker", "Toad", "Beacon", "Pulsar"]
-        for pattern in predefined_patterns:
-            self.predefined_patterns.insert(tk.END, pattern)
+        # Add the predefined patterns, then the patterns of the library, to the listbox
+        self.pattern_choices = list(self.GoL.grid_manager.patterns) + self.GoL.pattern_library.patterns
+        for pattern in self.pattern_choices:
+            if isinstance(pattern, str):
+                self.predefined_patterns.insert(tk.END, pattern)
+            else:
+                self.predefined_patterns.insert(tk.END, f"{pattern.name} ({pattern.cols}x{pattern.rows})")
 
         # Create a button to load the selected pattern
         load_pattern_button = tk.Button(patterns_frame, text="Load Pattern",
                                         command=self.load_selected_pattern, bg="pink")
         load_pattern_button.pack(side="left", padx=10)
 
+        # Create a button to load a pattern file from outside the library
+        import_pattern_button = tk.Button(patterns_frame, text="Import Pattern File",
+                                          command=self.import_pattern, bg="pink")
+        import_pattern_button.pack(side="left", padx=10)
+
         # Create a frame for the grid size adjuster
         grid_size_frame = tk.Frame(self.frame, bg="pink")
         grid_size_frame.pack(side="top", fill="x", pady=10, anchor="center")
@@ -154,55 +209,123 @@ class SettingsScreen(Screen):
         self.apply_button = tk.Button(grid_size_frame, text="Apply", command=self.adjust_grid_size, bg="pink")
         self.apply_button.pack(side="left", padx=10)
 
-        # Max num of rows and cols
-        self.MAX_ROWS = 50
-        self.MAX_COLS = 50
-
-    def load_grid(self, index):
-        """Load a saved grid.
+    def show(self):
+        """Show the screen with the saved grids listed again, grids may have been saved since"""
+        self.list_saved_grids()
+        self.show_rule()  # the rule may have been changed with a saved grid or a pattern
+        self.engine_var.set(self.GoL.game_screen.game_logic.engine)  # a failed engine may have been replaced
+        super().show()
+
+    def list_saved_grids(self):
+        """List the current page of saved grids, only the index of that page is read"""
+        entries = self.GoL.grid_store.entries(self.saved_grids_page * PAGE_SIZE, PAGE_SIZE)
+        if not entries and self.saved_grids_page > 0:
+            # the last grids of the page were deleted, go back to the previous page
+            self.saved_grids_page -= 1
+            entries = self.GoL.grid_store.entries(self.saved_grids_page * PAGE_SIZE, PAGE_SIZE)
+        self.saved_grids_list.delete(0, tk.END)
+        self.saved_grid_ids = []
+        for entry in entries:
+            saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.saved))
+            self.saved_grids_list.insert(tk.END, f"{entry.name} ({entry.rows}x{entry.cols}, "
+                                                 f"{entry.population} alive, {saved})")
+            self.saved_grid_ids.append((entry.grid_id, entry.saved))
+        self.thumbnail_label.config(image="")
+
+    def turn_page(self, step):
+        """List the next or previous page of saved grids.
 
         Args:
-            index (int): The index of the saved grid to load.
+            step (int): 1 for the older grids, -1 for the newer ones.
         """
-        try:
-            with open(AppManager.get_path("saved_grids.json")) as file:
-                saved_grids = json.load(file)
-            if index < len(saved_grids):
-                saved_grid = saved_grids[index]
-                rows = len(saved_grid)
-                cols = len(saved_grid[0])
-                self.GoL.grid_manager.resize_grid(rows, cols)
-                self.GoL.grid_manager.grid = saved_grid
-                self.GoL.grid_renderer.update_cell_size()
-                self.GoL.grid_renderer.render_grid()
-                self.GoL.game_screen.adjust_offsets()  # Adjust the offsets to center the grid
-                messagebox.showinfo("Load Grid", f"Grid {index + 1} has been loaded successfully.")
-            else:
-                messagebox.showerror("Load Grid", "Grid index out of range.")
-        except (FileNotFoundError, json.JSONDecodeError, IndexError):
-            messagebox.showerror("Load Grid", "Failed to load the grid.")
+        if self.saved_grids_page + step < 0 or (step > 0 and len(self.saved_grid_ids) < PAGE_SIZE):
+            return  # there is no such page
+        self.saved_grids_page += step
+        self.list_saved_grids()
+
+    def selected_grid(self) -> tuple:
+        """Returns the saved grid selected in the listbox.
+
+        Returns:
+            tuple: The (id, save time) of the grid, or None if no grid is selected.
+        """
+        selection = self.saved_grids_list.curselection()
+        return self.saved_grid_ids[selection[0]] if selection else None
 
-    def delete_grid(self, index):
-        """Delete a saved grid.
+    def show_thumbnail(self, event):
+        """Show the thumbnail of the selected saved grid, it is read once and then kept.
 
         Args:
-            index (int): The index of the saved grid to delete.
+            event (tk.Event): The event object containing the selection.
         """
+        selected = self.selected_grid()
+        if selected is None:
+            return
+        image = self.thumbnails.get(selected)
+        if image is None:
+            try:
+                data = self.GoL.grid_store.thumbnail(selected[0])
+            except (KeyError, sqlite3.Error):
+                return
+            image = tk.PhotoImage(master=self.frame, data=data, format="PPM")
+            zoom = THUMBNAIL_SIZE // max(image.width(), image.height(), 1)
+            if zoom > 1:
+                image = image.zoom(zoom)  # scale small grids up to the thumbnail size
+            self.thumbnails[selected] = image
+        self.thumbnail_label.config(image=image)
+
+    def load_grid(self):
+        """Load the selected saved grid."""
+        selected = self.selected_grid()
+        if selected is None:
+            messagebox.showerror("Load Grid", "Select a grid to load.")
+            return
         try:
-            with open(AppManager.get_path("saved_grids.json"), "r") as file:
-                saved_grids = json.load(file)
-            if index < len(saved_grids):
-                if not saved_grids[index]:
-                    messagebox.showerror("Delete Grid", f"Grid {index + 1} is already empty.")
-                    return
-                del saved_grids[index]
-                with open("saved_grids.json", "w") as file:
-                    json.dump(saved_grids, file, indent=4)
-                messagebox.showinfo("Delete Grid", f"Grid {index + 1} has been deleted.")
-            else:
-                messagebox.showerror("Delete Grid", f"Grid {index + 1} does not exist.")
-        except (FileNotFoundError, json.JSONDecodeError):
+            # only this grid is read, its cells go straight into the grid buffer
+            saved_grid = self.GoL.grid_store.load(selected[0])
+            self.GoL.game_screen.restore_grid(saved_grid)
+        except (KeyError, ValueError, sqlite3.Error):
+            messagebox.showerror("Load Grid", "Failed to load the grid.")
+            return
+        self.GoL.grid_renderer.update_cell_size()
+        self.GoL.grid_renderer.render_grid()
+        self.GoL.game_screen.adjust_offsets()  # Adjust the offsets to center the grid
+        self.GoL.game_screen.update_cell_counts()  # Recount the cells of the loaded grid
+        self.show_rule()  # the loaded grid has its own rule
+        messagebox.showinfo("Load Grid", "The grid has been loaded successfully.")
+
+    def delete_grid(self):
+        """Delete the selected saved grid."""
+        selected = self.selected_grid()
+        if selected is None:
+            messagebox.showerror("Delete Grid", "Select a grid to delete.")
+            return
+        try:
+            self.GoL.grid_store.delete(selected[0])
+        except sqlite3.Error:
             messagebox.showerror("Delete Grid", "Failed to delete the grid.")
+            return
+        self.thumbnails.pop(selected, None)
+        self.list_saved_grids()
+        messagebox.showinfo("Delete Grid", "The grid has been deleted.")
+
+    def toggle_recording(self):
+        """Start recording the generations to a history file, or stop the current recording."""
+        game_screen = self.GoL.game_screen
+        if game_screen.history_file is not None:
+            game_screen.stop_recording()
+            self.record_button.config(text="Record To File")
+            return
+        path = filedialog.asksaveasfilename(title="Record History", defaultextension=".golh",
+                                            filetypes=[("Game of Life history", "*.golh")])
+        if not path:
+            return  # User cancelled the dialog
+        try:
+            game_screen.start_recording(path)
+        except OSError as error:
+            messagebox.showerror("Record History", f"Failed to create the history file: {error}")
+            return
+        self.record_button.config(text="Stop Recording")
 
     def back_to_game(self):
         """Return to the game screen."""
@@ -215,10 +338,13 @@ class SettingsScreen(Screen):
             rows = int(self.grid_size_adjuster_rows.get())
             cols = int(self.grid_size_adjuster_cols.get())
 
-            # Check if the input exceeds the maximum values
-            if rows > self.MAX_ROWS or cols > self.MAX_COLS:
+            # Check if the input exceeds the maximum values of the selected renderer
+            backend = self.GoL.grid_renderer.backend
+            max_size = MAX_SIZES[backend]
+            if rows > max_size or cols > max_size:
+                hint = " Select the bitmap renderer for larger grids." if backend != "bitmap" else ""
                 messagebox.showerror("Adjust Grid Size",
-                                     f"Grid size cannot exceed {self.MAX_ROWS}x{self.MAX_COLS}.")
+                                     f"Grid size cannot exceed {max_size}x{max_size} with the {backend} renderer.{hint}")
                 return
 
             # Resize the grid based on the user input
@@ -226,6 +352,7 @@ class SettingsScreen(Screen):
             # Update the cell size and render the grid
             self.GoL.grid_renderer.update_cell_size()
             self.GoL.grid_renderer.render_grid()
+            self.GoL.game_screen.update_cell_counts()  # Recount the cells of the resized grid
             # Add message to confirm the grid size has been adjusted
             messagebox.showinfo("Adjust Grid Size", f"Grid size has been adjusted to {rows}x{cols}.")
         except ValueError:
@@ -246,10 +373,65 @@ class SettingsScreen(Screen):
         # Update the grid renderer to reflect the new color scheme
         self.GoL.grid_renderer.render_grid()
 
+    def apply_engine(self, event):
+        """Apply the selected simulation engine.
+
+        Args:
+            event (tk.Event): The event object containing the selected engine.
+        """
+        self.GoL.game_screen.game_logic.engine = self.engine_var.get()
+
+    def apply_renderer(self, event):
+        """Apply the selected rendering backend.
+
+        Args:
+            event (tk.Event): The event object containing the selected backend.
+        """
+        backend = self.renderer_var.get()
+        grid_manager = self.GoL.grid_manager
+        if max(grid_manager.rows, grid_manager.cols) > MAX_SIZES[backend]:
+            messagebox.showerror("Renderer", f"The {backend} renderer draws grids up to "
+                                             f"{MAX_SIZES[backend]}x{MAX_SIZES[backend]}, make the grid smaller first.")
+            self.renderer_var.set(self.GoL.grid_renderer.backend)
+            return
+        self.GoL.grid_renderer.backend = backend
+        self.GoL.grid_renderer.render_grid()
+
+    def apply_preset_rule(self, event):
+        """Apply the selected preset rule.
+
+        Args:
+            event (tk.Event): The event object containing the selected rule.
+        """
+        self.rule_entry.delete(0, tk.END)
+        self.rule_entry.insert(0, PRESET_RULES[self.rule_var.get()])
+        self.apply_rule()
+
+    def apply_rule(self):
+        """Apply the rulestring typed in the rule entry."""
+        try:
+            self.GoL.game_screen.game_logic.set_rule(self.rule_entry.get())
+        except ValueError as error:
+            messagebox.showerror("Apply Rule", str(error))
+            return
+        self.show_rule()
+
+    def show_rule(self):
+        """Show the selected rule, normalized, in the rule entry and explained in the rules label"""
+        rule = self.GoL.game_screen.game_logic.rule
+        self.rule_entry.delete(0, tk.END)
+        self.rule_entry.insert(0, rule.rulestring)
+        self.rules_label.config(text=describe_rule(rule))
+
     def load_selected_pattern(self):
-        """Load the selected predefined pattern."""
+        """Load the selected predefined pattern or pattern of the library."""
         selected_pattern = self.predefined_patterns.get(tk.ACTIVE)
         if selected_pattern:
+            pattern = self.pattern_choices[self.predefined_patterns.index(tk.ACTIVE)]
+            if not isinstance(pattern, str):
+                self.load_pattern_file(pattern)
+                return
+
             # Get the current grid dimensions
             current_rows = self.GoL.grid_manager.rows
             current_cols = self.GoL.grid_manager.cols
@@ -266,9 +448,77 @@ class SettingsScreen(Screen):
 
             # Load the selected pattern into the grid manager
             self.GoL.grid_manager.load_pattern(selected_pattern)
+            self.GoL.game_screen.game_logic.invalidate()  # the pattern was drawn into the existing grid
             # Render the grid with the new pattern
             self.GoL.grid_renderer.render_grid()
+            self.GoL.game_screen.update_cell_counts()  # Recount the cells with the new pattern
             # Show a message to confirm the pattern has been loaded
             messagebox.showinfo("Load Pattern", f"{selected_pattern} pattern has been loaded.")
         else:
             messagebox.showwarning("Load Pattern", "Please select a pattern to load.")
+
+    def import_pattern(self):
+        """Load a pattern file chosen by the user."""
+        extensions = " ".join(f"*{extension}" for extension in FORMATS)
+        path = filedialog.askopenfilename(title="Import Pattern File",
+                                          filetypes=[("Pattern files", extensions), ("All files", "*.*")])
+        if not path:
+            return  # User cancelled the dialog
+        try:
+            pattern = read_header(path)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Import Pattern File", f"Failed to read the pattern file: {error}")
+            return
+        self.load_pattern_file(pattern)
+
+    def load_pattern_file(self, pattern):
+        """Load a pattern file, its cells are only parsed now.
+
+        A pattern that fits is drawn in the center of the grid, like a predefined pattern.
+        Larger patterns, and every macrocell file, replace the board on the unbounded plane
+        of the sparse or Hashlife engine, which the grid shows a window of.
+
+        Args:
+            pattern (Pattern): The index entry of the file.
+        """
+        game_screen = self.GoL.game_screen
+        game_logic = game_screen.game_logic
+        grid_manager = self.GoL.grid_manager
+        fits = pattern.format != "mc" and pattern.rows <= grid_manager.rows and pattern.cols <= grid_manager.cols
+        try:
+            # the whole pattern is parsed before the board is touched, so a broken file leaves it as it was
+            if pattern.format == "mc":
+                node = read_macrocell(pattern, game_logic.engines["hashlife"])
+            else:
+                cells = list(read_cells(pattern))
+            if pattern.rule is not None:
+                game_logic.set_rule(pattern.rule)
+                self.show_rule()
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Load Pattern", f"Failed to load {pattern.name}: {error}")
+            return
+
+        if fits:
+            grid_manager.place_cells(cells, pattern.rows, pattern.cols)
+            game_logic.invalidate()  # the pattern was drawn into the existing grid
+        else:
+            if pattern.format == "mc":
+                game_logic.load_plane(node=node)
+            else:
+                # the center of the pattern goes to the center of the plane, shown in the center of the grid
+                top = pattern.rows // 2
+                left = pattern.cols // 2
+                game_logic.load_plane(cells=[(row - top, col - left) for row, col in cells])
+            self.engine_var.set(game_logic.engine)  # the plane belongs to the sparse or Hashlife engine
+            # the board was replaced, it starts over from generation 0
+            game_screen.grid_history.clear()
+            game_screen.generation = 0
+            game_screen.generation_label.config(text=f"Generation: {game_screen.generation}")
+            game_screen.initial_grid = game_screen.capture_grid()
+
+        self.GoL.grid_renderer.render_grid()
+        game_screen.update_cell_counts()  # Recount the cells with the new pattern
+        # Show the rule of the pattern
+        self.rule_entry.delete(0, tk.END)
+        self.rule_entry.insert(0, game_logic.rule.rulestring)
+        messagebox.showinfo("Load Pattern", f"{pattern.name} pattern has been loaded.")
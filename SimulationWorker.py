@@ -0,0 +1,213 @@
+import queue
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+
+class Frame:
+    """A generation computed by the worker, ready to be drawn by the Tk main loop.
+
+    Attributes:
+        generation (int): The generation number.
+        cells (bytes): The 0/1 cells, row by row, copied so the worker can go on.
+        live_count (int): Number of live cells.
+        period (int): The period of the board if it repeats, otherwise None.
+        error (str): Why the worker stopped on this frame, or None. Dialogs are only
+            shown by the Tk main loop, so the worker reports its failures here.
+    """
+    __slots__ = ("generation", "cells", "live_count", "period", "error")
+
+    def __init__(self, generation, cells, live_count, period=None, error=None):
+        """Initialize the frame.
+
+        Args:
+            generation (int): The generation number.
+            cells (bytes): The 0/1 cells, row by row.
+            live_count (int): Number of live cells.
+            period (int): The period of the board if it repeats, otherwise None.
+            error (str): Why the worker stopped on this frame, or None.
+        """
+        self.generation = generation
+        self.cells = cells
+        self.live_count = live_count
+        self.period = period
+        self.error = error
+
+
+class SimulationWorker:
+    """Computes generations on a background thread and publishes frames for the Tk main loop.
+
+    The worker runs the generations the scheduler says are owed while holding ``lock``, then
+    publishes one frame into a bounded queue. The main loop takes the newest frame on each
+    tick; when it falls behind, the oldest frames are dropped instead of piling up. Code on
+    the main loop that reads or edits the simulation state holds the worker with ``hold``,
+    or hands an edit to ``submit`` to run it between two generations without waiting.
+
+    Attributes:
+        lock (threading.RLock): Held by the worker while it changes the simulation state.
+        frames (queue.Queue): The newest frames, oldest first.
+        scheduler (FrameScheduler): Paces the generations per second.
+    """
+    def __init__(self, step, capture, scheduler, max_frames=2):
+        """Initialize the worker, the thread is only started by ``start``.
+
+        Args:
+            step (callable): Computes one generation, returns False once the board repeats
+                and raises an exception if the generation cannot be computed.
+            capture (callable): Returns a Frame of the current state.
+            scheduler (FrameScheduler): Paces the generations per second.
+            max_frames (int): Number of frames kept for the main loop.
+        """
+        self.lock = threading.RLock()
+        self.frames = queue.Queue(max_frames)
+        self.scheduler = scheduler
+        self._step = step
+        self._capture = capture
+        self._commands = deque()  # edits handed over by the main loop
+        self._stop = threading.Event()
+        self._wake = threading.Event()  # cuts the wait for the next generation short
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """bool: True while the worker computes generations."""
+        return self._thread is not None and not self._stop.is_set()
+
+    def start(self):
+        """Start computing generations on a new thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self.scheduler.start()  # nothing is owed from before the start
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop computing generations, waits for the generation in progress to finish."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        with self.lock:
+            self._run_commands()  # edits submitted while the worker was stopping
+
+    def submit(self, command):
+        """Run an edit between two generations, or right away if the worker is stopped.
+
+        Args:
+            command (callable): The edit, called without arguments while holding the lock.
+        """
+        if not self.running:
+            with self.lock:
+                command()
+            return
+        self._commands.append(command)
+        self._wake.set()
+
+    @contextmanager
+    def hold(self):
+        """Pause the worker between two generations while the main loop uses the state.
+
+        The frames published so far are discarded, they are stale once the state is edited,
+        except the last frame of a worker that stopped itself, see ``discard``.
+        """
+        with self.lock:
+            self.discard()
+            yield
+
+    def discard(self, keep_final=True):
+        """Drop the published frames.
+
+        Args:
+            keep_final (bool): Keep the frames reporting an error or a period. The worker stops
+                after publishing such a frame, so it is the only way the main loop learns why
+                the simulation ended.
+        """
+        kept = []
+        while True:
+            try:
+                frame = self.frames.get_nowait()
+            except queue.Empty:
+                break
+            if keep_final and (frame.error is not None or frame.period is not None):
+                kept.append(frame)
+        for frame in kept:
+            self.frames.put_nowait(frame)
+
+    def latest(self) -> Frame:
+        """Takes every published frame and returns the newest one.
+
+        Returns:
+            Frame: The newest frame, or None if nothing was published since the last call.
+        """
+        frame = None
+        while True:
+            try:
+                frame = self.frames.get_nowait()
+            except queue.Empty:
+                return frame
+
+    def publish(self, frame):
+        """Adds a frame for the main loop, dropping the oldest one if the queue is full.
+
+        Args:
+            frame (Frame): The frame to publish.
+        """
+        while True:
+            try:
+                self.frames.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.frames.get_nowait()  # the main loop is behind, drop a stale frame
+                except queue.Empty:
+                    pass
+
+    def _run_commands(self) -> bool:
+        """Runs the submitted edits, the lock must be held.
+
+        Returns:
+            bool: True if any edit was run.
+        """
+        ran = False
+        while self._commands:
+            self._commands.popleft()()
+            ran = True
+        return ran
+
+    def _run(self):
+        """Compute generations until stopped, the body of the thread."""
+        scheduler = self.scheduler
+        while not self._stop.is_set():
+            self._wake.clear()
+            with self.lock:
+                edited = self._run_commands()
+                owed = scheduler.owed()
+                deadline = scheduler.deadline()
+                steps = 0
+                error = None
+                try:
+                    while steps < owed:
+                        repeats = not self._step()
+                        steps += 1
+                        if repeats:
+                            self._stop.set()  # nothing new will happen
+                            break
+                        if scheduler.now() >= deadline:
+                            break  # publish what is done, the rest is run after the frame
+                except ValueError as exception:
+                    error = str(exception)
+                    self._stop.set()
+                except Exception as exception:
+                    # any other failure, such as a full disk, must not end the thread silently
+                    error = f"{type(exception).__name__}: {exception}"
+                    self._stop.set()
+                scheduler.advanced(steps)
+                if steps or edited or error:
+                    frame = self._capture()
+                    frame.error = error
+                    self.publish(frame)
+            if not self._stop.is_set():
+                self._wake.wait(scheduler.delay() / 1000)
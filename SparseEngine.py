@@ -0,0 +1,119 @@
+from collections import Counter
+
+# (row_offset, col_offset) of the eight neighbors of a cell
+NEIGHBORS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class SparseEngine:
+    """Game of Life engine on an unbounded plane that stores only the live cells.
+
+    Each generation counts the neighbors of live cells only, so memory and time scale
+    with the population instead of the board area. The grid of the grid manager shows a
+    viewport into the plane, patterns that leave it keep evolving off screen.
+
+    Attributes:
+        game_logic (GameLogic): The game logic that owns this engine.
+        live (set): The (row, col) plane coordinates of the live cells.
+        top (int): The plane row shown in the first row of the grid.
+        left (int): The plane column shown in the first column of the grid.
+    """
+    available = True
+
+    def __init__(self, game_logic):
+        """Initialize the engine.
+
+        Args:
+            game_logic (GameLogic): The game logic that owns this engine.
+        """
+        self.game_logic = game_logic
+        self.live = set()
+        self.top = 0
+        self.left = 0
+        self._version = None  # the version of the grid produced by the last generation
+
+    def invalidate(self):
+        """Forget the plane so the next generation reloads it from the grid."""
+        self._version = None
+
+    def mark_changed(self, row, col):
+        """Copy a cell that was edited on the grid into the plane.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        grid_manager = self.game_logic.grid_manager
+        if grid_manager.version != self._version:
+            return  # the plane will be reloaded from the grid anyway
+        if grid_manager.get_cell(row, col) == 1:
+            self.live.add((row + self.top, col + self.left))
+        else:
+            self.live.discard((row + self.top, col + self.left))
+
+    def load(self, grid_manager):
+        """Replaces the plane with the live cells of a grid placed at the viewport.
+
+        Args:
+            grid_manager (GridManager): The grid manager holding the cells.
+        """
+        self.live = {(row + self.top, col + self.left) for row, col in grid_manager.live_cells()}
+
+    def load_cells(self, cells):
+        """Replaces the plane with live cells.
+
+        Args:
+            cells (iterable): The (row, col) plane coordinates of the live cells.
+        """
+        self.live = set(cells)
+
+    def step(self):
+        """Computes the next generation of the plane.
+
+        Raises:
+            ValueError: If the rule gives birth to cells without neighbors (B0).
+        """
+        rule = self.game_logic.rule
+        if 0 in rule.births:
+            raise ValueError(f"Rule {rule.rulestring} fills the unbounded plane, it needs a bounded board.")
+        live = self.live
+        # only cells next to a live cell can have live neighbors
+        counts = Counter((row + dr, col + dc) for row, col in live for dr, dc in NEIGHBORS)
+        new_live = {cell for cell, live_neighbors in counts.items()
+                    if live_neighbors in (rule.survivals if cell in live else rule.births)}
+        if 0 in rule.survivals:
+            # live cells without live neighbors were not counted
+            new_live.update(cell for cell in live if cell not in counts)
+        self.live = new_live
+
+    def sync(self):
+        """Reloads the plane from the grid if the grid was replaced since the last generation."""
+        grid_manager = self.game_logic.grid_manager
+        if grid_manager.version != self._version:
+            self.load(grid_manager)
+            self._version = grid_manager.version
+
+    def show(self):
+        """Writes the viewport of the plane to the grid of the grid manager."""
+        grid_manager = self.game_logic.grid_manager
+        rows, cols = grid_manager.rows, grid_manager.cols
+        cells = bytearray(rows * cols)
+        live_count = 0
+        for row, col in self.live:
+            row -= self.top
+            col -= self.left
+            if 0 <= row < rows and 0 <= col < cols:
+                cells[row * cols + col] = 1
+                live_count += 1
+        grid_manager.set_cells(cells, live_count)
+        self._version = grid_manager.version
+
+    def advance(self, generations=1):
+        """Advances the plane by a number of generations and shows it on the grid.
+
+        Args:
+            generations (int): Number of generations to advance.
+        """
+        self.sync()
+        for _ in range(generations):
+            self.step()
+        self.show()
@@ -0,0 +1,270 @@
+import atexit
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the workers fall back to a pure Python loop
+    np = None
+
+# the workers are started from the simulation thread of the Tk process, and forking a
+# process with other threads running can copy locks they hold and deadlock the child
+CONTEXT = multiprocessing.get_context("spawn")
+
+
+def step_band(src, dst, rows, cols, start, stop, wrap, table):
+    """Computes the next generation of the rows ``start`` to ``stop`` of a board.
+
+    The rows just above and below the band (the halos) are read straight from the
+    shared buffer of the current generation, which is where the neighboring bands
+    publish them.
+
+    Args:
+        src (memoryview): The current generation, one byte per cell.
+        dst (memoryview): The buffer to write the next generation to.
+        rows (int): Number of rows of the board.
+        cols (int): Number of columns of the board.
+        start (int): The first row of the band.
+        stop (int): The row after the last row of the band.
+        wrap (bool): Whether to wrap around the edges of the board.
+        table (list): The rule table, indexed by ``state * 9 + live_neighbors``.
+    """
+    if np is not None:
+        board = np.ndarray((rows, cols), dtype=np.uint8, buffer=src)
+        if wrap:
+            extended = board.take(range(start - 1, stop + 1), axis=0, mode="wrap")
+        else:
+            # rows outside of the board are dead
+            extended = np.zeros((stop - start + 2, cols), dtype=np.uint8)
+            first = max(start - 1, 0)
+            last = min(stop + 1, rows)
+            extended[first - (start - 1):last - (start - 1)] = board[first:last]
+        center = extended[1:-1]
+        vertical = extended[:-2] + center + extended[2:]
+        if wrap:
+            counts = vertical + np.roll(vertical, 1, axis=1) + np.roll(vertical, -1, axis=1) - center
+        else:
+            padded = np.zeros((stop - start, cols + 2), dtype=np.uint8)
+            padded[:, 1:-1] = vertical
+            counts = padded[:, :-2] + vertical + padded[:, 2:] - center
+        new = np.array(table, dtype=np.uint8)[center * 9 + counts]
+        np.ndarray((rows, cols), dtype=np.uint8, buffer=dst)[start:stop] = new
+        return
+
+    dead_row = bytes(cols)
+    for row in range(start, stop):
+        if wrap:
+            above = src[((row - 1) % rows) * cols:((row - 1) % rows + 1) * cols]
+            below = src[((row + 1) % rows) * cols:((row + 1) % rows + 1) * cols]
+        else:
+            above = src[(row - 1) * cols:row * cols] if row > 0 else dead_row
+            below = src[(row + 1) * cols:(row + 2) * cols] if row < rows - 1 else dead_row
+        current = src[row * cols:(row + 1) * cols]
+        # live cells in each column of the 3-row window
+        column_sums = [above[col] + current[col] + below[col] for col in range(cols)]
+        offset = row * cols
+        for col in range(cols):
+            if wrap:
+                live_neighbors = column_sums[col - 1] + column_sums[col] + column_sums[(col + 1) % cols]
+            else:
+                live_neighbors = column_sums[col]
+                if col > 0:
+                    live_neighbors += column_sums[col - 1]
+                if col < cols - 1:
+                    live_neighbors += column_sums[col + 1]
+            live_neighbors -= current[col]
+            dst[offset + col] = table[current[col] * 9 + live_neighbors]
+
+
+def band_worker(buffer_names, rows, cols, start, stop, connection):
+    """Runs in a worker process and steps one band of the board on request.
+
+    For every generation the engine sends which buffer holds the current generation, the
+    worker reads it and writes the other one, then replies. The engine only sends the next
+    generation once every band replied, so the halos are always complete.
+
+    Args:
+        buffer_names (tuple): Names of the two shared memory buffers.
+        rows (int): Number of rows of the board.
+        cols (int): Number of columns of the board.
+        start (int): The first row of the band.
+        stop (int): The row after the last row of the band.
+        connection (multiprocessing.connection.Connection): Receives (current buffer, wrap flag,
+            rule table) for each generation, or None to exit, and sends back None when the
+            band is done or the error that stopped it.
+    """
+    buffers = [shared_memory.SharedMemory(name=name) for name in buffer_names]
+    try:
+        while True:
+            command = connection.recv()  # wait for the next generation
+            if command is None:
+                break
+            current, wrap, table = command
+            try:
+                step_band(buffers[current].buf, buffers[1 - current].buf, rows, cols, start, stop, wrap, table)
+            except Exception as error:
+                connection.send(f"{type(error).__name__}: {error}")
+            else:
+                connection.send(None)
+    except (EOFError, OSError):
+        pass  # the engine closed the connection
+    finally:
+        for buffer in buffers:
+            buffer.close()
+
+
+class TiledEngine:
+    """Game of Life engine that steps horizontal bands of the grid in parallel processes.
+
+    The board lives in two shared memory buffers (the current and the next generation),
+    so the grid is never pickled between processes. Each worker owns one band of rows and
+    reads the edge rows of its neighbors from the shared buffer as its halo.
+
+    The engine waits for the workers on their pipes and process sentinels with a timeout,
+    so a worker that fails, is killed or hangs stops the workers and the game logic falls
+    back to the NumPy engine (the bit-packed engine without NumPy) instead of blocking the
+    caller forever.
+
+    Attributes:
+        game_logic (GameLogic): The game logic that owns this engine.
+        workers (int): Number of worker processes.
+        timeout (float): Longest wait, in seconds, for the workers to finish a generation.
+    """
+    available = True
+
+    def __init__(self, game_logic, workers=None, timeout=30):
+        """Initialize the engine.
+
+        Args:
+            game_logic (GameLogic): The game logic that owns this engine.
+            workers (int): Number of worker processes, defaults to the number of CPUs.
+            timeout (float): Longest wait, in seconds, for the workers to finish a generation.
+        """
+        self.game_logic = game_logic
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._processes = []
+        self._connections = []  # the engine end of the pipe of every worker
+        self._buffers = []
+        self._current = 0  # the buffer holding the current generation
+        self._shape = None  # (rows, cols, workers) the pool was started for
+
+    def start(self, rows, cols):
+        """Starts the worker processes for a board size.
+
+        Args:
+            rows (int): Number of rows of the board.
+            cols (int): Number of columns of the board.
+        """
+        self.close()
+        workers = min(self.workers, rows)
+        self._buffers = [shared_memory.SharedMemory(create=True, size=rows * cols) for _ in range(2)]
+        names = tuple(buffer.name for buffer in self._buffers)
+        for n in range(workers):
+            # split the rows as evenly as possible between the workers
+            start = rows * n // workers
+            stop = rows * (n + 1) // workers
+            connection, worker_connection = CONTEXT.Pipe()
+            process = CONTEXT.Process(target=band_worker, daemon=True,
+                                              args=(names, rows, cols, start, stop, worker_connection))
+            process.start()
+            worker_connection.close()  # only the worker uses its end
+            self._processes.append(process)
+            self._connections.append(connection)
+        self._shape = (rows, cols, self.workers)
+        atexit.register(self.close)
+
+    def close(self):
+        """Stops the worker processes and releases the shared memory."""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass  # the worker is gone already
+            connection.close()
+        for process in self._processes:
+            process.join(self.timeout)
+            if process.is_alive():
+                process.kill()  # stuck in a generation
+                process.join()
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
+        self._processes = []
+        self._connections = []
+        self._buffers = []
+        self._shape = None
+        atexit.unregister(self.close)
+
+    def advance(self, generations=1):
+        """Advances the grid of the game logic by a number of generations.
+
+        Args:
+            generations (int): Number of generations to advance.
+
+        Raises:
+            ValueError: If the workers failed; the grid is left as it was and the fallback engine is selected.
+        """
+        grid_manager = self.game_logic.grid_manager
+        rows, cols = grid_manager.rows, grid_manager.cols
+        if rows == 0 or cols == 0:
+            return
+        if self._shape != (rows, cols, self.workers) or not all(process.is_alive() for process in self._processes):
+            self.start(rows, cols)  # a worker that died since the last call is replaced
+
+        self._buffers[self._current].buf[:rows * cols] = grid_manager.cells
+
+        wrap = self.game_logic.wrap
+        table = self.game_logic.rule.table
+        for _ in range(generations):
+            for connection in self._connections:
+                try:
+                    connection.send((self._current, wrap, table))
+                except OSError:
+                    self.fail("a worker process stopped")
+            self.wait_workers()  # one generation done by every band
+            self._current = 1 - self._current
+
+        grid_manager.set_cells(bytearray(self._buffers[self._current].buf[:rows * cols]))
+
+    def wait_workers(self):
+        """Waits until every worker replied for the current generation.
+
+        Raises:
+            ValueError: If a worker failed, died or did not reply within ``timeout`` seconds.
+        """
+        pending = dict(zip(self._connections, self._processes))
+        deadline = time.monotonic() + self.timeout
+        while pending:
+            sentinels = [process.sentinel for process in pending.values()]
+            ready = wait(list(pending) + sentinels, max(0.0, deadline - time.monotonic()))
+            if not ready:
+                self.fail(f"the workers did not finish a generation within {self.timeout} seconds")
+            for connection in [ready_object for ready_object in ready if ready_object in pending]:
+                try:
+                    error = connection.recv()
+                except (EOFError, OSError):
+                    error = "a worker process stopped"
+                if error is not None:
+                    self.fail(error)
+                del pending[connection]
+            # a sentinel is ready when its process exited, and a process still pending never replied
+            if any(process.sentinel in ready for process in pending.values()):
+                self.fail("a worker process stopped")
+
+    def fail(self, reason):
+        """Stops the workers after a failed generation and selects the fallback engine.
+
+        Args:
+            reason (str): Why the generation failed.
+
+        Raises:
+            ValueError: Always, to report the failure.
+        """
+        self.close()
+        fallback = "numpy" if "numpy" in self.game_logic.engines else "bitpacked"
+        self.game_logic.engine = fallback
+        raise ValueError(f"The tiled engine failed: {reason}. Switched to the {fallback} engine.")
@@ -0,0 +1,47 @@
+import argparse
+import os
+import random
+import time
+from GridManager import GridManager
+from GameLogic import GameLogic
+from TiledEngine import TiledEngine
+
+
+def benchmark(size, generations, max_workers, wrap):
+    """Times the tiled engine on a random board with 1 to max_workers workers.
+
+    Args:
+        size (int): Number of rows and columns of the board.
+        generations (int): Number of generations to advance per run.
+        max_workers (int): The largest number of workers to try.
+        wrap (bool): Whether to wrap around the edges of the board.
+    """
+    random.seed(0)
+    initial_grid = [[random.randint(0, 1) for _ in range(size)] for _ in range(size)]
+    grid_manager = GridManager(size, size)
+    game_logic = GameLogic(grid_manager)
+    game_logic.wrap = wrap
+
+    print(f"{size}x{size} board, {generations} generations, wrap={wrap}")
+    print(f"{'workers':>8} {'seconds':>10} {'gen/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        grid_manager.grid = [row[:] for row in initial_grid]
+        engine = TiledEngine(game_logic, workers)
+        engine.advance(1)  # start the workers before timing
+        start = time.perf_counter()
+        engine.advance(generations)
+        elapsed = time.perf_counter() - start
+        engine.close()
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {generations / elapsed:>10.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scaling benchmark of the tiled engine across worker counts.")
+    parser.add_argument("--size", type=int, default=1000, help="number of rows and columns of the board")
+    parser.add_argument("--generations", type=int, default=20, help="generations to advance per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="largest number of workers")
+    parser.add_argument("--wrap", action="store_true", help="wrap around the edges of the board")
+    args = parser.parse_args()
+    benchmark(args.size, args.generations, args.workers, args.wrap)
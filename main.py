@@ -1,7 +1,9 @@
+import multiprocessing
 from AppManager import AppManager
 
 
 # Run the game!!!
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # lets the packaged app start the tiled engine workers
     GoL = AppManager()
     GoL.run()
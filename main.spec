@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('GoL.ico', '.'), ('home-screen.jpg', '.'), ('saved_grids.json', '.')],
+    datas=[('GoL.ico', '.'), ('home-screen.jpg', '.'), ('saved_grids.json', '.'), ('patterns', 'patterns')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},